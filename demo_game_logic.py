@@ -9,6 +9,16 @@ from simulation.game import (
 from simulation.engine.core import SimulationConfig
 
 
+# Policies exercised by the policy manager demo
+_POLICIES_DEMO = (
+    PolicyType.BASE_STOCK,
+    PolicyType.EOQ,
+    PolicyType.SS_POLICY,
+    PolicyType.FORECAST_BASED
+)
+_POLICY_COUNT = len(PolicyType)
+
+
 def demo_game_controller():
     """Demonstrate the game controller functionality."""
     print("=" * 60)
@@ -76,14 +86,7 @@ def demo_policy_manager():
     policy_manager = PolicyManager()
     
     # Test different policies
-    policies = [
-        PolicyType.BASE_STOCK,
-        PolicyType.EOQ,
-        PolicyType.SS_POLICY,
-        PolicyType.FORECAST_BASED
-    ]
-    
-    for policy_type in policies:
+    for policy_type in _POLICIES_DEMO:
         print(f"\n{policy_type.value.upper()} Policy:")
         
         # Get policy info
@@ -335,7 +338,7 @@ def main():
     # Summary statistics
     print("\nSummary:")
     print(f"  Game Controller: Created game with {len(game_controller.state.players)} players")
-    print(f"  Policy Manager: Demonstrated {len(PolicyType)} policy types")
+    print(f"  Policy Manager: Demonstrated {_POLICY_COUNT} policy types")
     print(f"  Scenario Manager: {len(scenario_manager.scenarios)} predefined scenarios")
     print(f"  Integrated Game: Completed {integrated_game.state.current_week} weeks")
 
@@ -1,15 +1,21 @@
 """Demo script to showcase the simulation engine."""
 
 import json
+import logging
+import os
+import sys
 from simulation.engine import SimulationEnvironment
 from simulation.engine.core import SimulationConfig
 
 
+logger = logging.getLogger("sim.demo")
+
+
 def run_basic_simulation():
     """Run a basic simulation with default settings."""
-    print("=" * 60)
-    print("Running Basic Beer Distribution Game Simulation")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("Running Basic Beer Distribution Game Simulation")
+    logger.info("=" * 60)
     
     # Create default configuration
     config = SimulationConfig(
@@ -27,34 +33,34 @@ def run_basic_simulation():
     
     # Display summary
     summary = results['summary']
-    print(f"\nSimulation ID: {summary['simulation_id']}")
-    print(f"Total Weeks: {summary['total_weeks']}")
-    print(f"\nCosts:")
-    print(f"  Total Cost: ${summary['total_cost']:.2f}")
-    print(f"  Holding Cost: ${summary['total_holding_cost']:.2f}")
-    print(f"  Backlog Cost: ${summary['total_backlog_cost']:.2f}")
-    print(f"  Average Cost/Week: ${summary['average_cost_per_week']:.2f}")
-    print(f"\nPerformance:")
-    print(f"  Fill Rate: {summary['fill_rate']:.2%}")
-    print(f"  Stockout Weeks: {summary['stockout_weeks']}")
-    print(f"  Bullwhip Ratio: {summary['bullwhip_ratio']:.2f}")
+    logger.info("\nSimulation ID: %s", summary['simulation_id'])
+    logger.info("Total Weeks: %s", summary['total_weeks'])
+    logger.info("\nCosts:")
+    logger.info("  Total Cost: $%.2f", summary['total_cost'])
+    logger.info("  Holding Cost: $%.2f", summary['total_holding_cost'])
+    logger.info("  Backlog Cost: $%.2f", summary['total_backlog_cost'])
+    logger.info("  Average Cost/Week: $%.2f", summary['average_cost_per_week'])
+    logger.info("\nPerformance:")
+    logger.info("  Fill Rate: %.2f%%", summary['fill_rate'] * 100)
+    logger.info("  Stockout Weeks: %s", summary['stockout_weeks'])
+    logger.info("  Bullwhip Ratio: %.2f", summary['bullwhip_ratio'])
     
     # Display node summaries
-    print("\nNode Summaries:")
+    logger.info("\nNode Summaries:")
     for node_name, node_summary in results['node_summaries'].items():
-        print(f"\n  {node_name}:")
-        print(f"    Avg Inventory: {node_summary['average_inventory']:.1f}")
-        print(f"    Avg Backlog: {node_summary['average_backlog']:.1f}")
-        print(f"    Total Cost: ${node_summary['total_cost']:.2f}")
+        logger.info("\n  %s:", node_name)
+        logger.info("    Avg Inventory: %.1f", node_summary['average_inventory'])
+        logger.info("    Avg Backlog: %.1f", node_summary['average_backlog'])
+        logger.info("    Total Cost: $%.2f", node_summary['total_cost'])
     
     return results
 
 
 def run_step_demand_simulation():
     """Run a simulation with step change in demand."""
-    print("\n" + "=" * 60)
-    print("Running Step Demand Simulation")
-    print("=" * 60)
+    logger.info("\n" + "=" * 60)
+    logger.info("Running Step Demand Simulation")
+    logger.info("=" * 60)
     
     # Create configuration with step demand
     config = SimulationConfig(
@@ -74,7 +80,7 @@ def run_step_demand_simulation():
     # Add callback to show progress
     def on_week_complete(state):
         if state['current_week'] % 10 == 0:
-            print(f"  Week {state['current_week']}: Total cost so far = ${state['metrics']['total_cost']:.2f}")
+            logger.info("  Week %d: Total cost so far = $%.2f", state['current_week'], state['metrics']['total_cost'])
     
     sim.on_week_complete = on_week_complete
     
@@ -82,18 +88,18 @@ def run_step_demand_simulation():
     
     # Display results
     summary = results['summary']
-    print(f"\nFinal Results:")
-    print(f"  Total Cost: ${summary['total_cost']:.2f}")
-    print(f"  Bullwhip Ratio: {summary['bullwhip_ratio']:.2f}")
+    logger.info("\nFinal Results:")
+    logger.info("  Total Cost: $%.2f", summary['total_cost'])
+    logger.info("  Bullwhip Ratio: %.2f", summary['bullwhip_ratio'])
     
     return results
 
 
 def run_random_demand_simulation():
     """Run a simulation with random demand variation."""
-    print("\n" + "=" * 60)
-    print("Running Random Demand Simulation")
-    print("=" * 60)
+    logger.info("\n" + "=" * 60)
+    logger.info("Running Random Demand Simulation")
+    logger.info("=" * 60)
     
     # Create configuration with random demand
     config = SimulationConfig(
@@ -112,19 +118,19 @@ def run_random_demand_simulation():
     
     # Display results
     summary = results['summary']
-    print(f"\nResults with Random Demand:")
-    print(f"  Total Cost: ${summary['total_cost']:.2f}")
-    print(f"  Fill Rate: {summary['fill_rate']:.2%}")
-    print(f"  Bullwhip Ratio: {summary['bullwhip_ratio']:.2f}")
+    logger.info("\nResults with Random Demand:")
+    logger.info("  Total Cost: $%.2f", summary['total_cost'])
+    logger.info("  Fill Rate: %.2f%%", summary['fill_rate'] * 100)
+    logger.info("  Bullwhip Ratio: %.2f", summary['bullwhip_ratio'])
     
     return results
 
 
 def compare_scenarios():
     """Compare different scenarios."""
-    print("\n" + "=" * 60)
-    print("Comparing Different Scenarios")
-    print("=" * 60)
+    logger.info("\n" + "=" * 60)
+    logger.info("Comparing Different Scenarios")
+    logger.info("=" * 60)
     
     scenarios = [
         ("Constant Demand", {"demand_type": "constant", "demand_params": {"base_demand": 4}}),
@@ -134,10 +140,14 @@ def compare_scenarios():
     
     results_comparison = []
     
-    for scenario_name, scenario_params in scenarios:
-        config = SimulationConfig(weeks=52, **scenario_params)
-        sim = SimulationEnvironment(config)
-        results = sim.run()
+    # Run all scenarios together, spread over the available cores
+    configs = [SimulationConfig(weeks=52, **scenario_params) for _, scenario_params in scenarios]
+    batch_results = SimulationEnvironment.run_batched(
+        configs,
+        max_workers=min(len(scenarios), os.cpu_count() or 1)
+    )
+    
+    for (scenario_name, _), results in zip(scenarios, batch_results):
         summary = results['summary']
         
         results_comparison.append({
@@ -148,18 +158,25 @@ def compare_scenarios():
         })
     
     # Display comparison table
-    print("\nScenario Comparison:")
-    print(f"{'Scenario':<20} {'Total Cost':>12} {'Fill Rate':>12} {'Bullwhip':>12}")
-    print("-" * 60)
+    logger.info("\nScenario Comparison:")
+    logger.info("%-20s %12s %12s %12s", 'Scenario', 'Total Cost', 'Fill Rate', 'Bullwhip')
+    logger.info("-" * 60)
     for result in results_comparison:
-        print(f"{result['scenario']:<20} ${result['total_cost']:>11.2f} {result['fill_rate']:>11.2%} {result['bullwhip_ratio']:>11.2f}")
+        logger.info("%-20s $%11.2f %10.2f%% %11.2f", result['scenario'], result['total_cost'], result['fill_rate'] * 100, result['bullwhip_ratio'])
 
 
 def main():
     """Main demo function."""
-    print("\n" + "=" * 60)
-    print("     BEER DISTRIBUTION GAME SIMULATION ENGINE DEMO")
-    print("=" * 60)
+    # LOG_LEVEL=WARNING silences the demo output, including per-week progress
+    logging.basicConfig(
+        level=os.environ.get("LOG_LEVEL", "INFO"),
+        format="%(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    
+    logger.info("\n" + "=" * 60)
+    logger.info("     BEER DISTRIBUTION GAME SIMULATION ENGINE DEMO")
+    logger.info("=" * 60)
     
     # Run different simulation scenarios
     basic_results = run_basic_simulation()
@@ -170,9 +187,9 @@ def main():
     compare_scenarios()
     
     # Save results to file
-    print("\n" + "=" * 60)
-    print("Saving Results")
-    print("=" * 60)
+    logger.info("\n" + "=" * 60)
+    logger.info("Saving Results")
+    logger.info("=" * 60)
     
     with open('simulation_results.json', 'w') as f:
         json.dump({
@@ -181,8 +198,8 @@ def main():
             'random_demand': random_results['summary']
         }, f, indent=2)
     
-    print("\nResults saved to simulation_results.json")
-    print("\nDemo completed successfully!")
+    logger.info("\nResults saved to simulation_results.json")
+    logger.info("\nDemo completed successfully!")
 
 
 if __name__ == "__main__":
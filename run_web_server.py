@@ -8,8 +8,6 @@ import os
 # Add the project root to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from simulation.web.app import app
-
 
 def main():
     """Run the web server."""
@@ -23,9 +21,9 @@ def main():
     print("Press Ctrl+C to stop the server")
     print("=" * 60)
     
-    # Run the server
+    # Run the server; the app is imported by uvicorn once it starts
     uvicorn.run(
-        app,
+        "simulation.web.app:app",
         host="0.0.0.0",
         port=8000,
         log_level="info"
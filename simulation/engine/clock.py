@@ -0,0 +1,37 @@
+"""Fixed-step clock for running the supply chain without SimPy."""
+
+from typing import Callable, Optional
+
+
+class WeekClock:
+    """
+    Integer week clock with the parts of simpy.Environment the simulation uses.
+
+    Every node acts exactly once per week, so the week loop can be run
+    directly instead of through SimPy's event queue. The clock exposes
+    now and run(until=...) so callers that step the environment keep
+    working.
+    """
+
+    def __init__(self, step: Optional[Callable[[int], None]] = None, initial_time: int = 0):
+        """
+        Initialize the clock.
+
+        Args:
+            step: Function called with each week as the clock passes it
+            initial_time: Week the clock starts at
+        """
+        self.now = initial_time
+        self._step = step
+
+    def run(self, until: int):
+        """
+        Run every week before the given week.
+
+        Args:
+            until: Week to stop at; it is not itself run
+        """
+        while self.now < until:
+            if self._step is not None:
+                self._step(self.now)
+            self.now += 1
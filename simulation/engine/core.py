@@ -1,13 +1,25 @@
 """Core simulation environment management."""
 
+import os
+import itertools
 import simpy
 import uuid
-from typing import Dict, Any, Optional, List, Callable
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from typing import Dict, Any, Optional, List, Callable, Tuple
+from collections.abc import Mapping
 from enum import Enum
 from dataclasses import dataclass
 
-from .entities import Retailer, Wholesaler, Distributor, Factory
+from .entities import Retailer, Wholesaler, Distributor, Factory, Order, Shipment
 from .metrics import MetricsCollector
+from .clock import WeekClock
+from . import kernels
+
+
+# Sequence numbers for simulation ids within this process
+_SIM_COUNTER = itertools.count()
 
 
 class SimulationStatus(Enum):
@@ -41,8 +53,9 @@ class SimulationConfig:
     production_capacity: int = 100
     
     # Demand pattern
-    demand_type: str = "constant"  # constant, step, random, seasonal
+    demand_type: str = "constant"  # constant, step, random, seasonal, growth
     demand_params: Dict[str, Any] = None
+    seed: Optional[int] = None  # Seed for random demand
     
     # Order policies
     retailer_policy: str = "default"
@@ -50,11 +63,91 @@ class SimulationConfig:
     distributor_policy: str = "default"
     factory_policy: str = "default"
     
+    # Step weeks through SimPy processes instead of a plain week loop
+    use_simpy: bool = False
+    
+    # Weeks between on_week_complete callbacks
+    report_every: int = 1
+    
+    # Identify the simulation by a random UUID instead of a process counter
+    use_uuid: bool = False
+    
+    # Keep weekly node histories; when False only cost totals are kept,
+    # for sweeps that only need the final costs
+    record_history: bool = True
+    
     def __post_init__(self):
         if self.demand_params is None:
             self.demand_params = {"base_demand": 4}
 
 
+def _build_demand(
+    config: SimulationConfig,
+    weeks: int,
+    rng: np.random.Generator,
+    start: int = 0
+) -> np.ndarray:
+    """
+    Generate the customer demand series for a configuration.
+    
+    Args:
+        config: Simulation configuration
+        weeks: Week to generate demand up to (exclusive)
+        rng: Random generator used for random demand
+        start: First week to generate demand for
+        
+    Returns:
+        Array of demand for weeks start to weeks - 1
+    """
+    demand_type = config.demand_type
+    params = config.demand_params
+    week = np.arange(start, weeks)
+    
+    if demand_type == "constant":
+        return np.full(len(week), params.get("base_demand", 4))
+    
+    elif demand_type == "step":
+        step_week = params.get("step_week", 5)
+        base_demand = params.get("base_demand", 4)
+        step_demand = params.get("step_demand", 8)
+        return np.where(week >= step_week, step_demand, base_demand)
+    
+    elif demand_type == "random":
+        base_demand = params.get("base_demand", 4)
+        variation = params.get("variation", 2)
+        noise = rng.integers(-variation, variation, size=len(week), endpoint=True)
+        return np.maximum(0, base_demand + noise)
+    
+    elif demand_type == "seasonal":
+        base_demand = params.get("base_demand", 4)
+        amplitude = params.get("amplitude", 2)
+        period = params.get("period", 52)
+        # Computed once for all weeks. The angle is kept as written: a
+        # hoisted form such as week * (2 * pi / period) rounds differently
+        # and changes the truncated demand in some weeks
+        return (base_demand + amplitude * np.sin(2 * np.pi * week / period)).astype(np.int64)
+    
+    elif demand_type == "growth":
+        initial_demand = params.get("initial_demand", 3)
+        growth_rate = params.get("growth_rate", 0.02)
+        max_demand = params.get("max_demand", 12)
+        # Compound growth, truncated and capped like int() and min() per week
+        return np.minimum(max_demand, (initial_demand * (1 + growth_rate) ** week).astype(np.int64))
+    
+    # Default to constant demand
+    return np.full(len(week), 4)
+
+
+def _run_batched_in_worker(configs: List['SimulationConfig']) -> List[Dict[str, Any]]:
+    """Run a share of a batch in a worker process and return picklable results."""
+    results = SimulationEnvironment.run_batched(configs)
+    for result in results:
+        result["node_summaries"] = {
+            name: dict(summary) for name, summary in result["node_summaries"].items()
+        }
+    return results
+
+
 class SimulationEnvironment:
     """Main simulation environment manager."""
     
@@ -66,8 +159,11 @@ class SimulationEnvironment:
             config: Simulation configuration
         """
         self.config = config or SimulationConfig()
-        self.simulation_id = str(uuid.uuid4())
-        self.env = simpy.Environment()
+        self.simulation_id = (
+            str(uuid.uuid4()) if self.config.use_uuid
+            else f"sim-{os.getpid()}-{next(_SIM_COUNTER)}"
+        )
+        self.env = self._create_environment()
         self.status = SimulationStatus.READY
         
         # Supply chain nodes
@@ -84,13 +180,24 @@ class SimulationEnvironment:
         self.on_week_complete: Optional[Callable] = None
         self.on_simulation_complete: Optional[Callable] = None
         
+        # Customer demand, generated up front for the configured weeks
+        self.rng = np.random.default_rng(self.config.seed)
+        self.demand = _build_demand(self.config, self.config.weeks, self.rng)
+        self._demand_values: List[Any] = self.demand.tolist()
+        self._constant_demand = (
+            np.asarray(self.config.demand_params.get("base_demand", 4)).item()
+            if self.config.demand_type == "constant" else None
+        )
+        
         # Initialize the supply chain
         self._initialize_supply_chain()
     
     def _initialize_supply_chain(self):
         """Initialize the supply chain nodes and connections."""
         
-        # Create nodes
+        # Create nodes; the demand pattern is kept so the array kernel can
+        # tell whether it has been replaced
+        self._demand_pattern = self._create_demand_pattern()
         self.retailer = Retailer(
             env=self.env,
             name="Retailer",
@@ -100,7 +207,10 @@ class SimulationEnvironment:
             backlog_cost_per_unit=self.config.backlog_cost_per_unit,
             order_delay=self.config.order_delay,
             shipment_delay=self.config.shipment_delay,
-            demand_pattern=self._create_demand_pattern()
+            demand_pattern=self._demand_pattern,
+            weeks=self.config.weeks,
+            start_process=False,
+            record_history=self.config.record_history
         )
         
         self.wholesaler = Wholesaler(
@@ -111,7 +221,10 @@ class SimulationEnvironment:
             holding_cost_per_unit=self.config.holding_cost_per_unit,
             backlog_cost_per_unit=self.config.backlog_cost_per_unit,
             order_delay=self.config.order_delay,
-            shipment_delay=self.config.shipment_delay
+            shipment_delay=self.config.shipment_delay,
+            weeks=self.config.weeks,
+            start_process=False,
+            record_history=self.config.record_history
         )
         
         self.distributor = Distributor(
@@ -122,7 +235,10 @@ class SimulationEnvironment:
             holding_cost_per_unit=self.config.holding_cost_per_unit,
             backlog_cost_per_unit=self.config.backlog_cost_per_unit,
             order_delay=self.config.order_delay,
-            shipment_delay=self.config.shipment_delay
+            shipment_delay=self.config.shipment_delay,
+            weeks=self.config.weeks,
+            start_process=False,
+            record_history=self.config.record_history
         )
         
         self.factory = Factory(
@@ -133,7 +249,10 @@ class SimulationEnvironment:
             holding_cost_per_unit=self.config.holding_cost_per_unit,
             backlog_cost_per_unit=self.config.backlog_cost_per_unit,
             production_capacity=self.config.production_capacity,
-            production_delay=self.config.production_delay
+            production_delay=self.config.production_delay,
+            weeks=self.config.weeks,
+            start_process=False,
+            record_history=self.config.record_history
         )
         
         # Connect nodes in the supply chain
@@ -147,50 +266,85 @@ class SimulationEnvironment:
         # Register nodes with metrics collector
         for node in self.nodes:
             self.metrics_collector.register_node(node)
+        
+        # A single process steps every node, downstream to upstream
+        if self.config.use_simpy:
+            self.env.process(self._step_nodes())
     
-    def _create_demand_pattern(self) -> Callable:
+    def _create_environment(self, initial_time: int = 0):
         """
-        Create a demand pattern function based on configuration.
+        Create the clock that drives the simulation.
         
+        Args:
+            initial_time: Week the clock starts at
+            
         Returns:
-            Function that generates demand for a given week
+            A simpy.Environment if the config asks for SimPy, otherwise a
+            WeekClock that ticks the nodes directly
+        """
+        if self.config.use_simpy:
+            return simpy.Environment(initial_time=initial_time)
+        return WeekClock(step=self._tick_nodes, initial_time=initial_time)
+    
+    def _tick_nodes(self, current_week: int):
+        """Advance all nodes by one week, downstream to upstream."""
+        for node in self.nodes:
+            node.tick(current_week)
+    
+    def _step_nodes(self):
+        """SimPy process advancing all nodes by one week per time step."""
+        ticks = [node.tick for node in self.nodes]
+        week = int(self.env.now)
+        while True:
+            for tick in ticks:
+                tick(week)
+            yield self.env.timeout(1)
+            week += 1
+    
+    def _create_demand_pattern(self) -> Callable:
         """
-        demand_type = self.config.demand_type
-        params = self.config.demand_params
+        Create a demand pattern function backed by the demand series.
         
-        if demand_type == "constant":
-            def demand_pattern(week: int) -> int:
-                return params.get("base_demand", 4)
-            
-        elif demand_type == "step":
-            def demand_pattern(week: int) -> int:
-                step_week = params.get("step_week", 5)
-                base_demand = params.get("base_demand", 4)
-                step_demand = params.get("step_demand", 8)
-                return step_demand if week >= step_week else base_demand
-            
-        elif demand_type == "random":
-            import random
-            def demand_pattern(week: int) -> int:
-                base_demand = params.get("base_demand", 4)
-                variation = params.get("variation", 2)
-                return max(0, base_demand + random.randint(-variation, variation))
-            
-        elif demand_type == "seasonal":
-            import math
-            def demand_pattern(week: int) -> int:
-                base_demand = params.get("base_demand", 4)
-                amplitude = params.get("amplitude", 2)
-                period = params.get("period", 52)
-                return int(base_demand + amplitude * math.sin(2 * math.pi * week / period))
+        Constant demand skips the series lookup altogether.
+        
+        Returns:
+            Function that returns the demand for a given week
+        """
+        constant_demand = self._constant_demand
+        if constant_demand is not None:
+            def constant_pattern(week: int) -> int:
+                return constant_demand
             
-        else:
-            # Default to constant demand
-            def demand_pattern(week: int) -> int:
-                return 4
+            return constant_pattern
+        
+        # Weekly reads index a plain list of Python numbers, so no array
+        # scalar is created per lookup
+        def demand_pattern(week: int) -> int:
+            values = self._demand_values
+            if week >= len(values):
+                self._demand_until(week + 1)
+                values = self._demand_values
+            return values[week]
         
         return demand_pattern
     
+    def _demand_until(self, weeks: int) -> np.ndarray:
+        """
+        Get the demand series, extending it if it covers fewer weeks.
+        
+        Args:
+            weeks: Number of weeks the series must cover
+            
+        Returns:
+            Demand series of at least the given length
+        """
+        if weeks > len(self.demand):
+            extra = _build_demand(self.config, weeks, self.rng, start=len(self.demand))
+            self.demand = np.concatenate([self.demand, extra])
+            self._demand_values.extend(extra.tolist())
+        
+        return self.demand
+    
     def set_order_policies(
         self,
         retailer_policy: Optional[Callable] = None,
@@ -220,6 +374,10 @@ class SimulationEnvironment:
         """
         Run the simulation.
         
+        Simulations without a week callback whose nodes all use their
+        default ordering policies or fixed order schedules are computed by
+        the array kernel instead of stepping the nodes week by week.
+        
         Args:
             weeks: Number of weeks to simulate (overrides config)
             
@@ -233,14 +391,22 @@ class SimulationEnvironment:
         self.status = SimulationStatus.RUNNING
         
         try:
-            # Add a process to track progress
-            self.env.process(self._monitor_progress(weeks_to_run))
-            
-            # Run the simulation
-            self.env.run(until=weeks_to_run)
+            kernel_inputs = self._kernel_inputs(weeks_to_run)
             
-            # Finalize metrics
-            self.metrics_collector.finalize()
+            if kernel_inputs is not None:
+                self._run_kernel([self], [kernel_inputs], weeks_to_run)
+            else:
+                if self.config.use_simpy:
+                    # Add a process to track progress
+                    self.env.process(self._monitor_progress(weeks_to_run))
+                    
+                    # Run the simulation
+                    self.env.run(until=weeks_to_run)
+                else:
+                    self._run_weeks(weeks_to_run)
+                
+                # Finalize metrics
+                self.metrics_collector.finalize()
             
             self.status = SimulationStatus.COMPLETED
             
@@ -253,6 +419,336 @@ class SimulationEnvironment:
             self.status = SimulationStatus.ERROR
             raise RuntimeError(f"Simulation failed: {str(e)}")
     
+    def run_vectorized(self, weeks: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run the simulation with the array kernel only.
+        
+        The whole run is one loop over weeks with every node updated by
+        array operations. Unlike run, this never falls back to stepping
+        the nodes, so it fails for simulations the kernel cannot compute,
+        such as those with arbitrary Python ordering policies.
+        
+        Args:
+            weeks: Number of weeks to simulate (overrides config)
+        
+        Returns:
+            Dictionary containing simulation results
+        """
+        if self.status != SimulationStatus.READY:
+            raise RuntimeError(f"Simulation is not ready to run. Status: {self.status}")
+        
+        if self._kernel_inputs(weeks or self.config.weeks) is None:
+            raise RuntimeError("Simulation cannot be run by the array kernel")
+        
+        return self.run(weeks)
+    
+    @classmethod
+    def run_batched(
+        cls,
+        configs: List[SimulationConfig],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several independent simulations with default ordering policies.
+        
+        Simulations that can use the array kernel and share the same number
+        of weeks are advanced together in one batch. Any other configuration
+        is run normally. With more than one worker, the configurations are
+        split into shares that run in separate processes; node summaries
+        are then returned as plain dictionaries. This suits parameter
+        sweeps, where every run is independent. Set seed on configs with
+        random demand to make a sweep reproducible.
+        
+        Args:
+            configs: Simulation configurations to run
+            max_workers: Number of worker processes, -1 for one per CPU,
+                or None to run in this process
+            
+        Returns:
+            List of simulation results, in the order of configs
+        """
+        if max_workers is not None and max_workers < 0:
+            max_workers = os.cpu_count() or 1
+        
+        workers = min(max_workers or 1, len(configs))
+        if workers > 1:
+            # Order by horizon so each share batches as few horizons as possible
+            order = sorted(range(len(configs)), key=lambda index: configs[index].weeks)
+            share = -(-len(configs) // workers)
+            shares = [
+                [configs[index] for index in order[start:start + share]]
+                for start in range(0, len(configs), share)
+            ]
+            
+            # Forkserver workers start without a copy of this process's state
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+            results = [None] * len(configs)
+            with ProcessPoolExecutor(max_workers=len(shares), mp_context=context) as executor:
+                share_results = executor.map(_run_batched_in_worker, shares)
+                flat = [result for batch in share_results for result in batch]
+            for index, result in zip(order, flat):
+                results[index] = result
+            return results
+        
+        simulations = [cls(config) for config in configs]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(simulations)
+        
+        # Group batchable simulations by horizon
+        batches: Dict[int, List[int]] = {}
+        inputs: Dict[int, List[Tuple[np.ndarray, np.ndarray, np.ndarray]]] = {}
+        for index, sim in enumerate(simulations):
+            weeks = sim.config.weeks
+            kernel_inputs = sim._kernel_inputs(weeks)
+            if kernel_inputs is None:
+                results[index] = sim.run()
+            else:
+                batches.setdefault(weeks, []).append(index)
+                inputs.setdefault(weeks, []).append(kernel_inputs)
+        
+        for weeks, indices in batches.items():
+            batch = [simulations[index] for index in indices]
+            cls._run_kernel(batch, inputs[weeks], weeks)
+            for index, sim in zip(indices, batch):
+                sim.status = SimulationStatus.COMPLETED
+                results[index] = sim.get_results()
+        
+        return results
+    
+    def _kernel_inputs(self, weeks: int) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Get the array kernel inputs if the kernel can run this simulation.
+        
+        The kernel needs every node to use its default ordering policy or a
+        policy whose order_schedule(weeks) gives its orders, delays of at least one week,
+        integer quantities small enough for its quantity type and no
+        per-week callback. It is built from the config, so the nodes must
+        also still be in the state the config gives them.
+        
+        Args:
+            weeks: Number of weeks to simulate
+            
+        Returns:
+            Tuple of the demand for each week, the order schedule per node
+            and week, and which nodes follow their schedule, or None if the
+            nodes must be stepped week by week
+        """
+        config = self.config
+        if (
+            weeks < 1
+            or self.on_week_complete is not None
+            or min(config.order_delay, config.shipment_delay, config.production_delay) < 1
+            or not self._nodes_match_config()
+        ):
+            return None
+        
+        demand = self._demand_until(weeks)[:weeks]
+        if not np.issubdtype(demand.dtype, np.integer):
+            return None
+        largest = int(np.abs(demand).max())
+        
+        schedule = np.zeros((len(self.nodes), weeks), dtype=np.int64)
+        scheduled = np.zeros(len(self.nodes), dtype=bool)
+        for position, node in enumerate(self.nodes):
+            if node.order_policy == node.default_order_policy:
+                continue
+            
+            order_schedule = getattr(node.order_policy, "order_schedule", None)
+            if order_schedule is None:
+                return None
+            
+            orders = order_schedule(weeks)
+            if orders is None:
+                return None
+            orders = np.asarray(orders)
+            if not np.issubdtype(orders.dtype, np.integer):
+                return None
+            schedule[position] = orders
+            scheduled[position] = True
+            largest = max(largest, int(np.abs(orders).max()))
+        
+        # Stock and backlog must stay within the kernel's integer range
+        bound = (
+            abs(config.initial_inventory) + abs(config.initial_backlog)
+            + weeks * (largest + kernels.DEFAULT_ORDER_QUANTITY)
+        )
+        if bound > kernels.MAX_QUANTITY:
+            return None
+        
+        return demand, schedule, scheduled
+    
+    def _nodes_match_config(self) -> bool:
+        """
+        Check that the nodes are unchanged since they were built from the config.
+        
+        Returns:
+            Whether the demand pattern, stock, costs, delays and capacity of
+            every node still match the config and nothing is in transit
+        """
+        config = self.config
+        if self.retailer.demand_pattern is not self._demand_pattern:
+            return False
+        
+        for node in self.nodes:
+            if (
+                node.inventory != config.initial_inventory
+                or node.backlog != config.initial_backlog
+                or node.holding_cost_per_unit != config.holding_cost_per_unit
+                or node.backlog_cost_per_unit != config.backlog_cost_per_unit
+                or node.pending_orders
+                or node.incoming_shipments
+            ):
+                return False
+        
+        for node in self.nodes[:-1]:
+            if node.order_delay != config.order_delay or node.shipment_delay != config.shipment_delay:
+                return False
+        
+        factory = self.factory
+        return (
+            factory.shipment_delay == kernels.FACTORY_SHIPMENT_DELAY
+            and factory.production_capacity == config.production_capacity
+            and factory.production_delay == config.production_delay
+            and not factory.production_queue
+        )
+    
+    @staticmethod
+    def _run_kernel(
+        simulations: List['SimulationEnvironment'],
+        inputs: List[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+        weeks: int
+    ):
+        """
+        Simulate a batch with the array kernel and load the results.
+        
+        Args:
+            simulations: Simulations to run, all for the same number of weeks
+            inputs: Kernel inputs from _kernel_inputs for each simulation
+            weeks: Number of weeks to simulate
+        """
+        configs = [sim.config for sim in simulations]
+        demands, schedules, scheduled = zip(*inputs)
+        histories, production = kernels.step_weeks(
+            demand=np.stack(demands),
+            initial_inventory=np.array([c.initial_inventory for c in configs]),
+            initial_backlog=np.array([c.initial_backlog for c in configs]),
+            holding_cost_per_unit=np.array([c.holding_cost_per_unit for c in configs]),
+            backlog_cost_per_unit=np.array([c.backlog_cost_per_unit for c in configs]),
+            order_delay=np.array([c.order_delay for c in configs]),
+            shipment_delay=np.array([c.shipment_delay for c in configs]),
+            production_delay=np.array([c.production_delay for c in configs]),
+            production_capacity=np.array([c.production_capacity for c in configs]),
+            order_schedule=np.stack(schedules),
+            scheduled=np.stack(scheduled)
+        )
+        
+        for row, sim in enumerate(simulations):
+            sim._load_kernel_results(histories, production[row].tolist(), row, demands[row], weeks)
+    
+    def _load_kernel_results(
+        self,
+        histories: Dict[str, np.ndarray],
+        production: List[int],
+        row: int,
+        demand: np.ndarray,
+        weeks: int
+    ):
+        """
+        Bring this simulation to the end of a kernel run.
+        
+        Node histories, inventory and backlog are loaded, along with the
+        orders, shipments and production still in transit, so the final
+        state matches stepping the nodes week by week.
+        
+        Args:
+            histories: History arrays returned by kernels.step_weeks
+            production: Factory production started each week
+            row: Index of this simulation in the batch
+            demand: Customer demand for each week
+            weeks: Number of weeks simulated
+        """
+        # Move the clock to the end of the run
+        self.env = self._create_environment(initial_time=weeks)
+        if self.config.use_simpy:
+            self.env.process(self._step_nodes())
+        
+        node_histories = {}
+        for position, node in enumerate(self.nodes):
+            node.env = self.env
+            history = {key: values[row, position] for key, values in histories.items()}
+            if node.record_history:
+                node.history = history
+                history = node.history
+            node_history = {key: values.tolist() for key, values in history.items()}
+            node.holding_cost_sum = sum(node_history['holding_cost'])
+            node.backlog_cost_sum = sum(node_history['backlog_cost'])
+            node.total_cost_sum = sum(node_history['total_cost'])
+            node.inventory = node_history['inventory'][-1]
+            node.backlog = node_history['backlog'][-1]
+            node_histories[node.name] = node_history
+        
+        self.retailer.customer_demands = demand.tolist()
+        
+        # Orders placed, including those still on their way upstream
+        for node in self.nodes[:-1]:
+            upstream = node.upstream_node
+            for week, quantity in enumerate(node_histories[node.name]['orders_placed']):
+                if quantity > 0:
+                    order = Order(
+                        quantity=quantity,
+                        week_placed=week,
+                        from_node=node.name,
+                        to_node=upstream.name,
+                        week_to_arrive=week + node.order_delay
+                    )
+                    node.orders_placed.append(order)
+                    if order.week_to_arrive >= weeks:
+                        upstream.pending_orders[order.week_to_arrive].append(order)
+        
+        # Shipments still on their way downstream
+        for node in self.nodes[1:]:
+            downstream = node.downstream_node
+            for week in range(max(0, weeks - node.shipment_delay), weeks):
+                quantity = node_histories[node.name]['shipments_sent'][week]
+                if quantity > 0:
+                    downstream.incoming_shipments[week + node.shipment_delay].append(Shipment(
+                        quantity=quantity,
+                        from_node=node.name,
+                        to_node=downstream.name,
+                        week_shipped=week,
+                        week_to_arrive=week + node.shipment_delay
+                    ))
+        
+        # Production still in progress
+        for week in range(max(0, weeks - self.factory.production_delay), weeks):
+            if production[week] > 0:
+                self.factory.production_queue[week + self.factory.production_delay] += production[week]
+        
+        self.metrics_collector.load_histories(node_histories, weeks)
+        self.metrics_collector.finalize()
+    
+    def _run_weeks(self, total_weeks: int):
+        """
+        Step through the weeks directly, without SimPy.
+        
+        Metrics are collected and callbacks fired at the end of the same
+        weeks as _monitor_progress does.
+        
+        Args:
+            total_weeks: Total number of weeks to simulate
+        """
+        start = self.env.now
+        ticks = [node.tick for node in self.nodes]
+        for week in range(start, total_weeks):
+            self.env.now = week
+            for tick in ticks:
+                tick(week)
+            
+            if week > start:
+                self._complete_week(week)
+        
+        self.env.now = max(start, total_weeks)
+    
     def _monitor_progress(self, total_weeks: int):
         """
         Monitor simulation progress and trigger callbacks.
@@ -260,15 +756,28 @@ class SimulationEnvironment:
         Args:
             total_weeks: Total number of weeks to simulate
         """
-        while self.env.now < total_weeks:
+        week = int(self.env.now)
+        while week < total_weeks:
             yield self.env.timeout(1)
-            
-            # Collect metrics for current week
-            self.metrics_collector.collect_current_metrics(int(self.env.now))
-            
-            # Trigger week complete callback if set
-            if self.on_week_complete:
-                self.on_week_complete(self.get_current_state())
+            week += 1
+            self._complete_week(week)
+    
+    def _complete_week(self, week: int):
+        """
+        Collect metrics for a finished week and report it if due.
+        
+        The current state is only built when a callback is set and the
+        week falls on the configured reporting interval.
+        
+        Args:
+            week: Week that has just finished
+        """
+        # Collect metrics for current week
+        self.metrics_collector.collect_current_metrics(week)
+        
+        # Trigger week complete callback if set
+        if self.on_week_complete is not None and week % self.config.report_every == 0:
+            self.on_week_complete(self.get_current_state())
     
     def pause(self):
         """Pause the simulation (placeholder for future implementation)."""
@@ -288,6 +797,9 @@ class SimulationEnvironment:
         """
         Get the current state of the simulation.
         
+        The metrics summary is reused until the metrics collector is
+        next updated.
+        
         Returns:
             Dictionary containing current simulation state
         """
@@ -323,10 +835,33 @@ class SimulationEnvironment:
             },
             "summary": self.metrics_collector.get_summary_statistics(),
             "node_summaries": {
-                node.name: self.metrics_collector.get_node_summary(node.name)
+                node.name: self._node_summary(node)
                 for node in self.nodes
             },
-            "time_series": self.metrics_collector.metrics.node_histories
+            "time_series": self.metrics_collector.get_node_histories()
+        }
+    
+    def _node_summary(self, node) -> Mapping:
+        """
+        Get the results summary for a node.
+        
+        Nodes that do not record history only report their cost totals.
+        
+        Args:
+            node: Supply chain node
+            
+        Returns:
+            Mapping of node statistics
+        """
+        if node.record_history:
+            return self.metrics_collector.get_node_summary_view(node.name)
+        
+        return {
+            'node': node.name,
+            'total_holding_cost': node.holding_cost_sum,
+            'total_backlog_cost': node.backlog_cost_sum,
+            'total_cost': node.total_cost_sum,
+            'average_cost_per_week': node.total_cost_sum / max(1, int(self.env.now))
         }
     
     def get_time_series_dataframe(self):
@@ -1,12 +1,38 @@
 """Base class for supply chain entities."""
 
-from abc import ABC, abstractmethod
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import DefaultDict, Deque, List, Optional, Dict, Any
+import numpy as np
 import simpy
 from enum import Enum
 
 
+# History fields and the dtype each is stored with
+HISTORY_DTYPES: Dict[str, type] = {
+    'week': np.int64,
+    'inventory': np.int64,
+    'backlog': np.int64,
+    'orders_placed': np.int64,
+    'orders_received': np.int64,
+    'shipments_sent': np.int64,
+    'shipments_received': np.int64,
+    'holding_cost': np.float64,
+    'backlog_cost': np.float64,
+    'total_cost': np.float64
+}
+
+# Unit quantity fields, stored as floats once a fractional quantity appears
+QUANTITY_FIELDS = (
+    'inventory',
+    'backlog',
+    'orders_placed',
+    'orders_received',
+    'shipments_sent',
+    'shipments_received'
+)
+
+
 class NodeType(Enum):
     """Enumeration of supply chain node types."""
     RETAILER = "retailer"
@@ -15,7 +41,7 @@ class NodeType(Enum):
     FACTORY = "factory"
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Represents an order in the supply chain."""
     quantity: int
@@ -25,7 +51,7 @@ class Order:
     week_to_arrive: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Shipment:
     """Represents a shipment between nodes."""
     quantity: int
@@ -35,8 +61,42 @@ class Shipment:
     week_to_arrive: int
 
 
-class SupplyChainNode(ABC):
-    """Abstract base class for all supply chain entities."""
+class SupplyChainNode:
+    """Base class for all supply chain entities; subclasses provide get_order_quantity."""
+    
+    __slots__ = (
+        'env',
+        'name',
+        'node_type',
+        'inventory',
+        'backlog',
+        'holding_cost_per_unit',
+        'backlog_cost_per_unit',
+        'lead_time',
+        'order_delay',
+        'shipment_delay',
+        'pending_orders',
+        'incoming_shipments',
+        'outgoing_shipments',
+        'orders_placed',
+        'orders_received',
+        'last_order_received',
+        '_weekly_orders_placed',
+        '_weekly_orders_received',
+        '_weekly_shipments_sent',
+        '_weekly_shipments_received',
+        'upstream_node',
+        'downstream_node',
+        '_history',
+        '_history_len',
+        '_fractional_history',
+        'record_history',
+        'holding_cost_sum',
+        'backlog_cost_sum',
+        'total_cost_sum',
+        'process',
+        'order_policy'
+    )
     
     def __init__(
         self,
@@ -49,7 +109,10 @@ class SupplyChainNode(ABC):
         backlog_cost_per_unit: float = 1.0,
         lead_time: int = 2,
         order_delay: int = 2,
-        shipment_delay: int = 2
+        shipment_delay: int = 2,
+        weeks: int = 52,
+        start_process: bool = True,
+        record_history: bool = True
     ):
         """
         Initialize a supply chain node.
@@ -65,6 +128,11 @@ class SupplyChainNode(ABC):
             lead_time: Total lead time for orders (order + shipment delay)
             order_delay: Delay in weeks for order processing
             shipment_delay: Delay in weeks for shipment arrival
+            weeks: Number of weeks to preallocate history for
+            start_process: Whether to start the node's own SimPy process;
+                pass False when a driver calls tick each week instead
+            record_history: Whether to record weekly metrics to history;
+                when False only the running cost totals are kept
         """
         self.env = env
         self.name = name
@@ -81,33 +149,73 @@ class SupplyChainNode(ABC):
         self.order_delay = order_delay
         self.shipment_delay = shipment_delay
         
-        # Orders and shipments tracking
-        self.pending_orders: List[Order] = []
-        self.incoming_shipments: List[Shipment] = []
-        self.outgoing_shipments: List[Shipment] = []
+        # Orders and shipments tracking; orders and shipments in transit
+        # are bucketed by the week they arrive, and outgoing shipments are
+        # only kept until they arrive
+        self.pending_orders: DefaultDict[int, List[Order]] = defaultdict(list)
+        self.incoming_shipments: DefaultDict[int, List[Shipment]] = defaultdict(list)
+        self.outgoing_shipments: Deque[Shipment] = deque()
         self.orders_placed: List[Order] = []
         self.orders_received: List[Order] = []
+        self.last_order_received: Optional[Order] = None
+        
+        # Weekly quantity totals, updated as orders and shipments happen
+        self._weekly_orders_placed: DefaultDict[int, int] = defaultdict(int)
+        self._weekly_orders_received: DefaultDict[int, int] = defaultdict(int)
+        self._weekly_shipments_sent: DefaultDict[int, int] = defaultdict(int)
+        self._weekly_shipments_received: DefaultDict[int, int] = defaultdict(int)
         
         # Connections to other nodes
         self.upstream_node: Optional['SupplyChainNode'] = None
         self.downstream_node: Optional['SupplyChainNode'] = None
         
-        # Metrics tracking
-        self.history: Dict[str, List[Any]] = {
-            'week': [],
-            'inventory': [],
-            'backlog': [],
-            'orders_placed': [],
-            'orders_received': [],
-            'shipments_sent': [],
-            'shipments_received': [],
-            'holding_cost': [],
-            'backlog_cost': [],
-            'total_cost': []
+        # Metrics tracking, one preallocated array per field
+        self.record_history = record_history
+        self._history: Dict[str, np.ndarray] = {
+            key: np.zeros(max(weeks, 1) if record_history else 0, dtype=dtype)
+            for key, dtype in HISTORY_DTYPES.items()
         }
+        self._history_len = 0
+        self._fractional_history = False
+        
+        # Running cost totals over all recorded weeks
+        self.holding_cost_sum = 0.0
+        self.backlog_cost_sum = 0.0
+        self.total_cost_sum = 0.0
         
         # Start the node's process
-        self.process = env.process(self.run())
+        self.process = env.process(self.run()) if start_process else None
+    
+    @property
+    def history(self) -> Dict[str, np.ndarray]:
+        """Recorded metrics per field, as views covering the weeks recorded."""
+        length = self._history_len
+        return {key: values[:length] for key, values in self._history.items()}
+    
+    @history.setter
+    def history(self, history: Dict[str, Any]):
+        arrays = {key: np.asarray(history[key]) for key in HISTORY_DTYPES}
+        self._history = {
+            key: values.astype(np.result_type(HISTORY_DTYPES[key], values.dtype))
+            for key, values in arrays.items()
+        }
+        self._history_len = len(arrays['week'])
+        self._fractional_history = any(
+            self._history[key].dtype.kind == 'f' for key in QUANTITY_FIELDS
+        )
+    
+    def _grow_history(self):
+        """Double the capacity of the history arrays."""
+        self._history = {
+            key: np.concatenate([values, np.zeros_like(values)])
+            for key, values in self._history.items()
+        }
+    
+    def _promote_history(self):
+        """Store quantities as floats so fractional values are kept."""
+        for key in QUANTITY_FIELDS:
+            self._history[key] = self._history[key].astype(np.float64)
+        self._fractional_history = True
     
     def connect_upstream(self, node: 'SupplyChainNode'):
         """Connect to an upstream node (supplier)."""
@@ -119,35 +227,40 @@ class SupplyChainNode(ABC):
         self.downstream_node = node
         node.upstream_node = self
     
-    def place_order(self, quantity: int):
+    def place_order(self, quantity: int, current_week: int):
         """
         Place an order to the upstream node.
         
         Args:
             quantity: Number of units to order
+            current_week: Current simulation week
         """
         order = Order(
             quantity=quantity,
-            week_placed=int(self.env.now),
+            week_placed=current_week,
             from_node=self.name,
             to_node=self.upstream_node.name if self.upstream_node else "external_supplier"
         )
         
         self.orders_placed.append(order)
+        self._weekly_orders_placed[order.week_placed] += quantity
         
         if self.upstream_node:
             # Schedule order arrival at upstream node after order delay
-            order.week_to_arrive = int(self.env.now) + self.order_delay
-            self.upstream_node.pending_orders.append(order)
+            order.week_to_arrive = current_week + self.order_delay
+            self.upstream_node.pending_orders[order.week_to_arrive].append(order)
     
-    def receive_order(self, order: Order):
+    def receive_order(self, order: Order, current_week: int):
         """
         Receive and process an order from downstream node.
         
         Args:
             order: The order to process
+            current_week: Current simulation week
         """
         self.orders_received.append(order)
+        self.last_order_received = order
+        self._weekly_orders_received[order.week_placed] += order.quantity
         
         # Try to fulfill the order
         quantity_to_ship = min(order.quantity + self.backlog, self.inventory)
@@ -158,29 +271,36 @@ class SupplyChainNode(ABC):
                 quantity=quantity_to_ship,
                 from_node=self.name,
                 to_node=order.from_node,
-                week_shipped=int(self.env.now),
-                week_to_arrive=int(self.env.now) + self.shipment_delay
+                week_shipped=current_week,
+                week_to_arrive=current_week + self.shipment_delay
             )
             
-            self.outgoing_shipments.append(shipment)
+            # Every shipment takes the same delay, so the oldest arrive first
+            outgoing = self.outgoing_shipments
+            while outgoing and outgoing[0].week_to_arrive <= current_week:
+                outgoing.popleft()
+            outgoing.append(shipment)
+            self._weekly_shipments_sent[shipment.week_shipped] += quantity_to_ship
             self.inventory -= quantity_to_ship
             
             # Schedule shipment arrival at downstream node
             if self.downstream_node:
-                self.downstream_node.incoming_shipments.append(shipment)
+                self.downstream_node.incoming_shipments[shipment.week_to_arrive].append(shipment)
         
         # Update backlog
         unfulfilled = order.quantity + self.backlog - quantity_to_ship
         self.backlog = max(0, unfulfilled)
     
-    def receive_shipment(self, shipment: Shipment):
+    def receive_shipment(self, shipment: Shipment, current_week: int):
         """
         Receive a shipment from upstream node.
         
         Args:
             shipment: The shipment to receive
+            current_week: Current simulation week
         """
         self.inventory += shipment.quantity
+        self._weekly_shipments_received[current_week] += shipment.quantity
     
     def calculate_costs(self) -> Dict[str, float]:
         """
@@ -199,34 +319,50 @@ class SupplyChainNode(ABC):
             'total_cost': total_cost
         }
     
-    def record_metrics(self):
-        """Record current state metrics to history."""
-        costs = self.calculate_costs()
+    def record_metrics(self, current_week: int):
+        """
+        Record current state metrics to history.
         
-        self.history['week'].append(int(self.env.now))
-        self.history['inventory'].append(self.inventory)
-        self.history['backlog'].append(self.backlog)
-        self.history['orders_placed'].append(
-            sum(o.quantity for o in self.orders_placed 
-                if o.week_placed == int(self.env.now))
-        )
-        self.history['orders_received'].append(
-            sum(o.quantity for o in self.orders_received 
-                if o.week_placed == int(self.env.now))
-        )
-        self.history['shipments_sent'].append(
-            sum(s.quantity for s in self.outgoing_shipments 
-                if s.week_shipped == int(self.env.now))
-        )
-        self.history['shipments_received'].append(
-            sum(s.quantity for s in self.incoming_shipments 
-                if s.week_to_arrive == int(self.env.now))
+        The running cost totals are always updated; the history arrays
+        only when record_history is set.
+        
+        Args:
+            current_week: Current simulation week
+        """
+        holding_cost = self.inventory * self.holding_cost_per_unit
+        backlog_cost = self.backlog * self.backlog_cost_per_unit
+        self.holding_cost_sum += holding_cost
+        self.backlog_cost_sum += backlog_cost
+        self.total_cost_sum += holding_cost + backlog_cost
+        if not self.record_history:
+            return
+        
+        quantities = (
+            self.inventory,
+            self.backlog,
+            self._weekly_orders_placed.get(current_week, 0),
+            self._weekly_orders_received.get(current_week, 0),
+            self._weekly_shipments_sent.get(current_week, 0),
+            self._weekly_shipments_received.get(current_week, 0)
         )
-        self.history['holding_cost'].append(costs['holding_cost'])
-        self.history['backlog_cost'].append(costs['backlog_cost'])
-        self.history['total_cost'].append(costs['total_cost'])
+        
+        row = self._history_len
+        if row == len(self._history['week']):
+            self._grow_history()
+        if not self._fractional_history and not all(
+            isinstance(quantity, (int, np.integer)) for quantity in quantities
+        ):
+            self._promote_history()
+        
+        history = self._history
+        history['week'][row] = current_week
+        for key, quantity in zip(QUANTITY_FIELDS, quantities):
+            history[key][row] = quantity
+        history['holding_cost'][row] = holding_cost
+        history['backlog_cost'][row] = backlog_cost
+        history['total_cost'][row] = holding_cost + backlog_cost
+        self._history_len = row + 1
     
-    @abstractmethod
     def get_order_quantity(self, week: int) -> int:
         """
         Determine the order quantity for the current period.
@@ -238,41 +374,50 @@ class SupplyChainNode(ABC):
         Returns:
             Quantity to order
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement get_order_quantity")
+    
+    def tick(self, current_week: int):
+        """
+        Carry out the node's work for one week.
+        
+        Args:
+            current_week: Current simulation week
+        """
+        # Process incoming shipments that have arrived
+        receive_shipment = self.receive_shipment
+        for shipment in self.incoming_shipments.pop(current_week, ()):
+            receive_shipment(shipment, current_week)
+        
+        # Process pending orders that have arrived
+        receive_order = self.receive_order
+        for order in self.pending_orders.pop(current_week, ()):
+            receive_order(order, current_week)
+        
+        # Determine order quantity and place order
+        order_quantity = self.get_order_quantity(current_week)
+        if order_quantity > 0:
+            self.place_order(order_quantity, current_week)
+        
+        # Record metrics for this period
+        self.record_metrics(current_week)
     
     def run(self):
-        """Main process loop for the supply chain node."""
+        """Main process loop for a node that runs as its own process."""
+        week = int(self.env.now)
         while True:
-            current_week = int(self.env.now)
-            
-            # Process incoming shipments that have arrived
-            arrived_shipments = [
-                s for s in self.incoming_shipments 
-                if s.week_to_arrive == current_week
-            ]
-            for shipment in arrived_shipments:
-                self.receive_shipment(shipment)
-                self.incoming_shipments.remove(shipment)
-            
-            # Process pending orders that have arrived
-            arrived_orders = [
-                o for o in self.pending_orders 
-                if o.week_to_arrive == current_week
-            ]
-            for order in arrived_orders:
-                self.receive_order(order)
-                self.pending_orders.remove(order)
-            
-            # Determine order quantity and place order
-            order_quantity = self.get_order_quantity(current_week)
-            if order_quantity > 0:
-                self.place_order(order_quantity)
-            
-            # Record metrics for this period
-            self.record_metrics()
+            self.tick(week)
             
             # Wait for next period
             yield self.env.timeout(1)
+            week += 1
+    
+    def count_pending_orders(self) -> int:
+        """Number of orders on their way to this node."""
+        return sum(len(orders) for orders in self.pending_orders.values())
+    
+    def count_incoming_shipments(self) -> int:
+        """Number of shipments on their way to this node."""
+        return sum(len(shipments) for shipments in self.incoming_shipments.values())
     
     def get_state(self) -> Dict[str, Any]:
         """
@@ -287,8 +432,8 @@ class SupplyChainNode(ABC):
             'type': self.node_type.value,
             'inventory': self.inventory,
             'backlog': self.backlog,
-            'pending_orders': len(self.pending_orders),
-            'incoming_shipments': len(self.incoming_shipments),
+            'pending_orders': self.count_pending_orders(),
+            'incoming_shipments': self.count_incoming_shipments(),
             'last_order': self.orders_placed[-1].quantity if self.orders_placed else 0,
             'costs': costs,
             'week': int(self.env.now)
@@ -1,14 +1,17 @@
 """Specific supply chain node implementations."""
 
-from typing import Optional, Callable
+from collections import defaultdict
+from typing import DefaultDict, Optional, Callable, Union
+import numpy as np
 import simpy
-import random
 from .base import SupplyChainNode, NodeType, Order
 
 
 class Retailer(SupplyChainNode):
     """Retailer node - faces external customer demand."""
     
+    __slots__ = ('demand_pattern', 'customer_demands')
+    
     def __init__(
         self,
         env: simpy.Environment,
@@ -20,7 +23,10 @@ class Retailer(SupplyChainNode):
         order_delay: int = 2,
         shipment_delay: int = 2,
         order_policy: Optional[Callable] = None,
-        demand_pattern: Optional[Callable] = None
+        demand_pattern: Optional[Union[Callable, np.ndarray]] = None,
+        weeks: int = 52,
+        start_process: bool = True,
+        record_history: bool = True
     ):
         """
         Initialize a Retailer node.
@@ -33,7 +39,11 @@ class Retailer(SupplyChainNode):
             holding_cost_per_unit: Cost per unit of inventory held per week
             backlog_cost_per_unit: Cost per unit of backlog per week
             order_policy: Function to determine order quantity
-            demand_pattern: Function to generate customer demand
+            demand_pattern: Function to generate customer demand, or an
+                array of demand for each week
+            weeks: Number of weeks to preallocate history for
+            start_process: Whether to start the node's own SimPy process
+            record_history: Whether to record weekly metrics to history
         """
         super().__init__(
             env=env,
@@ -44,10 +54,16 @@ class Retailer(SupplyChainNode):
             holding_cost_per_unit=holding_cost_per_unit,
             backlog_cost_per_unit=backlog_cost_per_unit,
             order_delay=order_delay,
-            shipment_delay=shipment_delay
+            shipment_delay=shipment_delay,
+            weeks=weeks,
+            start_process=start_process,
+            record_history=record_history
         )
         
         self.order_policy = order_policy or self.default_order_policy
+        if isinstance(demand_pattern, np.ndarray):
+            # Weekly reads index a plain list rather than calling a function
+            demand_pattern = demand_pattern.tolist().__getitem__
         self.demand_pattern = demand_pattern or self.default_demand_pattern
         self.customer_demands = []
     
@@ -79,41 +95,33 @@ class Retailer(SupplyChainNode):
         )
         
         # Process the order immediately (customer orders have no delay)
-        self.receive_order(customer_order)
+        self.receive_order(customer_order, week)
     
-    def run(self):
-        """Main process loop for the retailer."""
-        while True:
-            current_week = int(self.env.now)
-            
-            # First process customer demand
-            self.process_customer_demand(current_week)
-            
-            # Then run the standard node process
-            # Process incoming shipments that have arrived
-            arrived_shipments = [
-                s for s in self.incoming_shipments 
-                if s.week_to_arrive == current_week
-            ]
-            for shipment in arrived_shipments:
-                self.receive_shipment(shipment)
-                self.incoming_shipments.remove(shipment)
-            
-            # Determine order quantity and place order to upstream
-            order_quantity = self.get_order_quantity(current_week)
-            if order_quantity > 0:
-                self.place_order(order_quantity)
-            
-            # Record metrics for this period
-            self.record_metrics()
-            
-            # Wait for next period
-            yield self.env.timeout(1)
+    def tick(self, current_week: int):
+        """Carry out the retailer's work for one week."""
+        # First process customer demand
+        self.process_customer_demand(current_week)
+        
+        # Then run the standard node process
+        # Process incoming shipments that have arrived
+        receive_shipment = self.receive_shipment
+        for shipment in self.incoming_shipments.pop(current_week, ()):
+            receive_shipment(shipment, current_week)
+        
+        # Determine order quantity and place order to upstream
+        order_quantity = self.get_order_quantity(current_week)
+        if order_quantity > 0:
+            self.place_order(order_quantity, current_week)
+        
+        # Record metrics for this period
+        self.record_metrics(current_week)
 
 
 class Wholesaler(SupplyChainNode):
     """Wholesaler node - intermediate node in the supply chain."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         env: simpy.Environment,
@@ -124,7 +132,10 @@ class Wholesaler(SupplyChainNode):
         backlog_cost_per_unit: float = 1.0,
         order_delay: int = 2,
         shipment_delay: int = 2,
-        order_policy: Optional[Callable] = None
+        order_policy: Optional[Callable] = None,
+        weeks: int = 52,
+        start_process: bool = True,
+        record_history: bool = True
     ):
         """Initialize a Wholesaler node."""
         super().__init__(
@@ -136,17 +147,21 @@ class Wholesaler(SupplyChainNode):
             holding_cost_per_unit=holding_cost_per_unit,
             backlog_cost_per_unit=backlog_cost_per_unit,
             order_delay=order_delay,
-            shipment_delay=shipment_delay
+            shipment_delay=shipment_delay,
+            weeks=weeks,
+            start_process=start_process,
+            record_history=record_history
         )
         
         self.order_policy = order_policy or self.default_order_policy
     
     def default_order_policy(self, week: int) -> int:
         """Default ordering policy - match incoming orders."""
-        if self.orders_received:
-            recent_orders = [o for o in self.orders_received if o.week_placed >= week - 1]
-            if recent_orders:
-                return recent_orders[-1].quantity
+        # Orders arrive in the order they were placed, so only the latest
+        # can have been placed recently enough
+        last_order = self.last_order_received
+        if last_order is not None and last_order.week_placed >= week - 1:
+            return last_order.quantity
         return 4  # Default order quantity
     
     def get_order_quantity(self, week: int) -> int:
@@ -157,6 +172,8 @@ class Wholesaler(SupplyChainNode):
 class Distributor(SupplyChainNode):
     """Distributor node - intermediate node in the supply chain."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         env: simpy.Environment,
@@ -167,7 +184,10 @@ class Distributor(SupplyChainNode):
         backlog_cost_per_unit: float = 1.0,
         order_delay: int = 2,
         shipment_delay: int = 2,
-        order_policy: Optional[Callable] = None
+        order_policy: Optional[Callable] = None,
+        weeks: int = 52,
+        start_process: bool = True,
+        record_history: bool = True
     ):
         """Initialize a Distributor node."""
         super().__init__(
@@ -179,17 +199,21 @@ class Distributor(SupplyChainNode):
             holding_cost_per_unit=holding_cost_per_unit,
             backlog_cost_per_unit=backlog_cost_per_unit,
             order_delay=order_delay,
-            shipment_delay=shipment_delay
+            shipment_delay=shipment_delay,
+            weeks=weeks,
+            start_process=start_process,
+            record_history=record_history
         )
         
         self.order_policy = order_policy or self.default_order_policy
     
     def default_order_policy(self, week: int) -> int:
         """Default ordering policy - match incoming orders."""
-        if self.orders_received:
-            recent_orders = [o for o in self.orders_received if o.week_placed >= week - 1]
-            if recent_orders:
-                return recent_orders[-1].quantity
+        # Orders arrive in the order they were placed, so only the latest
+        # can have been placed recently enough
+        last_order = self.last_order_received
+        if last_order is not None and last_order.week_placed >= week - 1:
+            return last_order.quantity
         return 4  # Default order quantity
     
     def get_order_quantity(self, week: int) -> int:
@@ -200,6 +224,8 @@ class Distributor(SupplyChainNode):
 class Factory(SupplyChainNode):
     """Factory node - produces goods with unlimited raw materials."""
     
+    __slots__ = ('production_capacity', 'production_delay', 'production_queue')
+    
     def __init__(
         self,
         env: simpy.Environment,
@@ -210,7 +236,10 @@ class Factory(SupplyChainNode):
         backlog_cost_per_unit: float = 1.0,
         production_capacity: int = 100,
         production_delay: int = 2,
-        order_policy: Optional[Callable] = None
+        order_policy: Optional[Callable] = None,
+        weeks: int = 52,
+        start_process: bool = True,
+        record_history: bool = True
     ):
         """
         Initialize a Factory node.
@@ -225,6 +254,9 @@ class Factory(SupplyChainNode):
             production_capacity: Maximum production per week
             production_delay: Delay in weeks for production
             order_policy: Function to determine production quantity
+            weeks: Number of weeks to preallocate history for
+            start_process: Whether to start the node's own SimPy process
+            record_history: Whether to record weekly metrics to history
         """
         super().__init__(
             env=env,
@@ -233,20 +265,23 @@ class Factory(SupplyChainNode):
             initial_inventory=initial_inventory,
             initial_backlog=initial_backlog,
             holding_cost_per_unit=holding_cost_per_unit,
-            backlog_cost_per_unit=backlog_cost_per_unit
+            backlog_cost_per_unit=backlog_cost_per_unit,
+            weeks=weeks,
+            start_process=start_process,
+            record_history=record_history
         )
         
         self.production_capacity = production_capacity
         self.production_delay = production_delay
         self.order_policy = order_policy or self.default_order_policy
-        self.production_queue = []
+        # Units in production, keyed by the week they complete
+        self.production_queue: DefaultDict[int, int] = defaultdict(int)
     
     def default_order_policy(self, week: int) -> int:
         """Default production policy - match incoming orders."""
-        if self.orders_received:
-            recent_orders = [o for o in self.orders_received if o.week_placed >= week - 1]
-            if recent_orders:
-                return min(recent_orders[-1].quantity, self.production_capacity)
+        last_order = self.last_order_received
+        if last_order is not None and last_order.week_placed >= week - 1:
+            return min(last_order.quantity, self.production_capacity)
         return 4  # Default production quantity
     
     def get_order_quantity(self, week: int) -> int:
@@ -256,50 +291,34 @@ class Factory(SupplyChainNode):
         """
         return self.order_policy(week)
     
-    def place_order(self, quantity: int):
+    def place_order(self, quantity: int, current_week: int):
         """
         Override place_order to schedule production instead of ordering.
         
         Args:
             quantity: Number of units to produce
+            current_week: Current simulation week
         """
         # Schedule production to complete after production delay
-        production_complete_week = int(self.env.now) + self.production_delay
-        self.production_queue.append({
-            'quantity': min(quantity, self.production_capacity),
-            'complete_week': production_complete_week
-        })
+        production_complete_week = current_week + self.production_delay
+        self.production_queue[production_complete_week] += min(quantity, self.production_capacity)
     
-    def run(self):
-        """Main process loop for the factory."""
-        while True:
-            current_week = int(self.env.now)
-            
-            # Process completed production
-            completed_production = [
-                p for p in self.production_queue 
-                if p['complete_week'] == current_week
-            ]
-            for production in completed_production:
-                self.inventory += production['quantity']
-                self.production_queue.remove(production)
-            
-            # Process pending orders that have arrived
-            arrived_orders = [
-                o for o in self.pending_orders 
-                if o.week_to_arrive == current_week
-            ]
-            for order in arrived_orders:
-                self.receive_order(order)
-                self.pending_orders.remove(order)
-            
-            # Determine production quantity and schedule production
-            production_quantity = self.get_order_quantity(current_week)
-            if production_quantity > 0:
-                self.place_order(production_quantity)  # This schedules production
-            
-            # Record metrics for this period
-            self.record_metrics()
-            
-            # Wait for next period
-            yield self.env.timeout(1)
+    def tick(self, current_week: int):
+        """Carry out the factory's work for one week."""
+        # Process completed production
+        completed = self.production_queue.pop(current_week, None)
+        if completed is not None:
+            self.inventory += completed
+        
+        # Process pending orders that have arrived
+        receive_order = self.receive_order
+        for order in self.pending_orders.pop(current_week, ()):
+            receive_order(order, current_week)
+        
+        # Determine production quantity and schedule production
+        production_quantity = self.get_order_quantity(current_week)
+        if production_quantity > 0:
+            self.place_order(production_quantity, current_week)  # This schedules production
+        
+        # Record metrics for this period
+        self.record_metrics(current_week)
@@ -0,0 +1,276 @@
+"""Array kernels for running supply chains with the default ordering policies."""
+
+from typing import Dict, Optional, Tuple
+from dataclasses import dataclass
+import numpy as np
+
+
+# Node order along the chain, downstream to upstream
+NODE_NAMES = ("Retailer", "Wholesaler", "Distributor", "Factory")
+
+# History fields recorded by SupplyChainNode.record_metrics
+HISTORY_FIELDS = (
+    'week',
+    'inventory',
+    'backlog',
+    'orders_placed',
+    'orders_received',
+    'shipments_sent',
+    'shipments_received',
+    'holding_cost',
+    'backlog_cost',
+    'total_cost'
+)
+
+DEFAULT_ORDER_QUANTITY = 4
+
+# Unit quantities are small integers, so 32 bits halve the memory moved
+# per week compared to int64; costs stay float64 to match the nodes
+QUANTITY_DTYPE = np.int32
+MAX_QUANTITY = np.iinfo(QUANTITY_DTYPE).max
+
+# The factory is built with the node default shipment delay
+FACTORY_SHIPMENT_DELAY = 2
+
+# Node columns that receive shipments from, and orders placed by, the
+# retailer, wholesaler and distributor columns respectively
+DOWNSTREAM = np.arange(3)
+UPSTREAM = np.arange(1, 4)
+
+
+@dataclass
+class NodeArrays:
+    """
+    Struct-of-arrays state for a batch of supply chains.
+
+    Every field has one row per scenario and one column per node, so a
+    weekly update touches all nodes in a single array operation.
+    """
+    inventory: np.ndarray  # (S, 4)
+    backlog: np.ndarray  # (S, 4)
+    shipments_in: np.ndarray  # (S, 4, horizon), units arriving each week
+    orders_in: np.ndarray  # (S, 4, horizon), orders arriving each week
+    last_quantity: np.ndarray  # (S, 3), latest order received upstream
+    last_week_placed: np.ndarray  # (S, 3), week that order was placed
+
+    @classmethod
+    def initial(
+        cls,
+        initial_inventory: np.ndarray,
+        initial_backlog: np.ndarray,
+        horizon: int
+    ) -> 'NodeArrays':
+        """
+        Create the starting state for a batch.
+
+        Args:
+            initial_inventory: Starting inventory per scenario, shape (S,)
+            initial_backlog: Starting backlog per scenario, shape (S,)
+            horizon: Number of weeks arrivals can be scheduled for
+
+        Returns:
+            NodeArrays with empty pipelines
+        """
+        initial_inventory = np.asarray(initial_inventory, dtype=QUANTITY_DTYPE)
+        n_scenarios = len(initial_inventory)
+        return cls(
+            inventory=np.repeat(initial_inventory[:, None], 4, axis=1),
+            backlog=np.repeat(np.asarray(initial_backlog, dtype=QUANTITY_DTYPE)[:, None], 4, axis=1),
+            shipments_in=np.zeros((n_scenarios, 4, horizon), dtype=QUANTITY_DTYPE),
+            orders_in=np.zeros((n_scenarios, 4, horizon), dtype=QUANTITY_DTYPE),
+            last_quantity=np.zeros((n_scenarios, 3), dtype=QUANTITY_DTYPE),
+            last_week_placed=np.full((n_scenarios, 3), -horizon - 2, dtype=np.int64)
+        )
+
+
+def step_weeks(
+    demand: np.ndarray,
+    initial_inventory: np.ndarray,
+    initial_backlog: np.ndarray,
+    holding_cost_per_unit: np.ndarray,
+    backlog_cost_per_unit: np.ndarray,
+    order_delay: np.ndarray,
+    shipment_delay: np.ndarray,
+    production_delay: np.ndarray,
+    production_capacity: np.ndarray,
+    order_schedule: Optional[np.ndarray] = None,
+    scheduled: Optional[np.ndarray] = None
+) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    Simulate a batch of four-node supply chains week by week.
+
+    Nodes use their default ordering policy unless flagged in scheduled,
+    in which case they order from order_schedule. Each week is advanced
+    for all scenarios and nodes at once. The results match the SimPy node
+    processes as long as every delay is at least one week, since no
+    order or shipment can then arrive within the week it was sent.
+
+    Args:
+        demand: Customer demand per scenario and week, shape (S, W)
+        initial_inventory: Starting inventory per scenario, shape (S,)
+        initial_backlog: Starting backlog per scenario, shape (S,)
+        holding_cost_per_unit: Holding cost per scenario, shape (S,)
+        backlog_cost_per_unit: Backlog cost per scenario, shape (S,)
+        order_delay: Order delay per scenario, shape (S,)
+        shipment_delay: Shipment delay per scenario, shape (S,)
+        production_delay: Factory production delay per scenario, shape (S,)
+        production_capacity: Factory capacity per scenario, shape (S,)
+        order_schedule: Fixed order quantities per scenario, node and
+            week, shape (S, 4, W)
+        scheduled: Nodes that follow order_schedule, shape (S, 4)
+
+    Returns:
+        Tuple of a dictionary of history arrays shaped (S, 4, W), keyed
+        like SupplyChainNode.history, and the factory production started
+        each week, shaped (S, W)
+    """
+    demand = np.asarray(demand, dtype=QUANTITY_DTYPE)
+    n_scenarios, weeks = demand.shape
+    rows = np.arange(n_scenarios)[:, None]
+
+    order_delay = np.asarray(order_delay, dtype=np.int64)[:, None]
+    production_delay = np.asarray(production_delay, dtype=np.int64)[:, None]
+    capacity = np.minimum(production_capacity, MAX_QUANTITY).astype(QUANTITY_DTYPE)
+    node_shipment_delay = np.empty((n_scenarios, 3), dtype=np.int64)
+    node_shipment_delay[:, :2] = np.asarray(shipment_delay, dtype=np.int64)[:, None]
+    node_shipment_delay[:, 2] = FACTORY_SHIPMENT_DELAY
+
+    # Arrivals are indexed by absolute week
+    max_delay = int(max(
+        order_delay.max(initial=0),
+        node_shipment_delay.max(initial=0),
+        production_delay.max(initial=0)
+    ))
+    state = NodeArrays.initial(initial_inventory, initial_backlog, weeks + max_delay + 1)
+    inventory = state.inventory
+    backlog = state.backlog
+
+    # Histories
+    history = {
+        key: np.zeros((n_scenarios, 4, weeks), dtype=QUANTITY_DTYPE)
+        for key in HISTORY_FIELDS
+    }
+    history['week'][:] = np.arange(weeks)
+
+    holding = np.asarray(holding_cost_per_unit, dtype=np.float64)[:, None]
+    backlog_rate = np.asarray(backlog_cost_per_unit, dtype=np.float64)[:, None]
+    holding_cost = np.zeros((n_scenarios, 4, weeks), dtype=np.float64)
+    backlog_cost = np.zeros((n_scenarios, 4, weeks), dtype=np.float64)
+
+    if scheduled is not None:
+        order_schedule = np.asarray(order_schedule, dtype=QUANTITY_DTYPE)
+        scheduled = np.asarray(scheduled, dtype=bool)
+
+    production = np.zeros((n_scenarios, weeks), dtype=QUANTITY_DTYPE)
+    orders = np.empty((n_scenarios, 4), dtype=QUANTITY_DTYPE)
+
+    # Demand that never changes is read once rather than every week
+    constant_demand = weeks > 0 and bool((demand == demand[:, :1]).all())
+    if constant_demand:
+        customer = demand[:, 0].copy()
+
+    for week in range(weeks):
+        # Retailer serves customer demand before shipments arrive
+        if not constant_demand:
+            customer = demand[:, week]
+        to_ship = np.minimum(customer + backlog[:, 0], inventory[:, 0])
+        shipped = np.where(to_ship > 0, to_ship, 0)
+        inventory[:, 0] -= shipped
+        backlog[:, 0] = np.maximum(0, customer + backlog[:, 0] - to_ship)
+        history['shipments_sent'][:, 0, week] = shipped
+        history['orders_received'][:, 0, week] = customer
+
+        # Shipments and completed production arrive
+        inventory += state.shipments_in[:, :, week]
+        history['shipments_received'][:, :3, week] = state.shipments_in[:, :3, week]
+
+        # Upstream nodes fill the orders arriving this week
+        incoming = state.orders_in[:, 1:, week]
+        arrived = incoming > 0
+        to_ship = np.minimum(incoming + backlog[:, 1:], inventory[:, 1:])
+        shipped = np.where(arrived & (to_ship > 0), to_ship, 0)
+        inventory[:, 1:] -= shipped
+        backlog[:, 1:] = np.where(
+            arrived,
+            np.maximum(0, incoming + backlog[:, 1:] - to_ship),
+            backlog[:, 1:]
+        )
+        state.last_quantity = np.where(arrived, incoming, state.last_quantity)
+        state.last_week_placed = np.where(arrived, week - order_delay, state.last_week_placed)
+        history['shipments_sent'][:, 1:, week] = shipped
+        state.shipments_in[rows, DOWNSTREAM, week + node_shipment_delay] += shipped
+
+        # Default policies: the retailer orders its latest demand, upstream
+        # nodes repeat the latest order received in the previous week
+        recent = state.last_week_placed >= week - 1
+        orders[:, 0] = customer
+        orders[:, 1:] = np.where(recent, state.last_quantity, DEFAULT_ORDER_QUANTITY)
+        orders[:, 3] = np.where(recent[:, 2], np.minimum(state.last_quantity[:, 2], capacity), orders[:, 3])
+        if scheduled is not None:
+            orders[:] = np.where(scheduled, order_schedule[:, :, week], orders)
+        placed = np.where(orders > 0, orders, 0)
+
+        state.orders_in[rows, UPSTREAM, week + order_delay] += placed[:, :3]
+        production[:, week] = np.minimum(placed[:, 3], capacity)
+        state.shipments_in[rows[:, 0], 3, week + production_delay[:, 0]] += production[:, week]
+
+        # Record metrics (factory production is not an order placed)
+        history['inventory'][:, :, week] = inventory
+        history['backlog'][:, :, week] = backlog
+        history['orders_placed'][:, :3, week] = placed[:, :3]
+        holding_cost[:, :, week] = inventory * holding
+        backlog_cost[:, :, week] = backlog * backlog_rate
+
+    history['holding_cost'] = holding_cost
+    history['backlog_cost'] = backlog_cost
+    history['total_cost'] = holding_cost + backlog_cost
+
+    return history, production
+
+
+def fast_run(
+    demand: np.ndarray,
+    initial_inventory: int = 12,
+    initial_backlog: int = 0,
+    holding_cost_per_unit: float = 0.5,
+    backlog_cost_per_unit: float = 1.0,
+    order_delay: int = 2,
+    shipment_delay: int = 2,
+    production_delay: int = 2,
+    production_capacity: int = 100
+) -> Dict[str, np.ndarray]:
+    """
+    Simulate a single supply chain with the default ordering policies.
+
+    A lighter alternative to SimulationEnvironment for parameter sweeps
+    that only need the node histories: no nodes, orders or metrics
+    collector are created. Every delay must be at least one week.
+
+    Args:
+        demand: Customer demand for each week, shape (W,)
+        initial_inventory: Starting inventory of every node
+        initial_backlog: Starting backlog of every node
+        holding_cost_per_unit: Cost per unit of inventory held per week
+        backlog_cost_per_unit: Cost per unit of backlog per week
+        order_delay: Delay in weeks for orders to reach the upstream node
+        shipment_delay: Delay in weeks for shipments from the wholesaler
+            and distributor
+        production_delay: Delay in weeks for factory production
+        production_capacity: Maximum factory production per week
+
+    Returns:
+        Dictionary of history arrays shaped (4, W), one row per node in
+        NODE_NAMES order, keyed like SupplyChainNode.history
+    """
+    histories, _ = step_weeks(
+        demand=np.asarray(demand)[None, :],
+        initial_inventory=np.array([initial_inventory]),
+        initial_backlog=np.array([initial_backlog]),
+        holding_cost_per_unit=np.array([holding_cost_per_unit]),
+        backlog_cost_per_unit=np.array([backlog_cost_per_unit]),
+        order_delay=np.array([order_delay]),
+        shipment_delay=np.array([shipment_delay]),
+        production_delay=np.array([production_delay]),
+        production_capacity=np.array([production_capacity])
+    )
+    return {key: values[0] for key, values in histories.items()}
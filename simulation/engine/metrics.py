@@ -1,13 +1,60 @@
 """Metrics collection and analysis for the simulation."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+from collections.abc import Mapping
 import pandas as pd
 import numpy as np
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from .entities.base import HISTORY_DTYPES
 
-@dataclass
+
+def _bullwhip_ratio(retailer_orders: np.ndarray, factory_orders: np.ndarray) -> float:
+    """
+    Ratio of factory to retailer order variance.
+    
+    Args:
+        retailer_orders: Orders placed by the retailer each week
+        factory_orders: Production ordered by the factory each week
+        
+    Returns:
+        Variance ratio, or 0.0 if retailer orders do not vary
+    """
+    retailer_var = retailer_orders.var()
+    if retailer_var > 0:
+        return factory_orders.var() / retailer_var
+    return 0.0
+
+
+def _service_level(orders_received: np.ndarray, backlog: np.ndarray) -> Dict[str, Any]:
+    """
+    Fill rate and stockouts of a node from its weekly orders and backlog.
+    
+    Args:
+        orders_received: Orders received each week
+        backlog: Backlog at the end of each week
+        
+    Returns:
+        Dictionary with fill_rate, stockout_weeks and stockout_percentage
+    """
+    total_demand = orders_received.sum().item()
+    total_backlog = backlog.sum().item()
+    stockout_weeks = int(np.count_nonzero(backlog > 0))
+    
+    if total_demand > 0:
+        fill_rate = 1 - (total_backlog / total_demand)
+    else:
+        fill_rate = 1.0
+    
+    return {
+        'fill_rate': fill_rate,
+        'stockout_weeks': stockout_weeks,
+        'stockout_percentage': stockout_weeks / max(1, len(backlog))
+    }
+
+
+@dataclass(slots=True)
 class SimulationMetrics:
     """Container for simulation-wide metrics."""
     
@@ -28,8 +75,95 @@ class SimulationMetrics:
     # Bullwhip effect
     bullwhip_ratio: float = 0.0
     
-    # Node-specific histories
-    node_histories: Dict[str, Dict[str, List[Any]]] = field(default_factory=dict)
+    # Node-specific histories, one array per field
+    node_histories: Dict[str, Dict[str, np.ndarray]] = field(default_factory=dict)
+
+
+class NodeSummaryView(Mapping):
+    """
+    Read-only node summary that computes each statistic on first access.
+    
+    Holds the same keys and values as MetricsCollector.get_node_summary,
+    but skips the statistics a caller never reads. Convert it with dict()
+    before serializing.
+    """
+    
+    KEYS = (
+        'node',
+        'average_inventory',
+        'max_inventory',
+        'min_inventory',
+        'average_backlog',
+        'max_backlog',
+        'total_orders_placed',
+        'total_orders_received',
+        'total_cost',
+        'average_cost_per_week'
+    )
+    
+    def __init__(self, collector: 'MetricsCollector', node_name: str):
+        """
+        Initialize the view.
+        
+        Args:
+            collector: Metrics collector holding the node history
+            node_name: Name of the node
+        """
+        self._collector = collector
+        self._node_name = node_name
+        self._cache: Dict[str, Any] = {}
+        self._cached_weeks = 0
+    
+    def _history(self) -> Dict[str, np.ndarray]:
+        history = self._collector.metrics.node_histories.get(self._node_name)
+        if not history or not len(history['week']):
+            return {}
+        
+        # Recompute if more weeks were collected since the last access
+        if len(history['week']) != self._cached_weeks:
+            self._cache.clear()
+            self._cached_weeks = len(history['week'])
+        
+        return history
+    
+    def __getitem__(self, key: str) -> Any:
+        history = self._history()
+        if not history or key not in self.KEYS:
+            raise KeyError(key)
+        
+        if key not in self._cache:
+            self._cache[key] = self._compute(key, history)
+        return self._cache[key]
+    
+    def _compute(self, key: str, history: Dict[str, np.ndarray]) -> Any:
+        if key == 'node':
+            return self._node_name
+        if key == 'average_inventory':
+            return history['inventory'].mean()
+        if key == 'max_inventory':
+            return history['inventory'].max().item()
+        if key == 'min_inventory':
+            return history['inventory'].min().item()
+        if key == 'average_backlog':
+            return history['backlog'].mean()
+        if key == 'max_backlog':
+            return history['backlog'].max().item()
+        if key == 'total_orders_placed':
+            return history['orders_placed'].sum().item()
+        if key == 'total_orders_received':
+            return history['orders_received'].sum().item()
+        if key == 'total_cost':
+            return history['total_cost'].sum().item()
+        return history['total_cost'].mean()
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS if self._history() else ())
+    
+    def __len__(self) -> int:
+        return len(self.KEYS) if self._history() else 0
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 
 class MetricsCollector:
@@ -48,6 +182,15 @@ class MetricsCollector:
             start_time=datetime.now()
         )
         self.nodes = []
+        
+        # Bumped whenever the collected metrics change
+        self.update_count = 0
+        
+        # Summaries keyed by the update count they were computed at
+        self._summary_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._node_summary_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._bullwhip_count: Optional[int] = None
+        self._service_levels_cache: Optional[Tuple[int, Dict[str, Any]]] = None
     
     def register_node(self, node):
         """
@@ -57,54 +200,90 @@ class MetricsCollector:
             node: SupplyChainNode to monitor
         """
         self.nodes.append(node)
+        self.update_count += 1
         self.metrics.node_histories[node.name] = {
-            'week': [],
-            'inventory': [],
-            'backlog': [],
-            'orders_placed': [],
-            'orders_received': [],
-            'shipments_sent': [],
-            'shipments_received': [],
-            'holding_cost': [],
-            'backlog_cost': [],
-            'total_cost': []
+            key: np.zeros(0, dtype=dtype) for key, dtype in HISTORY_DTYPES.items()
         }
     
     def collect_current_metrics(self, week: int):
         """
         Collect metrics for the current simulation week.
         
+        Cumulative costs are taken from each node's running cost totals,
+        and node histories are kept as views of the node's own arrays up
+        to this week, so nothing is copied.
+        
         Args:
             week: Current simulation week
         """
         self.metrics.total_weeks = week
+        self.update_count += 1
         
         for node in self.nodes:
-            # Copy node's history to our metrics
-            for key in node.history:
-                if node.history[key]:  # Only if there's data
-                    self.metrics.node_histories[node.name][key] = node.history[key].copy()
+            self.metrics.total_cost += node.total_cost_sum
+            self.metrics.total_holding_cost += node.holding_cost_sum
+            self.metrics.total_backlog_cost += node.backlog_cost_sum
             
-            # Calculate cumulative costs
-            if node.history['total_cost']:
-                node_total_cost = sum(node.history['total_cost'])
-                node_holding_cost = sum(node.history['holding_cost'])
-                node_backlog_cost = sum(node.history['backlog_cost'])
-                
-                self.metrics.total_cost += node_total_cost
-                self.metrics.total_holding_cost += node_holding_cost
-                self.metrics.total_backlog_cost += node_backlog_cost
-    
+            if node.record_history:
+                self.metrics.node_histories[node.name] = node.history
+
+    def load_histories(self, histories: Dict[str, Dict[str, List[Any]]], weeks: int):
+        """
+        Load complete node histories computed outside the SimPy processes.
+
+        Produces the same metrics as calling collect_current_metrics at the
+        end of weeks 1 to weeks - 1, as the progress monitor does. Only
+        the cost totals are taken from nodes that do not record history.
+
+        Args:
+            histories: Full-run history lists keyed by node name
+            weeks: Number of weeks that were simulated
+        """
+        if weeks < 2:
+            return
+
+        self.metrics.total_weeks = weeks - 1
+        self.update_count += 1
+
+        for node in self.nodes:
+            if node.record_history:
+                self.metrics.node_histories[node.name] = {
+                    key: np.asarray(values) for key, values in histories[node.name].items()
+                }
+
+        # Accumulate the running cost totals week by week
+        running = {
+            node.name: {'total_cost': 0, 'holding_cost': 0, 'backlog_cost': 0}
+            for node in self.nodes
+        }
+        for week in range(weeks):
+            for node in self.nodes:
+                history = histories[node.name]
+                sums = running[node.name]
+                for key in sums:
+                    sums[key] += history[key][week]
+
+                if week > 0:
+                    self.metrics.total_cost += sums['total_cost']
+                    self.metrics.total_holding_cost += sums['holding_cost']
+                    self.metrics.total_backlog_cost += sums['backlog_cost']
+
     def calculate_bullwhip_effect(self) -> float:
         """
         Calculate the bullwhip effect ratio.
         
+        The ratio is only recomputed after metrics are next collected.
+        
         Returns:
             Ratio of order variance amplification through the supply chain
         """
         if not self.nodes or self.metrics.total_weeks < 10:
             return 0.0
         
+        if self._bullwhip_count == self.update_count:
+            return self.metrics.bullwhip_ratio
+        self._bullwhip_count = self.update_count
+        
         # Get retailer (downstream) and factory (upstream) order variances
         retailer_orders = []
         factory_orders = []
@@ -116,13 +295,7 @@ class MetricsCollector:
                 factory_orders = self.metrics.node_histories[node.name]['orders_placed']
         
         if len(retailer_orders) > 1 and len(factory_orders) > 1:
-            retailer_var = np.var(retailer_orders)
-            factory_var = np.var(factory_orders)
-            
-            if retailer_var > 0:
-                self.metrics.bullwhip_ratio = factory_var / retailer_var
-            else:
-                self.metrics.bullwhip_ratio = 0.0
+            self.metrics.bullwhip_ratio = _bullwhip_ratio(retailer_orders, factory_orders)
         
         return self.metrics.bullwhip_ratio
     
@@ -130,51 +303,55 @@ class MetricsCollector:
         """
         Calculate service level metrics for each node.
         
+        The service levels are only recomputed after metrics are next
+        collected.
+        
         Returns:
             Dictionary of service levels by node
         """
+        cached = self._service_levels_cache
+        if cached is not None and cached[0] == self.update_count:
+            return cached[1]
+        
         service_levels = {}
         
         for node in self.nodes:
             history = self.metrics.node_histories[node.name]
             
-            if history['orders_received'] and history['backlog']:
-                total_demand = sum(history['orders_received'])
-                total_backlog = sum(history['backlog'])
-                stockout_weeks = sum(1 for b in history['backlog'] if b > 0)
-                
-                if total_demand > 0:
-                    fill_rate = 1 - (total_backlog / total_demand)
-                else:
-                    fill_rate = 1.0
-                
-                service_levels[node.name] = {
-                    'fill_rate': fill_rate,
-                    'stockout_weeks': stockout_weeks,
-                    'stockout_percentage': stockout_weeks / max(1, len(history['backlog']))
-                }
+            if len(history['orders_received']) and len(history['backlog']):
+                service_levels[node.name] = _service_level(
+                    history['orders_received'],
+                    history['backlog']
+                )
         
         # Calculate overall fill rate
         if service_levels:
-            avg_fill_rate = np.mean([sl['fill_rate'] for sl in service_levels.values()])
+            avg_fill_rate = sum(sl['fill_rate'] for sl in service_levels.values()) / len(service_levels)
             self.metrics.fill_rate = avg_fill_rate
             
             total_stockout_weeks = sum(sl['stockout_weeks'] for sl in service_levels.values())
             self.metrics.stockout_weeks = total_stockout_weeks
         
+        self._service_levels_cache = (self.update_count, service_levels)
         return service_levels
     
     def get_summary_statistics(self) -> Dict[str, Any]:
         """
         Get summary statistics for the simulation.
         
+        The summary is reused until metrics are next collected.
+        
         Returns:
             Dictionary of summary statistics
         """
+        cached = self._summary_cache
+        if cached is not None and cached[0] == self.update_count:
+            return cached[1]
+        
         self.calculate_bullwhip_effect()
         service_levels = self.calculate_service_levels()
         
-        return {
+        summary = {
             'simulation_id': self.simulation_id,
             'total_weeks': self.metrics.total_weeks,
             'total_cost': self.metrics.total_cost,
@@ -186,31 +363,45 @@ class MetricsCollector:
             'bullwhip_ratio': self.metrics.bullwhip_ratio,
             'service_levels': service_levels
         }
+        self._summary_cache = (self.update_count, summary)
+        return summary
     
     def get_time_series_data(self) -> pd.DataFrame:
         """
         Get time series data for all nodes as a pandas DataFrame.
         
+        Columns are assembled as whole arrays across nodes, so the frame is
+        built in one step rather than concatenated per node.
+        
         Returns:
             DataFrame with time series data
         """
-        data_frames = []
+        histories = [
+            (node_name, history)
+            for node_name, history in self.metrics.node_histories.items()
+            if len(history['week'])  # Only if there's data
+        ]
         
-        for node_name, history in self.metrics.node_histories.items():
-            if history['week']:  # Only if there's data
-                df = pd.DataFrame(history)
-                df['node'] = node_name
-                data_frames.append(df)
-        
-        if data_frames:
-            return pd.concat(data_frames, ignore_index=True)
-        else:
+        if not histories:
             return pd.DataFrame()
+        
+        columns = {
+            key: np.concatenate([history[key] for _, history in histories])
+            for key in histories[0][1]
+        }
+        columns['node'] = np.repeat(
+            np.array([node_name for node_name, _ in histories], dtype=object),
+            [len(history['week']) for _, history in histories]
+        )
+        # The concatenated columns are new arrays, so pandas need not copy them
+        return pd.DataFrame(columns, copy=False)
     
     def get_node_summary(self, node_name: str) -> Dict[str, Any]:
         """
         Get summary statistics for a specific node.
         
+        The summary is reused until metrics are next collected.
+        
         Args:
             node_name: Name of the node
             
@@ -222,20 +413,50 @@ class MetricsCollector:
         
         history = self.metrics.node_histories[node_name]
         
-        if not history['week']:
+        if not len(history['week']):
             return {}
         
-        return {
+        cached = self._node_summary_cache.get(node_name)
+        if cached is not None and cached[0] == self.update_count:
+            return cached[1]
+        
+        summary = {
             'node': node_name,
-            'average_inventory': np.mean(history['inventory']),
-            'max_inventory': max(history['inventory']),
-            'min_inventory': min(history['inventory']),
-            'average_backlog': np.mean(history['backlog']),
-            'max_backlog': max(history['backlog']),
-            'total_orders_placed': sum(history['orders_placed']),
-            'total_orders_received': sum(history['orders_received']),
-            'total_cost': sum(history['total_cost']),
-            'average_cost_per_week': np.mean(history['total_cost'])
+            'average_inventory': history['inventory'].mean(),
+            'max_inventory': history['inventory'].max().item(),
+            'min_inventory': history['inventory'].min().item(),
+            'average_backlog': history['backlog'].mean(),
+            'max_backlog': history['backlog'].max().item(),
+            'total_orders_placed': history['orders_placed'].sum().item(),
+            'total_orders_received': history['orders_received'].sum().item(),
+            'total_cost': history['total_cost'].sum().item(),
+            'average_cost_per_week': history['total_cost'].mean()
+        }
+        self._node_summary_cache[node_name] = (self.update_count, summary)
+        return summary
+    
+    def get_node_summary_view(self, node_name: str) -> NodeSummaryView:
+        """
+        Get a lazily computed summary for a specific node.
+        
+        Args:
+            node_name: Name of the node
+            
+        Returns:
+            Mapping with the keys of get_node_summary
+        """
+        return NodeSummaryView(self, node_name)
+    
+    def get_node_histories(self) -> Dict[str, Dict[str, List[Any]]]:
+        """
+        Get the node histories as plain lists, ready for serialization.
+        
+        Returns:
+            History lists per field, keyed by node name
+        """
+        return {
+            node_name: {key: values.tolist() for key, values in history.items()}
+            for node_name, history in self.metrics.node_histories.items()
         }
     
     def export_to_json(self) -> Dict[str, Any]:
@@ -251,7 +472,7 @@ class MetricsCollector:
                 node.name: self.get_node_summary(node.name) 
                 for node in self.nodes
             },
-            'time_series': self.metrics.node_histories
+            'time_series': self.get_node_histories()
         }
     
     def finalize(self):
@@ -4,7 +4,10 @@ from .controller import (
     GameController, GameState, GameStatus, GameRules, 
     Player, PlayerRole
 )
-from .policy_manager import PolicyManager, PolicyType, PolicyParameters
+from .policy_manager import (
+    PolicyManager, PolicyType, PolicyParameters,
+    ScheduledPolicy, ContextPolicy
+)
 from .scenario_manager import (
     ScenarioManager, ScenarioType, DifficultyLevel,
     ScenarioDefinition
@@ -20,6 +23,8 @@ __all__ = [
     "PolicyManager",
     "PolicyType",
     "PolicyParameters",
+    "ScheduledPolicy",
+    "ContextPolicy",
     "ScenarioManager",
     "ScenarioType",
     "DifficultyLevel",
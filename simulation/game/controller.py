@@ -1,17 +1,149 @@
 """Game Controller for managing game rules and state."""
 
-import uuid
+import bisect
+import itertools
+from functools import partial
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Callable
+from typing import Deque, Dict, List, Optional, Any, Callable, TextIO
+from collections import deque
+from collections.abc import Iterator, Mapping
 import json
+import time
+import numpy as np
 
 from ..engine import SimulationEnvironment
 from ..engine.core import SimulationConfig, SimulationStatus
+from .decisionlog import DecisionLog
+from .idpool import IdPool
 
 
-class GameStatus(Enum):
+# Shared source of game and player identifiers
+_id_pool = IdPool()
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert values the json module cannot encode natively."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def _export_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an event or decision record, turning its ts_ns into an ISO timestamp."""
+    exported = dict(record)
+    ts_ns = exported.pop("ts_ns", None)
+    if ts_ns is not None:
+        exported["timestamp"] = datetime.fromtimestamp(ts_ns / 1e9).isoformat()
+    return exported
+
+
+def _copy_current_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a cached game state so callers cannot change the cached one.
+    
+    Args:
+        state: Game state from GameController.get_current_state
+        
+    Returns:
+        Copy of the state with its own nodes, metrics and players
+    """
+    return {
+        **state,
+        "nodes": {name: dict(node) for name, node in state["nodes"].items()},
+        "metrics": dict(state["metrics"]),
+        "players": [dict(player) for player in state["players"]]
+    }
+
+
+def _json_key(key: Any) -> str:
+    """
+    Convert a dict key to the string json.dumps writes for it.
+    
+    Args:
+        key: Dict key
+        
+    Returns:
+        Key as a string
+    """
+    if isinstance(key, str):
+        return key
+    if isinstance(key, float):
+        return json.dumps(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+
+def _write_json(f: TextIO, value: Any, indent: Optional[int], level: int = 0):
+    """
+    Write a value as JSON, producing the same text as json.dumps.
+    
+    Dicts are written key by key and iterators item by item, so iterators
+    of records are encoded without first building the whole list. Any
+    other value is encoded in one json.dumps call.
+    
+    Args:
+        f: File to write to
+        value: Value to encode
+        indent: Indentation as for json.dumps
+        level: Nesting depth of the value
+    """
+    is_dict = isinstance(value, dict)
+    if is_dict and value:
+        items = iter(value.items())
+        open_, close = "{", "}"
+    elif isinstance(value, Iterator):
+        first = next(value, _write_json)
+        if first is _write_json:
+            f.write("[]")
+            return
+        items = itertools.chain((first,), value)
+        open_, close = "[", "]"
+    else:
+        text = json.dumps(value, indent=indent, default=_json_default)
+        if indent is not None and level:
+            # Encoded strings never contain raw newlines
+            text = text.replace("\n", "\n" + " " * (indent * level))
+        f.write(text)
+        return
+    
+    if indent is None:
+        separator, inner, outer = ", ", "", ""
+    else:
+        inner = "\n" + " " * (indent * (level + 1))
+        outer = "\n" + " " * (indent * level)
+        separator = "," + inner
+    
+    f.write(open_ + inner)
+    for i, item in enumerate(items):
+        if i:
+            f.write(separator)
+        if is_dict:
+            key, item = item
+            f.write(json.dumps(_json_key(key)) + ": ")
+        _write_json(f, item, indent, level + 1)
+    f.write(outer + close)
+
+
+# Bit for each win condition, with the name it is reported under
+_WIN_CONDITIONS = (
+    (1, "cost_target"),
+    (2, "service_target"),
+    (4, "bullwhip_target")
+)
+
+
+class GameStatus(str, Enum):
     """Game status enumeration."""
     SETUP = "setup"
     READY = "ready"
@@ -21,7 +153,7 @@ class GameStatus(Enum):
     ABANDONED = "abandoned"
 
 
-class PlayerRole(Enum):
+class PlayerRole(str, Enum):
     """Player roles in the supply chain."""
     RETAILER = "retailer"
     WHOLESALER = "wholesaler"
@@ -31,7 +163,16 @@ class PlayerRole(Enum):
     OBSERVER = "observer"  # For viewing only
 
 
-@dataclass
+# Name of the simulation node each single-node role plays
+_NODE_NAMES = {
+    PlayerRole.RETAILER: "Retailer",
+    PlayerRole.WHOLESALER: "Wholesaler",
+    PlayerRole.DISTRIBUTOR: "Distributor",
+    PlayerRole.FACTORY: "Factory"
+}
+
+
+@dataclass(slots=True)
 class Player:
     """Represents a player in the game."""
     id: str
@@ -44,7 +185,7 @@ class Player:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class GameRules:
     """Game rules and win conditions."""
     max_weeks: int = 52
@@ -68,9 +209,12 @@ class GameRules:
     # Time limits
     decision_time_limit: Optional[int] = None  # Seconds per decision
     game_time_limit: Optional[int] = None  # Total game time in minutes
+    
+    # Record game events (off for headless runs nobody inspects)
+    enable_event_log: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Current state of the game."""
     game_id: str
@@ -94,8 +238,8 @@ class GameState:
     node_states: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     
     # History
-    decision_history: List[Dict[str, Any]] = field(default_factory=list)
-    event_log: List[Dict[str, Any]] = field(default_factory=list)
+    decision_history: DecisionLog = field(default_factory=DecisionLog)
+    event_log: Deque[Dict[str, Any]] = field(default_factory=deque)
     
     # Metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -116,7 +260,7 @@ class GameController:
             game_rules: Rules and win conditions for the game
             simulation_config: Configuration for the simulation
         """
-        self.game_id = str(uuid.uuid4())
+        self.game_id = _id_pool.next_id()
         self.rules = game_rules or GameRules()
         self.simulation_config = simulation_config or SimulationConfig(weeks=self.rules.max_weeks)
         
@@ -140,6 +284,55 @@ class GameController:
         # Decision queue for human players
         self.pending_decisions: Dict[str, Dict[str, Any]] = {}
         self.decision_callbacks: Dict[str, Callable] = {}
+        
+        # Leaderboard keys (-score, join order, player_id) kept sorted,
+        # plus each player's current key for removal on score updates
+        self._leaderboard: List[tuple] = []
+        self._leaderboard_keys: Dict[str, tuple] = {}
+        
+        # Exported rules and player dicts, rebuilt only when the values
+        # they export change
+        self._rules_dict_cache: Optional[tuple] = None
+        self._player_dict_cache: Dict[str, tuple] = {}
+        
+        # Number of active human players
+        self._human_count = 0
+        
+        # Role to node lookups, filled in when the simulation is created
+        self._player_node_map: Dict[PlayerRole, Any] = {}
+        self._upstream_map: Dict[PlayerRole, Any] = {}
+        
+        # Player views for the current week, keyed by player ID
+        self._player_view_cache: Dict[str, tuple] = {}
+        
+        # Node states from the last get_current_state, keyed by the
+        # simulation clock and metrics update count they were taken at
+        self._node_states_cache: Optional[tuple] = None
+        
+        # Last get_current_state result; week completion and score changes
+        # clear it
+        self._current_state_cache: Optional[tuple] = None
+        
+        # Open NDJSON event log file, if events are being streamed
+        self._event_log_file: Optional[TextIO] = None
+    
+    @classmethod
+    def ai_only(
+        cls,
+        game_rules: Optional[GameRules] = None,
+        simulation_config: Optional[SimulationConfig] = None
+    ) -> "GameController":
+        """
+        Create a controller for a game played only by AI players.
+        
+        Args:
+            game_rules: Rules and win conditions for the game
+            simulation_config: Configuration for the simulation
+            
+        Returns:
+            Controller without the human decision paths
+        """
+        return _AIOnlyController(game_rules, simulation_config)
     
     def add_player(
         self,
@@ -158,7 +351,7 @@ class GameController:
         Returns:
             The created Player object
         """
-        player_id = str(uuid.uuid4())
+        player_id = _id_pool.next_id()
         player = Player(
             id=player_id,
             name=name,
@@ -167,14 +360,17 @@ class GameController:
         )
         
         self.state.players[player_id] = player
+        self._set_player_score(player, player.score)
+        if is_human:
+            self._human_count += 1
         
-        self._log_event({
-            "type": "player_added",
-            "player_id": player_id,
-            "name": name,
-            "role": role.value,
-            "is_human": is_human
-        })
+        self._log_event(
+            "player_added",
+            player_id=player_id,
+            name=name,
+            role=role.value,
+            is_human=is_human
+        )
         
         return player
     
@@ -182,13 +378,15 @@ class GameController:
         """Remove a player from the game."""
         if player_id in self.state.players:
             player = self.state.players[player_id]
+            if player.is_human and player.is_active:
+                self._human_count -= 1
             player.is_active = False
             
-            self._log_event({
-                "type": "player_removed",
-                "player_id": player_id,
-                "name": player.name
-            })
+            self._log_event(
+                "player_removed",
+                player_id=player_id,
+                name=player.name
+            )
     
     def initialize_game(self):
         """Initialize the game and prepare for start."""
@@ -202,16 +400,29 @@ class GameController:
         self.simulation.on_week_complete = self._on_simulation_week_complete
         self.simulation.on_simulation_complete = self._on_simulation_complete
         
+        # Nodes played by each role, and the node each role orders from
+        self._player_node_map = {
+            PlayerRole.RETAILER: self.simulation.retailer,
+            PlayerRole.WHOLESALER: self.simulation.wholesaler,
+            PlayerRole.DISTRIBUTOR: self.simulation.distributor,
+            PlayerRole.FACTORY: self.simulation.factory
+        }
+        self._upstream_map = {
+            PlayerRole.RETAILER: self.simulation.wholesaler,
+            PlayerRole.WHOLESALER: self.simulation.distributor,
+            PlayerRole.DISTRIBUTOR: self.simulation.factory
+        }
+        
         # Configure policies based on players
         self._configure_node_policies()
         
         self.state.status = GameStatus.READY
         
-        self._log_event({
-            "type": "game_initialized",
-            "game_id": self.game_id,
-            "rules": self._rules_to_dict()
-        })
+        self._log_event(
+            "game_initialized",
+            game_id=self.game_id,
+            rules=self._rules_to_dict()
+        )
     
     def start_game(self):
         """Start the game."""
@@ -221,11 +432,11 @@ class GameController:
         self.state.status = GameStatus.IN_PROGRESS
         self.state.start_time = datetime.now()
         
-        self._log_event({
-            "type": "game_started",
-            "game_id": self.game_id,
-            "players": len(self.state.players)
-        })
+        self._log_event(
+            "game_started",
+            game_id=self.game_id,
+            players=len(self.state.players)
+        )
         
         # Start simulation
         if self.simulation:
@@ -245,10 +456,10 @@ class GameController:
             if self.simulation:
                 self.simulation.pause()
             
-            self._log_event({
-                "type": "game_paused",
-                "week": self.state.current_week
-            })
+            self._log_event(
+                "game_paused",
+                week=self.state.current_week
+            )
     
     def resume_game(self):
         """Resume a paused game."""
@@ -258,10 +469,10 @@ class GameController:
             if self.simulation:
                 self.simulation.resume()
             
-            self._log_event({
-                "type": "game_resumed",
-                "week": self.state.current_week
-            })
+            self._log_event(
+                "game_resumed",
+                week=self.state.current_week
+            )
     
     def end_game(self, reason: str = "completed"):
         """
@@ -277,12 +488,14 @@ class GameController:
             # Calculate final scores
             self._calculate_final_scores()
             
-            self._log_event({
-                "type": "game_ended",
-                "reason": reason,
-                "final_week": self.state.current_week,
-                "total_cost": self.state.total_cost
-            })
+            self._log_event(
+                "game_ended",
+                reason=reason,
+                final_week=self.state.current_week,
+                total_cost=self.state.total_cost
+            )
+            
+            self.close_event_log()
             
             if self.on_game_complete:
                 self.on_game_complete(self.state)
@@ -308,25 +521,25 @@ class GameController:
         player = self.state.players[player_id]
         
         # Record decision
-        self.state.decision_history.append({
-            "week": self.state.current_week,
-            "player_id": player_id,
-            "role": player.role.value,
-            "decision": decision,
-            "timestamp": datetime.now().isoformat()
-        })
+        self.state.decision_history.append(
+            self.state.current_week,
+            player_id,
+            player.role.value,
+            decision,
+            time.time_ns()
+        )
         
         player.decisions_made += 1
         
         # Apply decision to simulation
         self._apply_player_decision(player, decision)
         
-        self._log_event({
-            "type": "decision_submitted",
-            "player_id": player_id,
-            "week": self.state.current_week,
-            "decision": decision
-        })
+        self._log_event(
+            "decision_submitted",
+            player_id=player_id,
+            week=self.state.current_week,
+            decision=decision
+        )
         
         if self.on_player_decision:
             self.on_player_decision(player_id, decision)
@@ -341,6 +554,10 @@ class GameController:
         """
         Get the game state from a player's perspective.
         
+        Views are reused within a week until the game status, the player
+        or the information sharing rule changes; week completion clears
+        them. Each call returns a copy, so callers may change it.
+        
         Args:
             player_id: ID of the player
             
@@ -351,7 +568,34 @@ class GameController:
             return {}
         
         player = self.state.players[player_id]
+        key = (
+            self.state.current_week,
+            self.state.status,
+            player.score,
+            player.name,
+            player.role,
+            self.rules.enable_information_sharing
+        )
+        cached = self._player_view_cache.get(player_id)
+        if cached is not None and cached[0] == key:
+            view = cached[1]
+        else:
+            view = self._build_player_view(player)
+            self._player_view_cache[player_id] = (key, view)
         
+        # Node states are shared with the game state, as they always were
+        return {**view, "player": dict(view["player"]), "metrics": dict(view["metrics"])}
+    
+    def _build_player_view(self, player: Player) -> Dict[str, Any]:
+        """
+        Build a player's view of the game state.
+        
+        Args:
+            player: Player to build the view for
+            
+        Returns:
+            Game state visible to the player
+        """
         # Basic game info
         view = {
             "game_id": self.game_id,
@@ -371,7 +615,7 @@ class GameController:
             if player.role == PlayerRole.ALL:
                 view["nodes"] = self.state.node_states
             else:
-                node_name = player.role.value.capitalize()
+                node_name = _NODE_NAMES.get(player.role)
                 if node_name in self.state.node_states:
                     view["node_state"] = self.state.node_states[node_name]
             
@@ -405,10 +649,10 @@ class GameController:
         total_holding = 0.0
         total_backlog = 0.0
         
+        # Same arithmetic as node.calculate_costs, without a dict per node
         for node in self.simulation.nodes:
-            costs = node.calculate_costs()
-            total_holding += costs["holding_cost"]
-            total_backlog += costs["backlog_cost"]
+            total_holding += node.inventory * node.holding_cost_per_unit
+            total_backlog += node.backlog * node.backlog_cost_per_unit
         
         # Apply penalty multiplier
         total_backlog *= self.rules.cost_penalty_multiplier
@@ -426,27 +670,28 @@ class GameController:
         """
         Get the current state of the game.
         
+        The state is reused until the week, status, player count or node
+        states change, or costs and scores are updated. Each call returns
+        a copy, so callers may change it.
+        
         Returns:
             Dictionary containing current game state
         """
         # Get node states from simulation if available
-        node_states = {}
-        if self.simulation:
-            for node in self.simulation.nodes:
-                node_states[node.name] = {
-                    "inventory": node.inventory,
-                    "backlog": node.backlog,
-                    "last_order": node.orders_placed[-1].quantity if node.orders_placed else 0,
-                    "pending_orders": len(node.pending_orders),
-                    "incoming_shipments": len(node.incoming_shipments)
-                }
+        node_states = self._simulation_node_states() if self.simulation else {}
+        nodes = node_states or self.state.node_states
         
-        return {
+        key = (self.state.current_week, self.state.status, len(self.state.players))
+        cached = self._current_state_cache
+        if cached is not None and cached[0] == key and cached[1] is nodes:
+            return _copy_current_state(cached[2])
+        
+        current_state = {
             "game_id": self.game_id,
             "current_week": self.state.current_week,
             "total_weeks": self.state.total_weeks,
             "status": self.state.status.value,
-            "nodes": node_states or self.state.node_states,
+            "nodes": nodes,
             "metrics": {
                 "total_cost": self.state.total_cost,
                 "service_level": self.state.service_level,
@@ -462,33 +707,77 @@ class GameController:
                 for p in self.state.players.values()
             ]
         }
+        
+        self._current_state_cache = (key, nodes, current_state)
+        return _copy_current_state(current_state)
     
-    def check_win_conditions(self) -> Dict[str, Any]:
+    def _simulation_node_states(self) -> Dict[str, Dict[str, Any]]:
         """
-        Check if win conditions are met.
+        Snapshot the simulation's node states.
+        
+        Nodes only change while the simulation steps, so the snapshot is
+        reused until the clock moves or the metrics collector is updated.
         
         Returns:
-            Dictionary with win condition status
+            Node state dictionaries keyed by node name
         """
-        conditions_met = {}
-        
-        if self.rules.minimize_cost and self.rules.max_total_cost:
-            conditions_met["cost_target"] = self.state.total_cost <= self.rules.max_total_cost
+        key = (self.simulation.env.now, self.simulation.metrics_collector.update_count)
+        cached = self._node_states_cache
+        if cached is not None and cached[0] == key and cached[1] is self.simulation:
+            return cached[2]
         
-        if self.rules.maximize_service_level:
-            conditions_met["service_target"] = self.state.service_level >= self.rules.target_service_level
+        node_states = {}
+        for node in self.simulation.nodes:
+            node_states[node.name] = {
+                "inventory": node.inventory,
+                "backlog": node.backlog,
+                "last_order": node.orders_placed[-1].quantity if node.orders_placed else 0,
+                "pending_orders": node.count_pending_orders(),
+                "incoming_shipments": node.count_incoming_shipments()
+            }
         
-        if self.rules.minimize_bullwhip:
-            conditions_met["bullwhip_target"] = self.state.bullwhip_ratio <= 2.0
+        self._node_states_cache = (key, self.simulation, node_states)
+        return node_states
+    
+    def check_win_conditions(self) -> Dict[str, Any]:
+        """
+        Check if win conditions are met.
         
-        all_met = all(conditions_met.values()) if conditions_met else False
+        Returns:
+            Dictionary with win condition status
+        """
+        required = self._required_win_conditions()
+        met = self._win_conditions_met() & required
         
         return {
-            "all_conditions_met": all_met,
-            "conditions": conditions_met,
-            "game_complete": self.state.current_week >= self.state.total_weeks
+            "all_conditions_met": required != 0 and met == required,
+            "conditions": {name: bool(met & bit) for bit, name in _WIN_CONDITIONS if required & bit},
+            "game_complete": self._game_complete()
         }
     
+    def _required_win_conditions(self) -> int:
+        """Bitmask of the win conditions the rules enable."""
+        rules = self.rules
+        return (
+            (1 if rules.minimize_cost and rules.max_total_cost else 0)
+            | (2 if rules.maximize_service_level else 0)
+            | (4 if rules.minimize_bullwhip else 0)
+        )
+    
+    def _win_conditions_met(self) -> int:
+        """Bitmask of the win conditions the current state satisfies."""
+        state = self.state
+        max_total_cost = self.rules.max_total_cost
+        return (
+            (1 if max_total_cost and state.total_cost <= max_total_cost else 0)
+            | (2 if state.service_level >= self.rules.target_service_level else 0)
+            | (4 if state.bullwhip_ratio <= 2.0 else 0)
+        )
+    
+    def _game_complete(self) -> bool:
+        """Whether the game has reached its last week."""
+        return self.state.current_week >= self.state.total_weeks
+    
     def get_leaderboard(self) -> List[Dict[str, Any]]:
         """
         Get player leaderboard.
@@ -498,9 +787,10 @@ class GameController:
         """
         leaderboard = []
         
-        for player in self.state.players.values():
+        for rank, (_, _, player_id) in enumerate(self._leaderboard, start=1):
+            player = self.state.players[player_id]
             leaderboard.append({
-                "rank": 0,  # Will be set after sorting
+                "rank": rank,
                 "player_id": player.id,
                 "name": player.name,
                 "role": player.role.value,
@@ -508,13 +798,6 @@ class GameController:
                 "decisions_made": player.decisions_made
             })
         
-        # Sort by score (higher is better)
-        leaderboard.sort(key=lambda x: x["score"], reverse=True)
-        
-        # Set ranks
-        for i, entry in enumerate(leaderboard):
-            entry["rank"] = i + 1
-        
         return leaderboard
     
     def export_game_data(self) -> Dict[str, Any]:
@@ -524,6 +807,20 @@ class GameController:
         Returns:
             Complete game data as dictionary
         """
+        game_data = self._game_data()
+        history = game_data["history"]
+        history["decisions"] = list(history["decisions"])
+        history["events"] = list(history["events"])
+        return game_data
+    
+    def _game_data(self) -> Dict[str, Any]:
+        """
+        Build the exported game data with its history left as iterators.
+        
+        Returns:
+            Game data dictionary whose decision and event lists are
+            generators of exported records
+        """
         return {
             "game_id": self.game_id,
             "status": self.state.status.value,
@@ -537,17 +834,125 @@ class GameController:
                 "bullwhip_ratio": self.state.bullwhip_ratio
             },
             "history": {
-                "decisions": self.state.decision_history,
-                "events": self.state.event_log
+                "decisions": (_export_record(d) for d in self.state.decision_history),
+                "events": (_export_record(e) for e in self.state.event_log)
             },
             "results": self.simulation.get_results() if self.simulation else None
         }
     
-    def save_game(self, filepath: str):
-        """Save game state to file."""
-        game_data = self.export_game_data()
+    def save_game(self, filepath: str, indent: Optional[int] = 2):
+        """
+        Save game state to file.
+        
+        Paths ending in ".ndjson" or ".jsonl" are written record by record
+        with save_game_streaming instead.
+        
+        Args:
+            filepath: Path of the JSON file to write
+            indent: Indentation for pretty-printing, or None for compact
+                output, which uses the much faster C encoder
+        """
+        if filepath.endswith((".ndjson", ".jsonl")):
+            self.save_game_streaming(filepath)
+            return
+        
+        # Decisions and events are encoded one record at a time as they
+        # are written, rather than collected into lists first
         with open(filepath, 'w') as f:
-            json.dump(game_data, f, indent=2, default=str)
+            _write_json(f, self._game_data(), indent)
+    
+    def save_game_streaming(self, filepath: str):
+        """
+        Save game state to a newline-delimited JSON file.
+        
+        Records are encoded and written one at a time, so memory use does
+        not grow with the length of the game. The first line holds the game
+        metadata and summary results, followed by one line per decision,
+        per event and per simulated week, each tagged with a "record" key.
+        
+        Args:
+            filepath: Path of the NDJSON file to write
+        """
+        results = self.simulation.get_results() if self.simulation else None
+        
+        def write(f, record: Dict[str, Any]):
+            f.write(json.dumps(record, default=_json_default))
+            f.write("\n")
+        
+        with open(filepath, 'w') as f:
+            write(f, {
+                "record": "game",
+                "game_id": self.game_id,
+                "status": self.state.status.value,
+                "rules": self._rules_to_dict(),
+                "players": [self._player_to_dict(p) for p in self.state.players.values()],
+                "state": {
+                    "current_week": self.state.current_week,
+                    "total_weeks": self.state.total_weeks,
+                    "total_cost": self.state.total_cost,
+                    "service_level": self.state.service_level,
+                    "bullwhip_ratio": self.state.bullwhip_ratio
+                },
+                "summary": results["summary"] if results else None,
+                "node_summaries": results["node_summaries"] if results else None
+            })
+            
+            for decision in self.state.decision_history:
+                write(f, {"record": "decision", **_export_record(decision)})
+            
+            for event in self.state.event_log:
+                write(f, {"record": "event", **_export_record(event)})
+            
+            if results:
+                time_series = results["time_series"]
+                weeks = max((len(h['week']) for h in time_series.values()), default=0)
+                for week in range(weeks):
+                    write(f, {
+                        "record": "week",
+                        "week": week,
+                        "nodes": {
+                            node: {key: values[week] for key, values in history.items() if key != 'week'}
+                            for node, history in time_series.items()
+                            if week < len(history['week'])
+                        }
+                    })
+    
+    def open_event_log(self, filepath: str, keep_last: Optional[int] = None):
+        """
+        Stream game events to a newline-delimited JSON file as they are logged.
+        
+        Events already logged are written first. Each later event is
+        encoded once and appended to a buffered file, so saving the game
+        does not need to re-encode the event log. The file is closed when
+        the game ends.
+        
+        Since the file holds every event, the in-memory log can be capped
+        with keep_last; older events then drop out of state.event_log and
+        of exports, and are only found in the file.
+        
+        Args:
+            filepath: Path of the NDJSON file to write
+            keep_last: Number of recent events to keep in memory, or None
+                to keep them all
+        """
+        self.close_event_log()
+        self._event_log_file = open(filepath, 'w', buffering=1 << 16)
+        for event in self.state.event_log:
+            self._write_event(event)
+        
+        if keep_last is not None:
+            self.state.event_log = deque(self.state.event_log, maxlen=keep_last)
+    
+    def close_event_log(self):
+        """Flush and close the event log file, if one is open."""
+        if self._event_log_file is not None:
+            self._event_log_file.close()
+            self._event_log_file = None
+    
+    def _write_event(self, event: Dict[str, Any]):
+        """Append an event to the open event log file."""
+        self._event_log_file.write(json.dumps(_export_record(event), default=_json_default))
+        self._event_log_file.write("\n")
     
     def _configure_node_policies(self):
         """Configure node policies based on players."""
@@ -556,17 +961,14 @@ class GameController:
         
         # Map players to nodes and set appropriate policies
         for player in self.state.players.values():
-            if player.role == PlayerRole.RETAILER:
-                if player.is_human:
-                    self.simulation.retailer.order_policy = lambda week: self._request_human_decision(player.id, week)
-            elif player.role == PlayerRole.WHOLESALER:
-                if player.is_human:
-                    self.simulation.wholesaler.order_policy = lambda week: self._request_human_decision(player.id, week)
-            # Continue for other roles...
+            # Observers have no node to control
+            node = self._player_node_map.get(player.role)
+            if player.is_human and node is not None:
+                node.order_policy = partial(self._request_human_decision, player.id)
     
     def _has_human_players(self) -> bool:
-        """Check if there are human players."""
-        return any(p.is_human for p in self.state.players.values())
+        """Check if there are active human players."""
+        return self._human_count > 0
     
     def _run_interactive_simulation(self):
         """Run simulation with human interaction."""
@@ -621,14 +1023,7 @@ class GameController:
         if not self.simulation:
             return 0.0
         
-        # Map role to upstream node
-        upstream_map = {
-            PlayerRole.RETAILER: self.simulation.wholesaler,
-            PlayerRole.WHOLESALER: self.simulation.distributor,
-            PlayerRole.DISTRIBUTOR: self.simulation.factory
-        }
-        
-        upstream = upstream_map.get(role)
+        upstream = self._upstream_map.get(role)
         return upstream.backlog if upstream else 0.0
     
     def _get_downstream_demand(self, role: PlayerRole) -> float:
@@ -645,20 +1040,45 @@ class GameController:
         max_possible_score = 10000.0
         cost_penalty = min(self.state.total_cost, max_possible_score)
         
+        # Score based on performance
+        base_score = max_possible_score - cost_penalty
+        
+        # Bonus for service level
+        service_bonus = self.state.service_level * 1000
+        
+        # Penalty for bullwhip effect
+        bullwhip_penalty = min(self.state.bullwhip_ratio * 100, 1000)
+        
+        # Every player is scored on the shared game outcome
+        score = max(0, base_score + service_bonus - bullwhip_penalty)
         for player in self.state.players.values():
-            # Score based on performance
-            base_score = max_possible_score - cost_penalty
-            
-            # Bonus for service level
-            service_bonus = self.state.service_level * 1000
-            
-            # Penalty for bullwhip effect
-            bullwhip_penalty = min(self.state.bullwhip_ratio * 100, 1000)
-            
-            player.score = max(0, base_score + service_bonus - bullwhip_penalty)
+            self._set_player_score(player, score)
+    
+    def _set_player_score(self, player: Player, score: float):
+        """
+        Update a player's score and its position in the leaderboard.
+        
+        Args:
+            player: Player to update
+            score: New score (higher is better)
+        """
+        old_key = self._leaderboard_keys.get(player.id)
+        if old_key is None:
+            join_order = len(self._leaderboard_keys)
+        else:
+            join_order = old_key[1]
+            del self._leaderboard[bisect.bisect_left(self._leaderboard, old_key)]
+        
+        player.score = score
+        self._current_state_cache = None
+        key = (-score, join_order, player.id)
+        bisect.insort(self._leaderboard, key)
+        self._leaderboard_keys[player.id] = key
     
     def _on_simulation_week_complete(self, sim_state: Dict[str, Any]):
         """Handle simulation week completion."""
+        self._player_view_cache.clear()
+        self._current_state_cache = None
         self.state.current_week = sim_state["current_week"]
         
         # Update costs
@@ -668,18 +1088,18 @@ class GameController:
         self.state.total_backlog_cost = costs["backlog_cost"]
         
         # Update metrics
-        if "metrics" in sim_state:
-            metrics = sim_state["metrics"]
+        metrics = sim_state.get("metrics")
+        if metrics is not None:
             self.state.service_level = metrics.get("fill_rate", 1.0)
             self.state.bullwhip_ratio = metrics.get("bullwhip_ratio", 0.0)
         
         # Update node states
-        if "nodes" in sim_state:
-            self.state.node_states = sim_state["nodes"]
+        nodes = sim_state.get("nodes")
+        if nodes is not None:
+            self.state.node_states = nodes
         
-        # Check win conditions
-        win_status = self.check_win_conditions()
-        if win_status["game_complete"]:
+        # Only completion ends the game, so the full win status is not built
+        if self._game_complete():
             self.end_game("completed")
         
         # Trigger callback
@@ -693,32 +1113,80 @@ class GameController:
     
     def _process_simulation_results(self, results: Dict[str, Any]):
         """Process final simulation results."""
+        self._player_view_cache.clear()
+        self._current_state_cache = None
         if "summary" in results:
             summary = results["summary"]
             self.state.total_cost = summary.get("total_cost", 0)
             self.state.service_level = summary.get("fill_rate", 1.0)
             self.state.bullwhip_ratio = summary.get("bullwhip_ratio", 0.0)
     
-    def _log_event(self, event: Dict[str, Any]):
-        """Log a game event."""
-        event["timestamp"] = datetime.now().isoformat()
+    def _log_event(self, event_type: str, **fields: Any):
+        """
+        Log a game event, stamped with the wall clock in nanoseconds.
+        
+        Nothing is built when the rules disable the event log.
+        
+        Args:
+            event_type: Value of the event's "type" key
+            **fields: Other event fields
+        """
+        if not self.rules.enable_event_log:
+            return
+        
+        event = {"type": event_type, **fields}
+        event["ts_ns"] = time.time_ns()
         event["week"] = self.state.current_week
         self.state.event_log.append(event)
+        
+        if self._event_log_file is not None:
+            self._write_event(event)
     
     def _rules_to_dict(self) -> Dict[str, Any]:
-        """Convert game rules to dictionary."""
-        return {
-            "max_weeks": self.rules.max_weeks,
-            "target_service_level": self.rules.target_service_level,
-            "max_total_cost": self.rules.max_total_cost,
-            "competitive_mode": self.rules.competitive_mode,
-            "collaborative_mode": self.rules.collaborative_mode,
-            "tutorial_mode": self.rules.tutorial_mode
-        }
+        """Convert game rules to dictionary, reusing it while the rules are unchanged."""
+        rules = self.rules
+        # GameRules can be changed in place, so the cache is keyed on the
+        # exported values rather than on the rules object
+        key = (
+            rules.max_weeks,
+            rules.target_service_level,
+            rules.max_total_cost,
+            rules.competitive_mode,
+            rules.collaborative_mode,
+            rules.tutorial_mode
+        )
+        cached = self._rules_dict_cache
+        if cached is None or cached[0] != key:
+            rules_dict = {
+                "max_weeks": rules.max_weeks,
+                "target_service_level": rules.target_service_level,
+                "max_total_cost": rules.max_total_cost,
+                "competitive_mode": rules.competitive_mode,
+                "collaborative_mode": rules.collaborative_mode,
+                "tutorial_mode": rules.tutorial_mode
+            }
+            cached = self._rules_dict_cache = (key, rules_dict)
+        
+        # A copy, so callers can change it without affecting later calls
+        return dict(cached[1])
     
     def _player_to_dict(self, player: Player) -> Dict[str, Any]:
-        """Convert player to dictionary."""
-        return {
+        """Convert player to dictionary, reusing it until the player changes."""
+        # Players can be changed in place, so the cache is keyed on every
+        # exported value
+        key = (
+            player.name,
+            player.role,
+            player.is_human,
+            player.is_active,
+            player.score,
+            player.decisions_made
+        )
+        cached = self._player_dict_cache.get(player.id)
+        if cached is not None and cached[0] == key:
+            return dict(cached[1])
+        
+        player_dict = {
             "id": player.id,
             "name": player.name,
             "role": player.role.value,
@@ -727,3 +1195,71 @@ class GameController:
             "score": player.score,
             "decisions_made": player.decisions_made
         }
+        self._player_dict_cache[player.id] = (key, player_dict)
+        return dict(player_dict)
+
+
+class _AIOnlyController(GameController):
+    """
+    Game controller for games without human players.
+    
+    Created by GameController.ai_only. Players are always AI and player
+    decisions are never awaited. Unless a week callback is set, the game
+    is not updated week by week: the simulation runs unobserved, so it
+    can use the array kernel, and the game state is brought up to date
+    once when the run completes.
+    """
+    
+    def add_player(
+        self,
+        name: str,
+        role: PlayerRole,
+        is_human: bool = False
+    ) -> Player:
+        """
+        Add an AI player to the game.
+        
+        Args:
+            name: Player name
+            role: Player role in the supply chain
+            is_human: Must be False
+            
+        Returns:
+            Created player object
+        """
+        if is_human:
+            raise ValueError("AI-only games cannot have human players")
+        return super().add_player(name, role, is_human=False)
+    
+    def submit_player_decision(self, player_id: str, decision: Dict[str, Any]) -> bool:
+        """AI players do not submit decisions, so none are accepted."""
+        return False
+    
+    def start_game(self):
+        """Start the game, running the simulation unobserved if nothing watches weeks."""
+        if self.simulation and self.on_week_complete is None:
+            self.simulation.on_week_complete = None
+        super().start_game()
+    
+    def _configure_node_policies(self):
+        """Leave every node on its own policy."""
+    
+    def _has_human_players(self) -> bool:
+        return False
+    
+    def _all_decisions_received(self) -> bool:
+        return True
+    
+    def _on_simulation_complete(self, results: Dict[str, Any]):
+        """Bring the game state up to date, then finish as usual."""
+        if self.simulation.on_week_complete is None:
+            sim_state = self.simulation.get_current_state()
+            self.state.current_week = sim_state["current_week"]
+            self.state.node_states = sim_state["nodes"]
+            
+            costs = self.calculate_costs()
+            self.state.total_cost = costs["total_cost"]
+            self.state.total_holding_cost = costs["holding_cost"]
+            self.state.total_backlog_cost = costs["backlog_cost"]
+        
+        super()._on_simulation_complete(results)
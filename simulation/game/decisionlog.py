@@ -0,0 +1,67 @@
+"""Columnar record of player decisions."""
+
+from array import array
+from typing import Any, Dict, Iterator, List
+
+
+class DecisionLog:
+    """
+    Stores player decisions as parallel typed columns.
+
+    Weeks and timestamps are kept in typed arrays, and player IDs and
+    roles are interned into a shared string pool so each decision only
+    stores their indices. Decision dicts are materialized only when the
+    log is iterated, in the same shape the controller used to append.
+    """
+
+    def __init__(self):
+        """Initialize an empty log."""
+        self.week = array('i')
+        self.player_idx = array('i')
+        self.role_idx = array('i')
+        self.ts_ns = array('q')
+        self.decision: List[Dict[str, Any]] = []
+        self._strings: List[str] = []
+        self._string_index: Dict[str, int] = {}
+
+    def _intern(self, value: str) -> int:
+        """Return the pool index of a string, adding it if needed."""
+        idx = self._string_index.get(value)
+        if idx is None:
+            idx = len(self._strings)
+            self._strings.append(value)
+            self._string_index[value] = idx
+        return idx
+
+    def append(self, week: int, player_id: str, role: str, decision: Dict[str, Any], ts_ns: int):
+        """
+        Record a decision.
+
+        Args:
+            week: Week the decision was made in
+            player_id: ID of the deciding player
+            role: Role value of the deciding player
+            decision: Decision data
+            ts_ns: Wall-clock time of the decision in nanoseconds
+        """
+        self.week.append(week)
+        self.player_idx.append(self._intern(player_id))
+        self.role_idx.append(self._intern(role))
+        self.decision.append(decision)
+        self.ts_ns.append(ts_ns)
+
+    def __len__(self) -> int:
+        return len(self.week)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        strings = self._strings
+        for week, player_idx, role_idx, decision, ts_ns in zip(
+            self.week, self.player_idx, self.role_idx, self.decision, self.ts_ns
+        ):
+            yield {
+                "week": week,
+                "player_id": strings[player_idx],
+                "role": strings[role_idx],
+                "decision": decision,
+                "ts_ns": ts_ns
+            }
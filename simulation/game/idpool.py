@@ -0,0 +1,72 @@
+"""Preallocated pool of random identifiers."""
+
+import os
+import threading
+import weakref
+
+
+# Live pools, refilled in a forked child so it does not hand out the
+# same identifiers as its parent
+_pools: "weakref.WeakSet[IdPool]" = weakref.WeakSet()
+
+
+class IdPool:
+    """
+    Hands out random UUID strings from a preallocated byte buffer.
+
+    A single os.urandom call fills the buffer for many identifiers, so
+    creating a game does not need its own system call. The identifiers
+    are version 4 UUIDs in the same format as str(uuid.uuid4()), but
+    are formatted straight from the bytes without building UUID objects.
+    """
+
+    def __init__(self, n: int = 1024):
+        """
+        Initialize the pool.
+
+        Args:
+            n: Number of identifiers to allocate per refill
+        """
+        self._n = n
+        self._lock = threading.Lock()
+        self._buf = os.urandom(16 * n)
+        self._idx = 0
+        _pools.add(self)
+
+    def _refill_after_fork(self):
+        """Replace the inherited buffer and lock in a forked child."""
+        # The parent's lock may have been held by a thread that does not
+        # exist in the child
+        self._lock = threading.Lock()
+        self._buf = os.urandom(16 * self._n)
+        self._idx = 0
+
+    def next_id(self) -> str:
+        """
+        Take the next identifier from the pool.
+
+        Returns:
+            UUID string
+        """
+        with self._lock:
+            if self._idx >= len(self._buf):
+                self._buf = os.urandom(16 * self._n)
+                self._idx = 0
+            raw = bytearray(self._buf[self._idx:self._idx + 16])
+            self._idx += 16
+
+        # Set the version 4 and RFC 4122 variant bits, as uuid.UUID does
+        raw[6] = (raw[6] & 0x0F) | 0x40
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        h = raw.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _refill_pools_after_fork():
+    """Refill every live pool in a forked child."""
+    for pool in list(_pools):
+        pool._refill_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refill_pools_after_fork)
@@ -1,7 +1,8 @@
 """Policy Manager for implementing different ordering policies."""
 
 from enum import Enum
-from typing import Callable, Dict, Any, Optional, List
+from typing import Callable, Deque, Dict, Any, Optional, List, Tuple
+from collections import deque
 import math
 import numpy as np
 from dataclasses import dataclass
@@ -19,9 +20,15 @@ class PolicyType(Enum):
     CUSTOM = "custom"  # User-defined policy
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PolicyParameters:
-    """Parameters for different policies."""
+    """
+    Parameters for different policies.
+    
+    Frozen, since policy managers cache values derived from them; use
+    dataclasses.replace and assign the result to PolicyManager.params to
+    change a parameter.
+    """
     # Base stock policy
     base_stock_level: int = 20
     
@@ -37,12 +44,143 @@ class PolicyParameters:
     # Forecast parameters
     forecast_horizon: int = 4
     safety_stock_multiplier: float = 1.5
+    smoothing_alpha: float = 0.3  # Exponential smoothing weight for demand level
+    smoothing_beta: float = 0.2  # Exponential smoothing weight for forecast MSE
     
     # Adaptive parameters
     learning_rate: float = 0.1
     performance_window: int = 10
 
 
+# Names reported by PolicyManager.get_policy_info, read without Enum.value
+_POLICY_NAMES: Dict[PolicyType, str] = {
+    policy_type: policy_type.value for policy_type in PolicyType
+}
+
+# Descriptions reported by PolicyManager.get_policy_info
+_POLICY_DESCRIPTIONS: Dict[PolicyType, str] = {
+    PolicyType.BASE_STOCK: "Orders up to a target inventory level",
+    PolicyType.EOQ: "Economic Order Quantity - minimizes total cost",
+    PolicyType.SS_POLICY: "(s,S) policy - order up to S when inventory falls below s",
+    PolicyType.FORECAST_BASED: "Orders based on demand forecast and safety stock",
+    PolicyType.ADAPTIVE: "Adapts ordering based on recent performance"
+}
+
+# Reported parameter names and the PolicyParameters fields they read
+_POLICY_INFO_PARAMETERS: Dict[PolicyType, Tuple[Tuple[str, str], ...]] = {
+    PolicyType.BASE_STOCK: (
+        ("base_stock_level", "base_stock_level"),
+    ),
+    PolicyType.EOQ: (
+        ("eoq_quantity", "eoq_quantity"),
+        ("holding_cost", "eoq_holding_cost"),
+        ("ordering_cost", "eoq_ordering_cost")
+    ),
+    PolicyType.SS_POLICY: (
+        ("reorder_point", "reorder_point"),
+        ("order_up_to_level", "order_up_to_level")
+    ),
+    PolicyType.FORECAST_BASED: (
+        ("forecast_horizon", "forecast_horizon"),
+        ("safety_stock_multiplier", "safety_stock_multiplier")
+    ),
+    PolicyType.ADAPTIVE: (
+        ("learning_rate", "learning_rate"),
+        ("performance_window", "performance_window")
+    )
+}
+
+class ScheduledPolicy:
+    """
+    Ordering policy with a fixed order quantity every week.
+    
+    It is called like any other policy function, and order_schedule lets
+    the simulation read all weeks at once instead of calling it weekly.
+    """
+    
+    def __init__(self, quantity: int):
+        """
+        Initialize the policy.
+        
+        Args:
+            quantity: Order quantity for every week
+        """
+        self.quantity = quantity
+    
+    def __call__(self, week: int) -> int:
+        return self.quantity
+    
+    def order_schedule(self, weeks: int) -> np.ndarray:
+        """
+        Get the order quantities for a number of weeks.
+        
+        Args:
+            weeks: Number of weeks
+            
+        Returns:
+            Array of order quantities, one per week
+        """
+        return np.full(weeks, self.quantity)
+
+
+class ContextPolicy:
+    """
+    Ordering policy that reads its node context and parameters every week.
+    
+    Calls evaluate the policy against the live context dict and the
+    manager's current parameters. order_schedule takes a snapshot of them
+    so the simulation can read all weeks at once.
+    """
+    
+    def __init__(
+        self,
+        manager: "PolicyManager",
+        policy_type: "PolicyType",
+        node_context: Dict[str, Any],
+        custom_params: Dict[str, Any]
+    ):
+        """
+        Initialize the policy.
+        
+        Args:
+            manager: Policy manager implementing the policy
+            policy_type: Type of policy
+            node_context: Node state, read on every call
+            custom_params: Custom parameters, read on every call
+        """
+        self.manager = manager
+        self.policy_type = policy_type
+        self.node_context = node_context
+        self.custom_params = custom_params
+    
+    def __call__(self, week: int) -> int:
+        return self.manager._execute_policy(
+            self.policy_type,
+            week,
+            self.node_context,
+            self.custom_params
+        )
+    
+    def order_schedule(self, weeks: int) -> Optional[np.ndarray]:
+        """
+        Get the order quantities for a number of weeks from the current state.
+        
+        Args:
+            weeks: Number of weeks
+            
+        Returns:
+            Array of order quantities, one per week, or None if the orders
+            can only be known week by week
+        """
+        manager = self.manager
+        implementation = manager.policy_functions.get(self.policy_type)
+        if implementation is None or implementation in (manager._base_stock_policy, manager._ss_policy):
+            # The built-in base stock and (s,S) implementations, and the
+            # default fallback, order the same every week
+            return np.full(weeks, self(0))
+        return None
+
+
 class PolicyManager:
     """Manages and implements various ordering policies."""
     
@@ -53,17 +191,73 @@ class PolicyManager:
         Args:
             default_params: Default parameters for policies
         """
+        self._policy_cache: Dict[PolicyType, Callable[[int], int]] = {}
+        
+        # Performance tracking for adaptive policies, with the service
+        # levels of the current performance window and their running sum
+        self.performance_history: Deque[Dict[str, Any]] = deque(maxlen=52)
+        self._service_window: Deque[float] = deque()
+        self._service_sum = 0.0
+        self._performance_window = 0
+        
         self.params = default_params or PolicyParameters()
         self.policy_functions: Dict[PolicyType, Callable] = {}
         self.custom_policies: Dict[str, Callable] = {}
         
-        # Performance tracking for adaptive policies
-        self.performance_history: List[Dict[str, Any]] = []
-        self.demand_history: List[float] = []
+        # Ring buffer holding the most recent demand observations
+        self._history = np.zeros(52, dtype=np.float64)
+        self._history_idx = 0
+        self._history_len = 0
+        
+        # Running sums over the ring buffer for O(1) mean and deviation
+        self._history_sum = 0.0
+        self._history_sqsum = 0.0
+        
+        # Single exponential smoothing state for demand estimation
+        self._ses_level: float = 0.0
+        self._ses_mse: float = 0.0
+        self._ses_initialized = False
+        
+        # Forecasts keyed by (horizon, history version); the version is
+        # bumped whenever new demand is observed
+        self._history_version = 0
+        self._forecast_cache: Dict[Tuple[int, int], List[float]] = {}
+        self._silver_meal_cache: Dict[Tuple[int, int, float, float], int] = {}
+        self._eoq_cache: Dict[Tuple[float, float, int], int] = {}
         
         # Initialize standard policies
         self._initialize_standard_policies()
     
+    @property
+    def params(self) -> PolicyParameters:
+        """Default parameters for policies."""
+        return self._params
+    
+    @params.setter
+    def params(self, params: PolicyParameters):
+        self._params = params
+        self._policy_cache.clear()
+        self._reset_service_window()
+    
+    def _reset_service_window(self):
+        """Rebuild the service level window for the current performance window."""
+        # Windows longer than the kept history are cut to it, so they can
+        # still fill up; a window of 0 covers the whole history
+        history_len = self.performance_history.maxlen
+        self._performance_window = min(self._params.performance_window, history_len)
+        self._service_window = deque(
+            (p.get("service_level", 1.0) for p in self.performance_history),
+            maxlen=self._performance_window or history_len
+        )
+        self._service_sum = sum(self._service_window)
+    
+    @property
+    def demand_history(self) -> np.ndarray:
+        """Recent demand observations, oldest first."""
+        if self._history_len < self._history.size:
+            return self._history[:self._history_len].copy()
+        return np.roll(self._history, -self._history_idx)
+    
     def _initialize_standard_policies(self):
         """Initialize standard policy functions."""
         self.policy_functions[PolicyType.BASE_STOCK] = self._base_stock_policy
@@ -88,29 +282,93 @@ class PolicyManager:
             custom_params: Custom parameters for the policy
             
         Returns:
-            A function that takes week number and returns order quantity
+            A function that takes week number and returns order quantity.
+            Manual policies and the custom fallback return a
+            ScheduledPolicy; other standard policies return a
+            ContextPolicy, which reads the context and parameters on
+            every call.
         """
         if policy_type == PolicyType.MANUAL:
-            return lambda week: self._manual_policy(week)
+            return ScheduledPolicy(self._manual_policy(0))
         
         if policy_type == PolicyType.CUSTOM:
             if custom_params and "policy_name" in custom_params:
-                return self.custom_policies.get(
-                    custom_params["policy_name"],
-                    lambda week: 4  # Default fallback
-                )
-        
-        # Create a closure that captures the context
-        def policy_function(week: int) -> int:
-            return self._execute_policy(
-                policy_type,
-                week,
-                node_context or {},
-                custom_params or {}
-            )
+                policy_function = self.custom_policies.get(custom_params["policy_name"])
+                if policy_function is not None:
+                    return policy_function
+                return ScheduledPolicy(4)  # Default fallback
+        
+        # Policies without context or parameters can be shared
+        shareable = node_context is None and custom_params is None
+        if shareable and policy_type in self._policy_cache:
+            return self._policy_cache[policy_type]
+        
+        # The policy reads the context, parameters and implementation
+        # when it is called, so later changes to them are honoured
+        policy_function = ContextPolicy(
+            self,
+            policy_type,
+            node_context if node_context is not None else {},
+            custom_params if custom_params is not None else {}
+        )
+        if shareable:
+            self._policy_cache[policy_type] = policy_function
         
         return policy_function
     
+    def batch_orders(
+        self,
+        policy_type: PolicyType,
+        inventories: np.ndarray,
+        backlogs: np.ndarray,
+        pending: np.ndarray,
+        target_levels: Optional[np.ndarray] = None,
+        reorder_points: Optional[np.ndarray] = None,
+        order_up_to_levels: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Compute orders for many nodes at once.
+        
+        Gives the same quantities as calling the base stock or (s,S)
+        policy once per node, in a single array expression.
+        
+        Args:
+            policy_type: BASE_STOCK or SS_POLICY
+            inventories: Inventory of each node
+            backlogs: Backlog of each node
+            pending: Pending orders of each node
+            target_levels: Base stock level of each node (defaults to
+                the base_stock_level parameter)
+            reorder_points: (s,S) reorder point s of each node (defaults
+                to the reorder_point parameter)
+            order_up_to_levels: (s,S) order-up-to level S of each node
+                (defaults to the order_up_to_level parameter)
+        
+        Returns:
+            Array of order quantities, one per node
+        """
+        inventory_position = (
+            np.asarray(inventories) - np.asarray(backlogs) + np.asarray(pending)
+        )
+        
+        if policy_type == PolicyType.BASE_STOCK:
+            if target_levels is None:
+                target_levels = self.params.base_stock_level
+            return np.maximum(0, target_levels - inventory_position)
+        
+        if policy_type == PolicyType.SS_POLICY:
+            if reorder_points is None:
+                reorder_points = self.params.reorder_point
+            if order_up_to_levels is None:
+                order_up_to_levels = self.params.order_up_to_level
+            return np.where(
+                inventory_position <= reorder_points,
+                np.maximum(0, order_up_to_levels - inventory_position),
+                0
+            )
+        
+        raise ValueError(f"Batch orders are not supported for {policy_type.value} policies")
+    
     def register_custom_policy(
         self,
         name: str,
@@ -144,8 +402,9 @@ class PolicyManager:
         Returns:
             Order quantity
         """
-        if policy_type in self.policy_functions:
-            return self.policy_functions[policy_type](week, node_context, custom_params)
+        implementation = self.policy_functions.get(policy_type)
+        if implementation is not None:
+            return implementation(week, node_context, custom_params)
         return 4  # Default fallback
     
     def _manual_policy(self, week: int) -> int:
@@ -214,23 +473,55 @@ class PolicyManager:
             self.params.eoq_ordering_cost
         )
         
+        return self._eoq_order(
+            holding_cost,
+            ordering_cost,
+            self.params.eoq_quantity,
+            node_context.get("inventory", 0),
+            week
+        )
+    
+    def _eoq_order(
+        self,
+        holding_cost: float,
+        ordering_cost: float,
+        default_quantity: int,
+        current_inventory: float,
+        week: int
+    ) -> int:
+        """
+        Economic Order Quantity from already resolved parameters.
+        
+        Args:
+            holding_cost: Holding cost per unit per period
+            ordering_cost: Fixed cost per order
+            default_quantity: Order quantity when no EOQ can be computed
+            current_inventory: Node inventory
+            week: Current week
+            
+        Returns:
+            Order quantity
+        """
         # Estimate demand rate
         avg_demand = self._estimate_average_demand()
         
-        # Calculate EOQ
-        if avg_demand > 0 and holding_cost > 0:
-            eoq = math.sqrt((2 * avg_demand * ordering_cost) / holding_cost)
-        else:
-            eoq = self.params.eoq_quantity
-        
         # Check if it's time to order
-        current_inventory = node_context.get("inventory", 0)
         reorder_point = avg_demand * 2  # Simple reorder point
         
-        if current_inventory <= reorder_point:
-            return int(eoq)
+        if current_inventory > reorder_point:
+            return 0
         
-        return 0
+        # The EOQ only changes with the demand estimate, so it is cached
+        # until the next demand observation
+        key = (holding_cost, ordering_cost, default_quantity)
+        eoq = self._eoq_cache.get(key)
+        if eoq is None:
+            if avg_demand > 0 and holding_cost > 0:
+                eoq = int(math.sqrt((2 * avg_demand * ordering_cost) / holding_cost))
+            else:
+                eoq = int(default_quantity)
+            self._eoq_cache[key] = eoq
+        return eoq
     
     def _ss_policy(
         self,
@@ -293,9 +584,60 @@ class PolicyManager:
             self.params.eoq_ordering_cost
         )
         
-        # Forecast future demands
-        forecast = self._forecast_demand(self.params.forecast_horizon)
+        return self._silver_meal_order(
+            self.params.forecast_horizon,
+            holding_cost,
+            ordering_cost,
+            week
+        )
+    
+    def _silver_meal_order(
+        self,
+        horizon: int,
+        holding_cost: float,
+        ordering_cost: float,
+        week: int
+    ) -> int:
+        """
+        Silver-Meal order quantity from already resolved parameters.
         
+        Args:
+            horizon: Number of periods to forecast
+            holding_cost: Holding cost per unit per period
+            ordering_cost: Fixed cost per order
+            week: Current week
+            
+        Returns:
+            Order quantity
+        """
+        # The lot size only depends on the forecast, which changes with
+        # each demand observation, so it is cached alongside it
+        key = (horizon, self._history_version, holding_cost, ordering_cost)
+        order_quantity = self._silver_meal_cache.get(key)
+        if order_quantity is None:
+            order_quantity = self._silver_meal_lot_size(
+                self._forecast_demand(horizon), holding_cost, ordering_cost
+            )
+            self._silver_meal_cache[key] = order_quantity
+        return order_quantity
+    
+    def _silver_meal_lot_size(
+        self,
+        forecast: List[float],
+        holding_cost: float,
+        ordering_cost: float
+    ) -> int:
+        """
+        Choose a Silver-Meal lot size for a demand forecast.
+        
+        Args:
+            forecast: Forecast demand per period
+            holding_cost: Holding cost per unit per period
+            ordering_cost: Fixed cost per order
+            
+        Returns:
+            Order quantity
+        """
         if not forecast:
             return 4  # Default
         
@@ -303,24 +645,20 @@ class PolicyManager:
         best_periods = 1
         min_cost_per_period = float('inf')
         
-        cumulative_demand = 0
         cumulative_holding_cost = 0
         
         for periods in range(1, min(len(forecast) + 1, 8)):
-            if periods <= len(forecast):
-                cumulative_demand += forecast[periods - 1]
-                
-                # Calculate holding cost for this period
-                if periods > 1:
-                    cumulative_holding_cost += forecast[periods - 1] * (periods - 1) * holding_cost
-                
-                # Calculate average cost per period
-                total_cost = ordering_cost + cumulative_holding_cost
-                cost_per_period = total_cost / periods
-                
-                if cost_per_period < min_cost_per_period:
-                    min_cost_per_period = cost_per_period
-                    best_periods = periods
+            # Calculate holding cost for this period
+            if periods > 1:
+                cumulative_holding_cost += forecast[periods - 1] * (periods - 1) * holding_cost
+            
+            # Calculate average cost per period
+            total_cost = ordering_cost + cumulative_holding_cost
+            cost_per_period = total_cost / periods
+            
+            if cost_per_period < min_cost_per_period:
+                min_cost_per_period = cost_per_period
+                best_periods = periods
         
         # Order for the optimal number of periods
         order_quantity = sum(forecast[:best_periods])
@@ -354,6 +692,46 @@ class PolicyManager:
             self.params.safety_stock_multiplier
         )
         
+        # Current position
+        current_inventory = node_context.get("inventory", 0)
+        current_backlog = node_context.get("backlog", 0)
+        pending_orders = node_context.get("pending_orders", 0)
+        
+        inventory_position = current_inventory - current_backlog + pending_orders
+        
+        lead_time = node_context.get("lead_time", 2)
+        return self._forecast_order(
+            forecast_horizon,
+            safety_multiplier,
+            lead_time,
+            math.sqrt(lead_time),
+            inventory_position,
+            week
+        )
+    
+    def _forecast_order(
+        self,
+        forecast_horizon: int,
+        safety_multiplier: float,
+        lead_time: int,
+        sqrt_lead_time: float,
+        inventory_position: float,
+        week: int
+    ) -> int:
+        """
+        Forecast-based order quantity from already resolved parameters.
+        
+        Args:
+            forecast_horizon: Number of periods to forecast
+            safety_multiplier: Safety stock multiplier
+            lead_time: Replenishment lead time in weeks
+            sqrt_lead_time: Square root of the lead time
+            inventory_position: Inventory minus backlog plus pending orders
+            week: Current week
+            
+        Returns:
+            Order quantity
+        """
         # Get forecast
         forecast = self._forecast_demand(forecast_horizon)
         
@@ -361,23 +739,15 @@ class PolicyManager:
             return 4  # Default
         
         # Calculate expected demand over lead time
-        lead_time = node_context.get("lead_time", 2)
         expected_demand = sum(forecast[:lead_time])
         
         # Add safety stock
-        demand_std = np.std(self.demand_history) if len(self.demand_history) > 1 else 2
-        safety_stock = safety_multiplier * demand_std * math.sqrt(lead_time)
+        demand_std = self._demand_std() if self._history_len > 1 else 2
+        safety_stock = safety_multiplier * demand_std * sqrt_lead_time
         
         # Calculate target inventory
         target_inventory = expected_demand + safety_stock
         
-        # Current position
-        current_inventory = node_context.get("inventory", 0)
-        current_backlog = node_context.get("backlog", 0)
-        pending_orders = node_context.get("pending_orders", 0)
-        
-        inventory_position = current_inventory - current_backlog + pending_orders
-        
         # Order quantity
         order_quantity = max(0, target_inventory - inventory_position)
         
@@ -401,15 +771,28 @@ class PolicyManager:
             Order quantity
         """
         # Start with base stock policy
-        base_quantity = self._base_stock_policy(week, node_context, custom_params)
+        return self._adaptive_order(
+            self._base_stock_policy(week, node_context, custom_params),
+            week
+        )
+    
+    def _adaptive_order(self, base_quantity: int, week: int) -> int:
+        """
+        Adjust a base stock order quantity for recent performance.
         
-        # Adjust based on recent performance
-        if len(self.performance_history) >= self.params.performance_window:
-            recent_performance = self.performance_history[-self.params.performance_window:]
+        Args:
+            base_quantity: Base stock order quantity
+            week: Current week
             
-            # Calculate average service level and cost
-            avg_service = np.mean([p.get("service_level", 1.0) for p in recent_performance])
-            avg_cost = np.mean([p.get("cost", 0) for p in recent_performance])
+        Returns:
+            Order quantity
+        """
+        # Adjust based on recent performance
+        if len(self.performance_history) >= self._performance_window:
+            # Average service level over the window, from the running sum;
+            # with no history yet there is no shortfall to make up
+            window = self._service_window
+            avg_service = self._service_sum / len(window) if window else 1.0
             
             # Adjust order quantity based on performance
             if avg_service < 0.95:
@@ -430,11 +813,34 @@ class PolicyManager:
         Args:
             demand: Observed demand
         """
-        self.demand_history.append(demand)
-        
-        # Keep only recent history
-        if len(self.demand_history) > 52:
-            self.demand_history = self.demand_history[-52:]
+        # Running sums stay Python floats, so reading them costs no NumPy dispatch
+        demand = float(demand)
+        
+        # Keep only recent history, overwriting the oldest observation
+        if self._history_len == self._history.size:
+            evicted = self._history[self._history_idx].item()
+            self._history_sum -= evicted
+            self._history_sqsum -= evicted * evicted
+        self._history_sum += demand
+        self._history_sqsum += demand * demand
+        self._history[self._history_idx] = demand
+        self._history_idx = (self._history_idx + 1) % self._history.size
+        self._history_len = min(self._history_len + 1, self._history.size)
+        self._history_version += 1
+        self._forecast_cache.clear()
+        self._silver_meal_cache.clear()
+        self._eoq_cache.clear()
+        
+        # Update smoothed level: f_{t+1} = alpha * d_t + (1 - alpha) * f_t
+        if not self._ses_initialized:
+            self._ses_level = demand
+            self._ses_initialized = True
+        else:
+            alpha = self.params.smoothing_alpha
+            beta = self.params.smoothing_beta
+            error = demand - self._ses_level
+            self._ses_mse = beta * error * error + (1 - beta) * self._ses_mse
+            self._ses_level = alpha * demand + (1 - alpha) * self._ses_level
     
     def update_performance(self, performance_metrics: Dict[str, Any]):
         """
@@ -443,97 +849,69 @@ class PolicyManager:
         Args:
             performance_metrics: Dictionary of performance metrics
         """
+        # Only the most recent 52 entries are kept
         self.performance_history.append(performance_metrics)
         
-        # Keep only recent history
-        if len(self.performance_history) > 52:
-            self.performance_history = self.performance_history[-52:]
+        service_level = performance_metrics.get("service_level", 1.0)
+        window = self._service_window
+        if len(window) == window.maxlen:
+            self._service_sum -= window[0]
+        window.append(service_level)
+        self._service_sum += service_level
     
     def _estimate_average_demand(self) -> float:
-        """Estimate average demand from history."""
-        if self.demand_history:
-            return np.mean(self.demand_history)
+        """Estimate average demand using the exponentially smoothed level."""
+        if self._ses_initialized:
+            return self._ses_level
         return 4.0  # Default
     
+    def _demand_std(self) -> float:
+        """Population standard deviation of the demand history, from the running sums."""
+        n = self._history_len
+        mean = self._history_sum / n
+        return math.sqrt(max(0.0, self._history_sqsum / n - mean * mean))
+    
     def _forecast_demand(self, horizon: int) -> List[float]:
         """
         Forecast future demand.
         
+        Single exponential smoothing yields a flat forecast at the
+        current smoothed level for every period in the horizon. Forecasts
+        are cached until the next demand observation, so callers should
+        treat the returned list as read-only.
+        
         Args:
             horizon: Number of periods to forecast
             
         Returns:
             List of forecasted demands
         """
-        if len(self.demand_history) < 4:
-            # Not enough history, use simple average
-            avg_demand = self._estimate_average_demand()
-            return [avg_demand] * horizon
-        
-        # Simple moving average forecast
-        window_size = min(4, len(self.demand_history))
-        recent_demands = self.demand_history[-window_size:]
-        avg_demand = np.mean(recent_demands)
-        
-        # Add some trend analysis
-        if len(self.demand_history) >= 8:
-            older_avg = np.mean(self.demand_history[-8:-4])
-            trend = (avg_demand - older_avg) / 4
-        else:
-            trend = 0
-        
-        # Generate forecast
-        forecast = []
-        for i in range(horizon):
-            forecast.append(max(0, avg_demand + trend * i))
-        
+        key = (horizon, self._history_version)
+        forecast = self._forecast_cache.get(key)
+        if forecast is None:
+            forecast = [self._estimate_average_demand()] * horizon
+            self._forecast_cache[key] = forecast
         return forecast
     
     def get_policy_info(self, policy_type: PolicyType) -> Dict[str, Any]:
         """
         Get information about a policy.
         
+        The result is built from the current parameters on each call, so
+        callers may change it freely.
+        
         Args:
             policy_type: Type of policy
             
         Returns:
             Dictionary with policy information
         """
-        info = {
-            "name": policy_type.value,
-            "description": "",
-            "parameters": {}
-        }
-        
-        if policy_type == PolicyType.BASE_STOCK:
-            info["description"] = "Orders up to a target inventory level"
-            info["parameters"] = {
-                "base_stock_level": self.params.base_stock_level
-            }
-        elif policy_type == PolicyType.EOQ:
-            info["description"] = "Economic Order Quantity - minimizes total cost"
-            info["parameters"] = {
-                "eoq_quantity": self.params.eoq_quantity,
-                "holding_cost": self.params.eoq_holding_cost,
-                "ordering_cost": self.params.eoq_ordering_cost
+        params = self.params
+        return {
+            "name": _POLICY_NAMES[policy_type],
+            "description": _POLICY_DESCRIPTIONS.get(policy_type, ""),
+            "parameters": {
+                key: getattr(params, attr)
+                for key, attr in _POLICY_INFO_PARAMETERS.get(policy_type, ())
             }
-        elif policy_type == PolicyType.SS_POLICY:
-            info["description"] = "(s,S) policy - order up to S when inventory falls below s"
-            info["parameters"] = {
-                "reorder_point": self.params.reorder_point,
-                "order_up_to_level": self.params.order_up_to_level
-            }
-        elif policy_type == PolicyType.FORECAST_BASED:
-            info["description"] = "Orders based on demand forecast and safety stock"
-            info["parameters"] = {
-                "forecast_horizon": self.params.forecast_horizon,
-                "safety_stock_multiplier": self.params.safety_stock_multiplier
-            }
-        elif policy_type == PolicyType.ADAPTIVE:
-            info["description"] = "Adapts ordering based on recent performance"
-            info["parameters"] = {
-                "learning_rate": self.params.learning_rate,
-                "performance_window": self.params.performance_window
-            }
-        
-        return info
+        }
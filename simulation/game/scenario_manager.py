@@ -1,10 +1,12 @@
 """Scenario Manager for handling different game scenarios and configurations."""
 
 from enum import Enum
-from typing import Dict, Any, List, Optional, Callable
-from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Callable, Tuple
+from dataclasses import dataclass, field, replace
 import random
 import math
+import numpy as np
 
 from ..engine.core import SimulationConfig
 
@@ -30,9 +32,14 @@ class DifficultyLevel(Enum):
     EXPERT = "expert"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScenarioDefinition:
-    """Defines a complete scenario."""
+    """
+    Defines a complete scenario.
+    
+    Frozen, since the scenario manager caches summaries and simulation
+    configs built from it.
+    """
     name: str
     description: str
     type: ScenarioType
@@ -76,22 +83,124 @@ class ScenarioDefinition:
     hints: List[str] = field(default_factory=list)
 
 
+# Game settings per difficulty level, read-only so they can be handed out
+# without copying
+DIFFICULTY_SETTINGS: Mapping[DifficultyLevel, Mapping[str, Any]] = MappingProxyType({
+    DifficultyLevel.TUTORIAL: MappingProxyType({
+        "hints_enabled": True,
+        "forecast_enabled": True,
+        "information_sharing": True,
+        "cost_multiplier": 0.5,
+        "time_limit": None
+    }),
+    DifficultyLevel.EASY: MappingProxyType({
+        "hints_enabled": True,
+        "forecast_enabled": True,
+        "information_sharing": False,
+        "cost_multiplier": 0.75,
+        "time_limit": None
+    }),
+    DifficultyLevel.MEDIUM: MappingProxyType({
+        "hints_enabled": False,
+        "forecast_enabled": True,
+        "information_sharing": False,
+        "cost_multiplier": 1.0,
+        "time_limit": 120  # seconds per decision
+    }),
+    DifficultyLevel.HARD: MappingProxyType({
+        "hints_enabled": False,
+        "forecast_enabled": False,
+        "information_sharing": False,
+        "cost_multiplier": 1.25,
+        "time_limit": 60
+    }),
+    DifficultyLevel.EXPERT: MappingProxyType({
+        "hints_enabled": False,
+        "forecast_enabled": False,
+        "information_sharing": False,
+        "cost_multiplier": 1.5,
+        "time_limit": 30
+    })
+})
+
+
+# Demand types, holding cost range and durations that random scenarios are
+# drawn from; other difficulty levels use the medium settings
+_RANDOM_SCENARIO_RANGES: Dict[DifficultyLevel, Tuple[Tuple[str, ...], Tuple[float, float], Tuple[int, ...]]] = {
+    DifficultyLevel.EASY: (("constant", "step"), (0.25, 0.5), (26, 39, 52)),
+    DifficultyLevel.MEDIUM: (("step", "seasonal", "random"), (0.4, 0.8), (39, 52)),
+    DifficultyLevel.HARD: (("random", "seasonal", "volatile"), (0.5, 1.5), (52,))
+}
+
+# Periods that random seasonal demand is drawn from
+_SEASONAL_PERIODS = (26, 52)
+
 class ScenarioManager:
     """Manages game scenarios and configurations."""
     
+    # Predefined scenarios are frozen, so they are built once, when the
+    # first manager is created, and shared by every manager after that
+    _predefined_scenarios: Optional[Dict[str, ScenarioDefinition]] = None
+    
     def __init__(self):
         """Initialize the scenario manager."""
         self.scenarios: Dict[str, ScenarioDefinition] = {}
         self.custom_scenarios: Dict[str, ScenarioDefinition] = {}
         
+        # Simulation configs built so far, keyed by scenario ID
+        self._config_cache: Dict[str, SimulationConfig] = {}
+        
+        # Event hints by week, keyed by scenario ID
+        self._event_hints_cache: Dict[str, Dict[int, List[str]]] = {}
+        
+        # Scenario summaries in listing order, indexed by the fields
+        # list_scenarios filters on
+        self._summaries: List[Dict[str, Any]] = []
+        self._by_difficulty: Dict[DifficultyLevel, List[int]] = {}
+        self._by_type: Dict[ScenarioType, List[int]] = {}
+        self._by_tag: Dict[str, List[int]] = {}
+        
         # Initialize predefined scenarios
         self._initialize_predefined_scenarios()
+        for scenario_id, scenario in self.scenarios.items():
+            self._add_summary(scenario_id, scenario)
+    
+    def _add_summary(self, scenario_id: str, scenario: ScenarioDefinition):
+        """Add a scenario's summary to the listing and its filter indices."""
+        idx = len(self._summaries)
+        self._summaries.append({
+            "id": scenario_id,
+            "name": scenario.name,
+            "description": scenario.description,
+            "type": scenario.type.value,
+            "difficulty": scenario.difficulty.value,
+            "duration": scenario.duration_weeks,
+            "tags": scenario.tags
+        })
+        self._by_difficulty.setdefault(scenario.difficulty, []).append(idx)
+        self._by_type.setdefault(scenario.type, []).append(idx)
+        for tag in set(scenario.tags):
+            self._by_tag.setdefault(tag, []).append(idx)
     
     def _initialize_predefined_scenarios(self):
         """Initialize all predefined scenarios."""
+        predefined = ScenarioManager._predefined_scenarios
+        if predefined is None:
+            predefined = self._build_predefined_scenarios()
+            ScenarioManager._predefined_scenarios = predefined
+        self.scenarios.update(predefined)
+    
+    def _build_predefined_scenarios(self) -> Dict[str, ScenarioDefinition]:
+        """
+        Build all predefined scenarios.
+        
+        Returns:
+            Dictionary of predefined scenarios by ID
+        """
+        scenarios: Dict[str, ScenarioDefinition] = {}
         
         # Classic Beer Game
-        self.scenarios["classic"] = ScenarioDefinition(
+        scenarios["classic"] = ScenarioDefinition(
             name="Classic Beer Game",
             description="The original beer distribution game with constant demand",
             type=ScenarioType.CLASSIC,
@@ -108,7 +217,7 @@ class ScenarioManager:
         )
         
         # Step Demand Change
-        self.scenarios["step_change"] = ScenarioDefinition(
+        scenarios["step_change"] = ScenarioDefinition(
             name="Demand Surge",
             description="Sudden increase in demand after initial stability",
             type=ScenarioType.STEP_DEMAND,
@@ -130,7 +239,7 @@ class ScenarioManager:
         )
         
         # Seasonal Pattern
-        self.scenarios["seasonal"] = ScenarioDefinition(
+        scenarios["seasonal"] = ScenarioDefinition(
             name="Seasonal Demand",
             description="Demand follows a seasonal pattern throughout the year",
             type=ScenarioType.SEASONAL,
@@ -151,7 +260,7 @@ class ScenarioManager:
         )
         
         # Random Walk
-        self.scenarios["random_walk"] = ScenarioDefinition(
+        scenarios["random_walk"] = ScenarioDefinition(
             name="Unpredictable Market",
             description="Demand varies randomly each week",
             type=ScenarioType.RANDOM_WALK,
@@ -172,7 +281,7 @@ class ScenarioManager:
         )
         
         # Supply Chain Disruption
-        self.scenarios["disruption"] = ScenarioDefinition(
+        scenarios["disruption"] = ScenarioDefinition(
             name="Crisis Management",
             description="Handle supply chain disruptions and recovery",
             type=ScenarioType.DISRUPTION,
@@ -204,7 +313,7 @@ class ScenarioManager:
         )
         
         # Growth Scenario
-        self.scenarios["growth"] = ScenarioDefinition(
+        scenarios["growth"] = ScenarioDefinition(
             name="Market Growth",
             description="Manage supply chain during market expansion",
             type=ScenarioType.GROWTH,
@@ -226,7 +335,7 @@ class ScenarioManager:
         )
         
         # High Volatility
-        self.scenarios["volatile"] = ScenarioDefinition(
+        scenarios["volatile"] = ScenarioDefinition(
             name="Volatile Market",
             description="Extreme demand fluctuations test your adaptability",
             type=ScenarioType.VOLATILE,
@@ -250,7 +359,7 @@ class ScenarioManager:
         )
         
         # Tutorial Scenario
-        self.scenarios["tutorial"] = ScenarioDefinition(
+        scenarios["tutorial"] = ScenarioDefinition(
             name="Tutorial",
             description="Learn the basics of the beer game",
             type=ScenarioType.CLASSIC,
@@ -268,6 +377,8 @@ class ScenarioManager:
                 "Watch your costs"
             ]
         )
+        
+        return scenarios
     
     def get_scenario(self, scenario_id: str) -> Optional[ScenarioDefinition]:
         """
@@ -298,6 +409,9 @@ class ScenarioManager:
         """
         List available scenarios with optional filters.
         
+        Summaries are built once per scenario, so callers should treat
+        them as read-only.
+        
         Args:
             difficulty: Filter by difficulty level
             scenario_type: Filter by scenario type
@@ -306,75 +420,60 @@ class ScenarioManager:
         Returns:
             List of scenario summaries
         """
-        scenarios_list = []
-        
-        # Combine predefined and custom scenarios
-        all_scenarios = {**self.scenarios, **self.custom_scenarios}
-        
-        for scenario_id, scenario in all_scenarios.items():
-            # Apply filters
-            if difficulty and scenario.difficulty != difficulty:
-                continue
-            
-            if scenario_type and scenario.type != scenario_type:
-                continue
-            
-            if tags:
-                if not any(tag in scenario.tags for tag in tags):
-                    continue
-            
-            # Create summary
-            scenarios_list.append({
-                "id": scenario_id,
-                "name": scenario.name,
-                "description": scenario.description,
-                "type": scenario.type.value,
-                "difficulty": scenario.difficulty.value,
-                "duration": scenario.duration_weeks,
-                "tags": scenario.tags
-            })
-        
-        return scenarios_list
+        summaries = self._summaries
+        if not (difficulty or scenario_type or tags):
+            return list(summaries)
+        
+        # Intersect the indices of scenarios passing each filter
+        selected: Optional[set] = None
+        if difficulty:
+            selected = set(self._by_difficulty.get(difficulty, ()))
+        if scenario_type:
+            matches = set(self._by_type.get(scenario_type, ()))
+            selected = matches if selected is None else selected & matches
+        if tags:
+            matches = set()
+            for tag in tags:
+                matches.update(self._by_tag.get(tag, ()))
+            selected = matches if selected is None else selected & matches
+        
+        return [summaries[idx] for idx in sorted(selected)]
     
     def create_simulation_config(
         self,
-        scenario_id: str
+        scenario_id: str,
+        seed: Optional[int] = None
     ) -> SimulationConfig:
         """
         Create a simulation configuration from a scenario.
         
         Args:
             scenario_id: ID of the scenario
+            seed: Seed for random demand, for reproducible runs
             
         Returns:
             SimulationConfig for the scenario
         """
+        cached = self._config_cache.get(scenario_id)
+        if cached is not None:
+            # Copy so callers can modify their config safely
+            return replace(cached, demand_params=cached.demand_params.copy(), seed=seed)
+        
         scenario = self.get_scenario(scenario_id)
         
         if not scenario:
             # Return default config if scenario not found
-            return SimulationConfig()
+            return SimulationConfig(seed=seed)
         
-        # Map scenario demand type to simulation demand type
+        # Map scenario demand type to simulation demand type. The cached
+        # config can share the scenario's parameters, since callers only
+        # ever receive copies of them
         demand_type = scenario.demand_type
-        demand_params = scenario.demand_params.copy()
-        
-        # Handle special demand types
-        if demand_type == "growth":
-            # Convert growth to custom function
-            demand_type = "custom"
-            initial = demand_params.get("initial_demand", 3)
-            rate = demand_params.get("growth_rate", 0.02)
-            max_demand = demand_params.get("max_demand", 12)
-            
-            demand_params = {
-                "function": lambda week: min(
-                    max_demand,
-                    int(initial * (1 + rate) ** week)
-                )
-            }
+        demand_params = scenario.demand_params
         
-        elif demand_type == "volatile":
+        # Handle special demand types. Growth is generated by the engine
+        # as a whole series, so its parameters pass through unchanged
+        if demand_type == "volatile":
             # Convert volatile to random with shocks
             demand_type = "random"
             base = demand_params.get("base_demand", 6)
@@ -400,7 +499,9 @@ class ScenarioManager:
             demand_params=demand_params
         )
         
-        return config
+        self._config_cache[scenario_id] = config
+        
+        return replace(config, demand_params=config.demand_params.copy(), seed=seed)
     
     def create_custom_scenario(
         self,
@@ -440,6 +541,9 @@ class ScenarioManager:
         
         # Store custom scenario
         self.custom_scenarios[scenario_id] = scenario
+        self._config_cache.pop(scenario_id, None)
+        self._event_hints_cache.pop(scenario_id, None)
+        self._add_summary(scenario_id, scenario)
         
         return scenario_id
     
@@ -470,12 +574,11 @@ class ScenarioManager:
             hints.extend(scenario.hints[:1])  # Early game hints
         
         # Add event-specific hints
-        for event in scenario.disruption_events:
-            event_week = event.get("week", 0)
-            if week == event_week - 2:
-                hints.append(f"Prepare for: {event.get('description', 'upcoming event')}")
-            elif week == event_week:
-                hints.append(f"Event active: {event.get('description', 'special event')}")
+        event_hints = self._event_hints_cache.get(scenario_id)
+        if event_hints is None:
+            event_hints = self._build_event_hints(scenario)
+            self._event_hints_cache[scenario_id] = event_hints
+        hints.extend(event_hints.get(week, ()))
         
         # Add performance-based hints
         if week > 10:
@@ -483,10 +586,31 @@ class ScenarioManager:
         
         return hints
     
+    def _build_event_hints(self, scenario: ScenarioDefinition) -> Dict[int, List[str]]:
+        """
+        Build the event hints for a scenario, keyed by the week they apply to.
+        
+        Args:
+            scenario: Scenario to build hints for
+            
+        Returns:
+            Dictionary of hint lists by week, in event order
+        """
+        event_hints: Dict[int, List[str]] = {}
+        for event in scenario.disruption_events:
+            event_week = event.get("week", 0)
+            event_hints.setdefault(event_week - 2, []).append(
+                f"Prepare for: {event.get('description', 'upcoming event')}"
+            )
+            event_hints.setdefault(event_week, []).append(
+                f"Event active: {event.get('description', 'special event')}"
+            )
+        return event_hints
+    
     def get_difficulty_settings(
         self,
         difficulty: DifficultyLevel
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """
         Get game settings based on difficulty level.
         
@@ -494,47 +618,9 @@ class ScenarioManager:
             difficulty: Difficulty level
             
         Returns:
-            Dictionary of difficulty-specific settings
+            Read-only mapping of difficulty-specific settings
         """
-        settings = {
-            DifficultyLevel.TUTORIAL: {
-                "hints_enabled": True,
-                "forecast_enabled": True,
-                "information_sharing": True,
-                "cost_multiplier": 0.5,
-                "time_limit": None
-            },
-            DifficultyLevel.EASY: {
-                "hints_enabled": True,
-                "forecast_enabled": True,
-                "information_sharing": False,
-                "cost_multiplier": 0.75,
-                "time_limit": None
-            },
-            DifficultyLevel.MEDIUM: {
-                "hints_enabled": False,
-                "forecast_enabled": True,
-                "information_sharing": False,
-                "cost_multiplier": 1.0,
-                "time_limit": 120  # seconds per decision
-            },
-            DifficultyLevel.HARD: {
-                "hints_enabled": False,
-                "forecast_enabled": False,
-                "information_sharing": False,
-                "cost_multiplier": 1.25,
-                "time_limit": 60
-            },
-            DifficultyLevel.EXPERT: {
-                "hints_enabled": False,
-                "forecast_enabled": False,
-                "information_sharing": False,
-                "cost_multiplier": 1.5,
-                "time_limit": 30
-            }
-        }
-        
-        return settings.get(difficulty, settings[DifficultyLevel.MEDIUM])
+        return DIFFICULTY_SETTINGS.get(difficulty, DIFFICULTY_SETTINGS[DifficultyLevel.MEDIUM])
     
     def generate_random_scenario(
         self,
@@ -550,18 +636,10 @@ class ScenarioManager:
             ID of the generated scenario
         """
         # Random parameters based on difficulty
-        if difficulty == DifficultyLevel.EASY:
-            demand_types = ["constant", "step"]
-            cost_range = (0.25, 0.5)
-            duration = random.choice([26, 39, 52])
-        elif difficulty == DifficultyLevel.HARD:
-            demand_types = ["random", "seasonal", "volatile"]
-            cost_range = (0.5, 1.5)
-            duration = 52
-        else:  # Medium
-            demand_types = ["step", "seasonal", "random"]
-            cost_range = (0.4, 0.8)
-            duration = random.choice([39, 52])
+        demand_types, cost_range, durations = _RANDOM_SCENARIO_RANGES.get(
+            difficulty, _RANDOM_SCENARIO_RANGES[DifficultyLevel.MEDIUM]
+        )
+        duration = random.choice(durations) if len(durations) > 1 else durations[0]
         
         # Generate random configuration
         demand_type = random.choice(demand_types)
@@ -583,6 +661,66 @@ class ScenarioManager:
         
         return self.create_custom_scenario(name, description, config)
     
+    def generate_random_scenarios(
+        self,
+        count: int,
+        difficulty: DifficultyLevel = DifficultyLevel.MEDIUM,
+        seed: Optional[int] = None
+    ) -> List[str]:
+        """
+        Generate a batch of random scenarios based on difficulty.
+        
+        Parameters are drawn from the same ranges as
+        generate_random_scenario, but sampled for the whole batch at once
+        with a NumPy generator.
+        
+        Args:
+            count: Number of scenarios to generate
+            difficulty: Target difficulty level
+            seed: Seed for the generator, for reproducible batches
+            
+        Returns:
+            IDs of the generated scenarios
+        """
+        demand_types, (cost_low, cost_high), durations = _RANDOM_SCENARIO_RANGES.get(
+            difficulty, _RANDOM_SCENARIO_RANGES[DifficultyLevel.MEDIUM]
+        )
+        rng = np.random.default_rng(seed)
+        
+        type_idx = rng.integers(len(demand_types), size=count)
+        holding_costs = rng.uniform(cost_low, cost_high, count).tolist()
+        backlog_costs = rng.uniform(cost_high, cost_high * 3, count).tolist()
+        duration_values = rng.choice(durations, count).tolist()
+        initial_inventories = rng.integers(8, 20, size=count, endpoint=True).tolist()
+        numbers = rng.integers(1000, 9999, size=count, endpoint=True).tolist()
+        
+        # Demand parameters are sampled per demand type for all scenarios
+        # that drew it
+        demand_params: List[Optional[Dict[str, Any]]] = [None] * count
+        for i, demand_type in enumerate(demand_types):
+            rows = np.flatnonzero(type_idx == i)
+            for row, params in zip(rows.tolist(), self._generate_demand_params_batch(demand_type, len(rows), rng)):
+                demand_params[row] = params
+        
+        description = f"A randomly generated {difficulty.value} scenario"
+        tags = ["random", "generated", difficulty.value]
+        scenario_ids = []
+        for row in range(count):
+            config = {
+                "difficulty": difficulty.value,
+                "demand_type": demand_types[type_idx[row]],
+                "demand_params": demand_params[row],
+                "holding_cost": holding_costs[row],
+                "backlog_cost": backlog_costs[row],
+                "duration": duration_values[row],
+                "initial_inventory": initial_inventories[row],
+                "tags": list(tags)
+            }
+            name = f"Random Challenge #{numbers[row]}"
+            scenario_ids.append(self.create_custom_scenario(name, description, config))
+        
+        return scenario_ids
+    
     def _generate_demand_params(self, demand_type: str) -> Dict[str, Any]:
         """Generate random demand parameters for a given type."""
         if demand_type == "constant":
@@ -597,7 +735,7 @@ class ScenarioManager:
             return {
                 "base_demand": random.randint(4, 8),
                 "amplitude": random.randint(2, 4),
-                "period": random.choice([26, 52])
+                "period": random.choice(_SEASONAL_PERIODS)
             }
         elif demand_type == "random":
             base = random.randint(4, 7)
@@ -607,3 +745,43 @@ class ScenarioManager:
             }
         else:
             return {"base_demand": 5}
+    
+    def _generate_demand_params_batch(
+        self,
+        demand_type: str,
+        count: int,
+        rng: np.random.Generator
+    ) -> List[Dict[str, Any]]:
+        """Generate random demand parameters for a number of scenarios of one type."""
+        if demand_type == "constant":
+            return [
+                {"base_demand": base}
+                for base in rng.integers(3, 7, size=count, endpoint=True).tolist()
+            ]
+        elif demand_type == "step":
+            return [
+                {"base_demand": base, "step_demand": step, "step_week": week}
+                for base, step, week in zip(
+                    rng.integers(3, 5, size=count, endpoint=True).tolist(),
+                    rng.integers(6, 10, size=count, endpoint=True).tolist(),
+                    rng.integers(5, 15, size=count, endpoint=True).tolist()
+                )
+            ]
+        elif demand_type == "seasonal":
+            return [
+                {"base_demand": base, "amplitude": amplitude, "period": period}
+                for base, amplitude, period in zip(
+                    rng.integers(4, 8, size=count, endpoint=True).tolist(),
+                    rng.integers(2, 4, size=count, endpoint=True).tolist(),
+                    rng.choice(_SEASONAL_PERIODS, count).tolist()
+                )
+            ]
+        elif demand_type == "random":
+            bases = rng.integers(4, 7, size=count, endpoint=True)
+            variations = rng.integers(1, bases // 2, endpoint=True)
+            return [
+                {"base_demand": base, "variation": variation}
+                for base, variation in zip(bases.tolist(), variations.tolist())
+            ]
+        else:
+            return [{"base_demand": 5} for _ in range(count)]
@@ -1,10 +1,14 @@
 """REST API endpoints for Beer Distribution Game."""
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+import asyncio
+import json
+import logging
 import uuid
 
 from ...game import (
@@ -15,6 +19,9 @@ from ...game import (
 from ...engine.core import SimulationConfig
 
 
+logger = logging.getLogger(__name__)
+
+
 # Pydantic models for API requests/responses
 class GameConfigRequest(BaseModel):
     """Request model for game configuration."""
@@ -61,6 +68,100 @@ games: Dict[str, GameController] = {}
 scenario_manager = ScenarioManager()
 policy_manager = PolicyManager()
 
+# Simulation locks by game ID. Starting a game and submitting decisions
+# can advance the simulation, so they run in worker threads, but still one
+# at a time per game
+_game_locks: Dict[str, asyncio.Lock] = {}
+
+# Running game tasks by game ID
+game_tasks: Dict[str, asyncio.Task] = {}
+
+# Serialized list_scenarios responses without a tags filter, by difficulty
+# value (None for all scenarios); cleared when a scenario is created
+_scenario_payloads: Dict[Optional[str], bytes] = {}
+
+
+def _json_bytes(content: Any) -> bytes:
+    """Serialize content the way JSONResponse does."""
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _build_policies_payload() -> bytes:
+    """Serialize the list_policies response, which is fixed per process."""
+    policies = []
+    for policy_type in PolicyType:
+        info = policy_manager.get_policy_info(policy_type)
+        policies.append({
+            "type": policy_type.value,
+            "name": info["name"],
+            "description": info["description"],
+            "parameters": info["parameters"]
+        })
+    
+    return _json_bytes({"policies": policies})
+
+
+_policies_payload = _build_policies_payload()
+
+
+async def _submit_player_decision(
+    game: GameController,
+    player_id: str,
+    decision: Dict[str, Any]
+) -> bool:
+    """
+    Submit a player decision without blocking the event loop.
+    
+    Args:
+        game: Game to submit the decision to
+        player_id: ID of the deciding player
+        decision: Decision data
+        
+    Returns:
+        Whether the decision was accepted
+    """
+    async with _game_locks.setdefault(game.game_id, asyncio.Lock()):
+        return await run_in_threadpool(game.submit_player_decision, player_id, decision)
+
+
+async def _run_game(game: GameController):
+    """
+    Run a game's simulation without blocking the event loop.
+    
+    Args:
+        game: Game to start
+    """
+    try:
+        async with _game_locks.setdefault(game.game_id, asyncio.Lock()):
+            await run_in_threadpool(game.start_game)
+    except Exception:
+        logger.exception("Error running game %s", game.game_id)
+
+
+async def get_game_or_404(game_id: str) -> GameController:
+    """
+    Resolve a game from its path ID.
+    
+    Args:
+        game_id: Game ID
+        
+    Returns:
+        The game
+        
+    Raises:
+        HTTPException: If no game has the ID
+    """
+    game = games.get(game_id)
+    if game is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return game
+
 
 # Create API router
 router = APIRouter(prefix="/api", tags=["game"])
@@ -83,11 +184,25 @@ async def list_scenarios(
 ):
     """List available scenarios."""
     difficulty_filter = DifficultyLevel(difficulty) if difficulty else None
+    
+    # Responses filtered only by difficulty are served from cache
+    cacheable = not tags
+    if cacheable:
+        key = difficulty_filter.value if difficulty_filter else None
+        payload = _scenario_payloads.get(key)
+        if payload is not None:
+            return Response(payload, media_type="application/json")
+    
     scenarios = scenario_manager.list_scenarios(
         difficulty=difficulty_filter,
         tags=tags
     )
-    return {"scenarios": scenarios, "count": len(scenarios)}
+    content = {"scenarios": scenarios, "count": len(scenarios)}
+    if not cacheable:
+        return content
+    
+    payload = _scenario_payloads[key] = _json_bytes(content)
+    return Response(payload, media_type="application/json")
 
 
 @router.get("/scenarios/{scenario_id}")
@@ -128,6 +243,7 @@ async def create_scenario(request: ScenarioCreateRequest):
         request.description,
         config
     )
+    _scenario_payloads.clear()
     
     return {"scenario_id": scenario_id, "message": "Scenario created successfully"}
 
@@ -185,12 +301,8 @@ async def list_games():
 
 
 @router.get("/games/{game_id}")
-async def get_game(game_id: str):
+async def get_game(game_id: str, game: GameController = Depends(get_game_or_404)):
     """Get game details."""
-    if game_id not in games:
-        raise HTTPException(status_code=404, detail="Game not found")
-    
-    game = games[game_id]
     return {
         "game_id": game_id,
         "status": game.state.status.value,
@@ -215,13 +327,11 @@ async def get_game(game_id: str):
 
 
 @router.post("/games/{game_id}/players")
-async def add_player(game_id: str, request: PlayerRequest):
+async def add_player(
+    request: PlayerRequest,
+    game: GameController = Depends(get_game_or_404)
+):
     """Add a player to the game."""
-    if game_id not in games:
-        raise HTTPException(status_code=404, detail="Game not found")
-    
-    game = games[game_id]
-    
     if game.state.status != GameStatus.SETUP:
         raise HTTPException(status_code=400, detail="Can only add players during setup")
     
@@ -247,13 +357,8 @@ async def add_player(game_id: str, request: PlayerRequest):
 
 
 @router.post("/games/{game_id}/start")
-async def start_game(game_id: str, background_tasks: BackgroundTasks):
+async def start_game(game_id: str, game: GameController = Depends(get_game_or_404)):
     """Start the game."""
-    if game_id not in games:
-        raise HTTPException(status_code=404, detail="Game not found")
-    
-    game = games[game_id]
-    
     if game.state.status != GameStatus.SETUP:
         if game.state.status == GameStatus.READY:
             # Initialize if needed
@@ -263,8 +368,10 @@ async def start_game(game_id: str, background_tasks: BackgroundTasks):
     else:
         game.initialize_game()
     
-    # Start game in background
-    background_tasks.add_task(game.start_game)
+    # Start game in a task tracked until it finishes
+    task = asyncio.create_task(_run_game(game))
+    game_tasks[game_id] = task
+    task.add_done_callback(lambda _: game_tasks.pop(game_id, None))
     
     return {
         "game_id": game_id,
@@ -274,12 +381,8 @@ async def start_game(game_id: str, background_tasks: BackgroundTasks):
 
 
 @router.post("/games/{game_id}/stop")
-async def stop_game(game_id: str):
+async def stop_game(game_id: str, game: GameController = Depends(get_game_or_404)):
     """Stop the game."""
-    if game_id not in games:
-        raise HTTPException(status_code=404, detail="Game not found")
-    
-    game = games[game_id]
     game.end_game("stopped")
     
     return {
@@ -290,12 +393,8 @@ async def stop_game(game_id: str):
 
 
 @router.post("/games/{game_id}/pause")
-async def pause_game(game_id: str):
+async def pause_game(game_id: str, game: GameController = Depends(get_game_or_404)):
     """Pause the game."""
-    if game_id not in games:
-        raise HTTPException(status_code=404, detail="Game not found")
-    
-    game = games[game_id]
     game.pause_game()
     
     return {
@@ -306,12 +405,8 @@ async def pause_game(game_id: str):
 
 
 @router.post("/games/{game_id}/resume")
-async def resume_game(game_id: str):
+async def resume_game(game_id: str, game: GameController = Depends(get_game_or_404)):
     """Resume the game."""
-    if game_id not in games:
-        raise HTTPException(status_code=404, detail="Game not found")
-    
-    game = games[game_id]
     game.resume_game()
     
     return {
@@ -322,18 +417,17 @@ async def resume_game(game_id: str):
 
 
 @router.post("/games/{game_id}/decisions")
-async def submit_decision(game_id: str, request: DecisionRequest):
+async def submit_decision(
+    request: DecisionRequest,
+    game: GameController = Depends(get_game_or_404)
+):
     """Submit a player decision."""
-    if game_id not in games:
-        raise HTTPException(status_code=404, detail="Game not found")
-    
-    game = games[game_id]
-    
     if game.state.status != GameStatus.IN_PROGRESS:
         raise HTTPException(status_code=400, detail="Game is not in progress")
     
     # Submit decision
-    success = game.submit_player_decision(
+    success = await _submit_player_decision(
+        game,
         request.player_id,
         {"order_quantity": request.order_quantity}
     )
@@ -349,25 +443,17 @@ async def submit_decision(game_id: str, request: DecisionRequest):
 
 
 @router.get("/games/{game_id}/state")
-async def get_game_state(game_id: str):
+async def get_game_state(game: GameController = Depends(get_game_or_404)):
     """Get current game state."""
-    if game_id not in games:
-        raise HTTPException(status_code=404, detail="Game not found")
-    
-    game = games[game_id]
     state = game.get_current_state()
     
-    return state
+    # The state holds only JSON types, so it skips FastAPI's encoder pass
+    return JSONResponse(state)
 
 
 @router.get("/games/{game_id}/results")
-async def get_results(game_id: str):
+async def get_results(game: GameController = Depends(get_game_or_404)):
     """Get game results."""
-    if game_id not in games:
-        raise HTTPException(status_code=404, detail="Game not found")
-    
-    game = games[game_id]
-    
     if game.state.status not in [GameStatus.COMPLETED, GameStatus.ABANDONED]:
         return {
             "status": "in_progress",
@@ -376,63 +462,46 @@ async def get_results(game_id: str):
     
     return {
         "status": "complete",
-        "results": game.export_game_data()
+        "results": await run_in_threadpool(game.export_game_data)
     }
 
 
 @router.get("/games/{game_id}/leaderboard")
-async def get_leaderboard(game_id: str):
+async def get_leaderboard(game_id: str, game: GameController = Depends(get_game_or_404)):
     """Get game leaderboard."""
-    if game_id not in games:
-        raise HTTPException(status_code=404, detail="Game not found")
-    
-    game = games[game_id]
     leaderboard = game.get_leaderboard()
     
-    return {
+    return JSONResponse({
         "game_id": game_id,
         "week": game.state.current_week,
         "leaderboard": leaderboard
-    }
+    })
 
 
 @router.get("/games/{game_id}/player/{player_id}")
-async def get_player_view(game_id: str, player_id: str):
+async def get_player_view(
+    player_id: str,
+    game: GameController = Depends(get_game_or_404)
+):
     """Get player-specific view of the game."""
-    if game_id not in games:
-        raise HTTPException(status_code=404, detail="Game not found")
-    
-    game = games[game_id]
     view = game.get_player_view(player_id)
     
     if not view:
         raise HTTPException(status_code=404, detail="Player not found")
     
-    return view
+    return JSONResponse(view)
 
 
 @router.get("/policies")
 async def list_policies():
     """List available ordering policies."""
-    policies = []
-    for policy_type in PolicyType:
-        info = policy_manager.get_policy_info(policy_type)
-        policies.append({
-            "type": policy_type.value,
-            "name": info["name"],
-            "description": info["description"],
-            "parameters": info["parameters"]
-        })
-    
-    return {"policies": policies}
+    return Response(_policies_payload, media_type="application/json")
 
 
 @router.delete("/games/{game_id}")
-async def delete_game(game_id: str):
+async def delete_game(game_id: str, game: GameController = Depends(get_game_or_404)):
     """Delete a game."""
-    if game_id not in games:
-        raise HTTPException(status_code=404, detail="Game not found")
-    
     del games[game_id]
+    _game_locks.pop(game_id, None)
     
     return {"message": "Game deleted successfully"}
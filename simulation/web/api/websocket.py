@@ -1,12 +1,43 @@
 """WebSocket handlers for real-time game updates."""
 
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Dict, List, Set, Any, Optional
+from typing import Dict, List, Set, Any, Optional, Tuple
 import json
 import asyncio
+import logging
+import time
 from datetime import datetime
 
 
+logger = logging.getLogger(__name__)
+
+
+# Connections accepted per game; further upgrades are refused
+MAX_CONNECTIONS_PER_GAME = 200
+
+# Messages of each type a connection may send per second
+MESSAGE_RATE_LIMITS: Dict[str, int] = {
+    "chat": 5,
+    "decision": 1
+}
+
+# Seconds over which batched game updates are collected before one
+# broadcast
+UPDATE_BATCH_WINDOW = 0.05
+
+# Last formatted timestamp and the millisecond it was formatted in
+_cached_timestamp = ["", -1]
+
+
+def _timestamp() -> str:
+    """Return the current time in ISO format, formatted at most once per millisecond."""
+    ms = time.monotonic_ns() // 1_000_000
+    if ms != _cached_timestamp[1]:
+        _cached_timestamp[0] = datetime.now().isoformat()
+        _cached_timestamp[1] = ms
+    return _cached_timestamp[0]
+
+
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates."""
     
@@ -20,13 +51,18 @@ class ConnectionManager:
         
         # Connection metadata
         self.connection_info: Dict[WebSocket, Dict[str, Any]] = {}
+        
+        # Batched game updates: (game_id, update_type) -> pending data,
+        # and the task that will broadcast them
+        self._pending_updates: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._flush_tasks: Dict[Tuple[str, str], asyncio.Task] = {}
     
     async def connect(
         self,
         websocket: WebSocket,
         game_id: str,
         player_id: Optional[str] = None
-    ):
+    ) -> bool:
         """
         Accept and register a new WebSocket connection.
         
@@ -34,7 +70,15 @@ class ConnectionManager:
             websocket: WebSocket connection
             game_id: Game ID
             player_id: Optional player ID
+            
+        Returns:
+            Whether the connection was accepted
         """
+        if self.get_connection_count(game_id) >= MAX_CONNECTIONS_PER_GAME:
+            # Try again later
+            await websocket.close(code=1013)
+            return False
+        
         await websocket.accept()
         
         # Add to game connections
@@ -50,7 +94,10 @@ class ConnectionManager:
         self.connection_info[websocket] = {
             "game_id": game_id,
             "player_id": player_id,
-            "connected_at": datetime.now().isoformat()
+            "connected_at": _timestamp(),
+            # Start time and count of the current one-second window,
+            # by rate-limited message type
+            "rate_windows": {}
         }
         
         # Send welcome message
@@ -64,6 +111,7 @@ class ConnectionManager:
             },
             websocket
         )
+        return True
     
     def disconnect(self, websocket: WebSocket):
         """
@@ -103,7 +151,7 @@ class ConnectionManager:
         try:
             await websocket.send_json(message)
         except Exception as e:
-            print(f"Error sending message: {e}")
+            logger.warning("Error sending message: %s", e)
     
     async def broadcast_to_game(self, game_id: str, message: Dict[str, Any]):
         """
@@ -113,22 +161,41 @@ class ConnectionManager:
             game_id: Game ID
             message: Message to broadcast
         """
-        if game_id in self.active_connections:
+        connections = self.active_connections.get(game_id)
+        if connections:
             # Add timestamp to message
-            message["timestamp"] = datetime.now().isoformat()
+            message["timestamp"] = _timestamp()
             
-            # Send to all connections in the game
-            disconnected = []
-            for connection in self.active_connections[game_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception as e:
-                    print(f"Error broadcasting: {e}")
-                    disconnected.append(connection)
+            # Serialize once for every connection, the way send_json would
+            try:
+                text = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+            except (TypeError, ValueError) as e:
+                logger.warning("Error broadcasting to game %s: %s", game_id, e)
+                return
             
-            # Clean up disconnected connections
-            for conn in disconnected:
-                self.disconnect(conn)
+            # Send to a snapshot of the game's connections, concurrently,
+            # so connections can come and go while sends are awaited and a
+            # slow client does not hold up the others
+            connections = tuple(connections)
+            results = await asyncio.gather(
+                *(connection.send_text(text) for connection in connections),
+                return_exceptions=True
+            )
+            
+            # Clean up disconnected connections, logging once per broadcast
+            # however many failed
+            failures = [
+                (connection, result)
+                for connection, result in zip(connections, results)
+                if isinstance(result, Exception)
+            ]
+            if failures:
+                logger.warning(
+                    "Error broadcasting to game %s: %d of %d connections failed, first error: %s",
+                    game_id, len(failures), len(connections), failures[0][1]
+                )
+                for connection, _ in failures:
+                    self.disconnect(connection)
     
     async def send_to_player(self, player_id: str, message: Dict[str, Any]):
         """
@@ -158,6 +225,35 @@ class ConnectionManager:
         }
         await self.broadcast_to_game(game_id, message)
     
+    def schedule_game_update(self, game_id: str, update_type: str, data: Dict[str, Any]):
+        """
+        Queue a game update to be broadcast with others of its type.
+        
+        Updates of the same type arriving within UPDATE_BATCH_WINDOW are
+        sent as one game_update message whose "batch" lists their data.
+        
+        Args:
+            game_id: Game ID
+            update_type: Type of update
+            data: Update data
+        """
+        key = (game_id, update_type)
+        self._pending_updates.setdefault(key, []).append(data)
+        if key not in self._flush_tasks:
+            self._flush_tasks[key] = asyncio.create_task(self._flush_game_updates(key))
+    
+    async def _flush_game_updates(self, key: Tuple[str, str]):
+        """Broadcast the updates queued under a key once the window ends."""
+        await asyncio.sleep(UPDATE_BATCH_WINDOW)
+        del self._flush_tasks[key]
+        batch = self._pending_updates.pop(key, [])
+        game_id, update_type = key
+        await self.broadcast_to_game(game_id, {
+            "type": "game_update",
+            "update_type": update_type,
+            "batch": batch
+        })
+    
     async def broadcast_week_complete(
         self,
         game_id: str,
@@ -247,6 +343,32 @@ class ConnectionManager:
         }
         await self.broadcast_to_game(game_id, message)
     
+    def allow_message(self, websocket: WebSocket, message_type: str) -> bool:
+        """
+        Count a message against its connection's rate limit.
+        
+        Args:
+            websocket: Connection the message came from
+            message_type: Type of the message
+            
+        Returns:
+            Whether the message is within the limit for its type
+        """
+        limit = MESSAGE_RATE_LIMITS.get(message_type)
+        info = self.connection_info.get(websocket)
+        if limit is None or info is None:
+            return True
+        
+        now = time.monotonic()
+        windows = info["rate_windows"]
+        window = windows.get(message_type)
+        if window is None or now - window[0] >= 1.0:
+            windows[message_type] = [now, 1]
+            return True
+        
+        window[1] += 1
+        return window[1] <= limit
+    
     def get_connection_count(self, game_id: str) -> int:
         """
         Get number of active connections for a game.
@@ -280,7 +402,8 @@ async def websocket_endpoint(
         player_id: Optional player ID
     """
     # Connect
-    await manager.connect(websocket, game_id, player_id)
+    if not await manager.connect(websocket, game_id, player_id):
+        return
     
     try:
         # Notify others of new connection
@@ -298,7 +421,14 @@ async def websocket_endpoint(
             # Handle different message types
             message_type = data.get("type")
             
-            if message_type == "ping":
+            if not manager.allow_message(websocket, message_type):
+                # Drop messages over the limit rather than fanning them out
+                await websocket.send_json({
+                    "type": "error",
+                    "message": "rate_limited"
+                })
+            
+            elif message_type == "ping":
                 # Respond to ping
                 await websocket.send_json({"type": "pong"})
             
@@ -331,6 +461,11 @@ async def websocket_endpoint(
             "player_disconnected",
             {"player_id": player_id, "count": manager.get_connection_count(game_id)}
         )
+    
+    finally:
+        # Connections that end with an error, such as a malformed message,
+        # are removed too, so their entries do not linger
+        manager.disconnect(websocket)
 
 
 async def handle_player_decision(
@@ -346,14 +481,15 @@ async def handle_player_decision(
         player_id: Player ID
         data: Decision data
     """
-    from .endpoints import games
+    from .endpoints import games, _submit_player_decision
     
     if game_id in games:
         game = games[game_id]
         
         # Submit decision
         order_quantity = data.get("order_quantity", 0)
-        success = game.submit_player_decision(
+        success = await _submit_player_decision(
+            game,
             player_id,
             {"order_quantity": order_quantity}
         )
@@ -366,8 +502,9 @@ async def handle_player_decision(
                 order_quantity
             )
             
-            # Broadcast update
-            await manager.broadcast_game_update(
+            # Broadcast update, together with other decisions submitted
+            # at about the same time
+            manager.schedule_game_update(
                 game_id,
                 "decision_submitted",
                 {
@@ -393,10 +530,10 @@ async def handle_chat_message(
     message = {
         "type": "chat",
         "player_id": player_id,
-        "message": data.get("message", ""),
-        "timestamp": datetime.now().isoformat()
+        "message": data.get("message", "")
     }
     
+    # broadcast_to_game stamps the message
     await manager.broadcast_to_game(game_id, message)
 
 
@@ -433,53 +570,66 @@ class EventBus:
         
         Args:
             event_type: Type of event to listen for
-            callback: Callback function
+            callback: Callback function, registered at most once per event type
         """
-        if event_type not in self.listeners:
-            self.listeners[event_type] = []
-        self.listeners[event_type].append(callback)
+        listeners = self.listeners.setdefault(event_type, [])
+        # Registering again is a no-op, so repeated setup does not grow
+        # the listener list
+        if callback not in listeners:
+            listeners.append(callback)
     
     async def emit(self, event_type: str, data: Any):
         """
         Emit an event.
         
+        Plain listeners are called in registration order, then coroutine
+        listeners are awaited together. A failing coroutine listener is
+        logged and does not affect the others.
+        
         Args:
             event_type: Type of event
             data: Event data
         """
         if event_type in self.listeners:
+            # Coroutine listeners run concurrently, after the plain ones
+            pending = []
             for callback in self.listeners[event_type]:
                 if asyncio.iscoroutinefunction(callback):
-                    await callback(data)
+                    pending.append(callback(data))
                 else:
                     callback(data)
+            if pending:
+                results = await asyncio.gather(*pending, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.warning("Error handling %s event: %s", event_type, result)
 
 
 # Global event bus
 event_bus = EventBus()
 
 
-# Register event handlers
-def setup_event_handlers():
-    """Set up event handlers for game events."""
-    
-    async def on_week_complete(data):
-        """Handle week complete event."""
-        game_id = data.get("game_id")
-        week = data.get("week")
-        metrics = data.get("metrics")
-        node_states = data.get("node_states")
-        
-        await manager.broadcast_week_complete(game_id, week, metrics, node_states)
+async def _on_week_complete(data):
+    """Handle week complete event."""
+    game_id = data.get("game_id")
+    week = data.get("week")
+    metrics = data.get("metrics")
+    node_states = data.get("node_states")
     
-    async def on_game_ended(data):
-        """Handle game ended event."""
-        game_id = data.get("game_id")
-        reason = data.get("reason")
-        results = data.get("results")
-        
-        await manager.broadcast_game_ended(game_id, reason, results)
+    await manager.broadcast_week_complete(game_id, week, metrics, node_states)
+
+
+async def _on_game_ended(data):
+    """Handle game ended event."""
+    game_id = data.get("game_id")
+    reason = data.get("reason")
+    results = data.get("results")
     
-    # Register handlers
-    event_bus.on("week_complete", on_week_complete)
-    event_bus.on("game_ended", on_game_ended)
+    await manager.broadcast_game_ended(game_id, reason, results)
+
+
+# Register event handlers
+def setup_event_handlers():
+    """Set up event handlers for game events; safe to call more than once."""
+    event_bus.on("week_complete", _on_week_complete)
+    event_bus.on("game_ended", _on_game_ended)
@@ -6,8 +6,12 @@ from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from pathlib import Path
+import asyncio
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
-from .api.endpoints import router as api_router
+from .api.endpoints import router as api_router, game_tasks
 from .api.websocket import websocket_endpoint, manager, setup_event_handlers
 
 
@@ -32,6 +36,15 @@ def create_app() -> FastAPI:
     # Get base directory
     base_dir = Path(__file__).resolve().parent
     
+    # Web log records are queued and written by a listener thread, so
+    # logging never blocks the event loop
+    web_logger = logging.getLogger("simulation.web")
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    log_handler = QueueHandler(log_queue)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    log_listener = QueueListener(log_queue, stream_handler)
+    
     # Mount static files
     app.mount("/static", StaticFiles(directory=str(base_dir / "static")), name="static")
     
@@ -65,6 +78,9 @@ def create_app() -> FastAPI:
     @app.on_event("startup")
     async def startup_event():
         """Initialize application on startup."""
+        web_logger.addHandler(log_handler)
+        web_logger.propagate = False
+        log_listener.start()
         setup_event_handlers()
         print("Beer Distribution Game server started")
         print("Open http://localhost:8000 in your browser")
@@ -73,7 +89,13 @@ def create_app() -> FastAPI:
     @app.on_event("shutdown")
     async def shutdown_event():
         """Clean up on shutdown."""
+        # Let games that are still running finish their simulation
+        if game_tasks:
+            await asyncio.gather(*game_tasks.values(), return_exceptions=True)
         print("Beer Distribution Game server shutting down")
+        log_listener.stop()
+        web_logger.removeHandler(log_handler)
+        web_logger.propagate = True
     
     return app
 
@@ -0,0 +1,60 @@
+"""Tests that the array kernel only runs simulations it computes exactly."""
+
+import numpy as np
+
+from simulation.engine.core import SimulationConfig, SimulationEnvironment
+
+
+def _histories(sim):
+    """Node histories as plain lists, by node name."""
+    return {
+        node.name: {key: np.asarray(values).tolist() for key, values in node.history.items()}
+        for node in sim.nodes
+    }
+
+
+def _run_both(override):
+    """Run a simulation with an override by the default path and stepped."""
+    config = SimulationConfig(weeks=20, demand_type="step", seed=1)
+    
+    default = SimulationEnvironment(config)
+    override(default)
+    default.run()
+    
+    # A week callback always keeps the nodes stepped week by week
+    stepped = SimulationEnvironment(config)
+    override(stepped)
+    stepped.on_week_complete = lambda state: None
+    stepped.run()
+    
+    return default, stepped
+
+
+def test_kernel_runs_unchanged_nodes():
+    sim = SimulationEnvironment(SimulationConfig(weeks=20))
+    assert sim._kernel_inputs(20) is not None
+
+
+def test_overrides_match_stepped_path():
+    overrides = [
+        lambda sim: setattr(sim.retailer, "demand_pattern", lambda week: 9),
+        # What Retailer makes of an array demand pattern
+        lambda sim: setattr(sim.retailer, "demand_pattern", np.full(20, 7).tolist().__getitem__),
+        lambda sim: setattr(sim.wholesaler, "inventory", 40),
+        lambda sim: setattr(sim.distributor, "backlog", 3),
+        lambda sim: setattr(sim.factory, "production_capacity", 2),
+        lambda sim: setattr(sim.factory, "production_delay", 3),
+        lambda sim: setattr(sim.retailer, "holding_cost_per_unit", 3.0),
+        lambda sim: setattr(sim.distributor, "backlog_cost_per_unit", 2.5),
+        lambda sim: setattr(sim.wholesaler, "order_delay", 1),
+        lambda sim: setattr(sim.distributor, "shipment_delay", 3),
+    ]
+    for override in overrides:
+        default, stepped = _run_both(override)
+        assert default._kernel_inputs(20) is None
+        assert _histories(default) == _histories(stepped)
+
+
+def test_demand_override_is_used():
+    default, _ = _run_both(lambda sim: setattr(sim.retailer, "demand_pattern", lambda week: 9))
+    assert default.retailer.customer_demands == [9] * 20
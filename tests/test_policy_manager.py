@@ -0,0 +1,24 @@
+"""Tests that created policies follow later changes to their inputs."""
+
+from simulation.game.policy_manager import PolicyManager, PolicyParameters, PolicyType
+
+
+def test_policy_reads_live_context():
+    pm = PolicyManager()
+    context = {"inventory": 0}
+    policy = pm.create_policy(PolicyType.BASE_STOCK, node_context=context)
+    assert policy(0) == 20
+    
+    context["inventory"] = 15
+    assert policy(0) == 5
+    assert list(policy.order_schedule(3)) == [5, 5, 5]
+
+
+def test_policy_reads_current_params():
+    pm = PolicyManager()
+    base_stock = pm.create_policy(PolicyType.BASE_STOCK, node_context={})
+    ss = pm.create_policy(PolicyType.SS_POLICY, node_context={"inventory": 10})
+    
+    pm.params = PolicyParameters(base_stock_level=30, reorder_point=12, order_up_to_level=40)
+    assert base_stock(0) == 30
+    assert ss(0) == 30
@@ -0,0 +1,34 @@
+"""Tests that the streaming JSON writer matches json.dumps."""
+
+import io
+import json
+
+from simulation.game.controller import _write_json
+
+
+def _written(value, indent=None):
+    """Text the writer produces for a value."""
+    f = io.StringIO()
+    _write_json(f, value, indent)
+    return f.getvalue()
+
+
+def test_round_trip():
+    values = [
+        {1: "a"},
+        {None: 1, True: 2, False: 3, 1.5: 4, "x": {2: [1, {3: None}]}},
+        {"decision": {"order_quantity": 4, 7: "note"}},
+        [],
+        {},
+    ]
+    for value in values:
+        for indent in (None, 2):
+            text = _written(value, indent)
+            assert json.loads(text) == json.loads(json.dumps(value))
+            assert text == json.dumps(value, indent=indent)
+
+
+def test_iterator_round_trip():
+    records = [{"week": 1, 2: "b"}, {"week": 2}]
+    text = _written(iter(records), 2)
+    assert json.loads(text) == json.loads(json.dumps(records))